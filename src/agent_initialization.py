@@ -10,6 +10,12 @@ from datetime import datetime
 from typing import Dict, List, Optional
 from enum import Enum
 
+from aws_endpoints import endpoint_url
+from bedrock_resilience import BEDROCK_RESILIENCE, error_code
+from bedrock_metrics import BEDROCK_METRICS, estimate_tokens
+from evaluation_rubric import EVALUATION_RUBRIC
+
+
 class AgentStatus(Enum):
     DRAFT = "DRAFT"
     PREPARED = "PREPARED"
@@ -21,7 +27,9 @@ class InterviewTrendAgent:
     def __init__(self, region: str = 'us-east-1'):
         self.region = region
         self.bedrock_client = boto3.client('bedrock-agent', region_name=region)
-        self.bedrock_runtime = boto3.client('bedrock-agent-runtime', region_name=region)
+        self.bedrock_runtime = boto3.client(
+            'bedrock-agent-runtime', region_name=region, endpoint_url=endpoint_url('bedrock-agent-runtime')
+        )
         self.bedrock = boto3.client('bedrock', region_name=region)
         self.s3_client = boto3.client('s3', region_name=region)
         
@@ -88,14 +96,14 @@ Always format your responses as JSON with:
     
     def _get_evaluator_prompt(self) -> str:
         """Get system prompt for evaluator agent"""
-        return """You are an expert technical evaluator with 20+ years of hiring experience.
+        criteria = "\n".join(
+            f"- {label}: {description} (weight: {weight}%)" for _, label, description, weight in EVALUATION_RUBRIC
+        )
+        breakdown = ",\n".join(f'    "{key}": 0-{weight}' for key, _, _, weight in EVALUATION_RUBRIC)
+        return f"""You are an expert technical evaluator with 20+ years of hiring experience.
 
 Evaluation Criteria Based on 2026 Standards:
-- Technical Knowledge: Fundamentals + relevant trends (weight: 40%)
-- Problem Solving: Approach, clear thinking, handling ambiguity (weight: 25%)
-- System Design: Architecture, scalability, trade-offs (weight: 20%)
-- Communication: Clear explanation, listens to feedback (weight: 10%)
-- Awareness: AI/ML impact, security, cost awareness (weight: 5%)
+{criteria}
 
 Scoring Scale:
 - 90-100: Exceptional (hire immediately, senior level)
@@ -106,20 +114,16 @@ Scoring Scale:
 - <50: Very weak (definite no)
 
 Evaluation Format:
-{
+{{
   "score": 0-100,
-  "scoreBreakdown": {
-    "technicalKnowledge": 0-40,
-    "problemSolving": 0-25,
-    "systemDesign": 0-20,
-    "communication": 0-10,
-    "awareness": 0-5
-  },
+  "scoreBreakdown": {{
+{breakdown}
+  }},
   "strengths": ["strength1", "strength2", "strength3"],
   "areasForImprovement": ["area1", "area2"],
   "recommendation": "hire|maybe|consider_for_junior|no_hire",
   "feedback": "Detailed feedback for candidate"
-}
+}}
 """
     
     def _get_coach_prompt(self) -> str:
@@ -368,22 +372,39 @@ Coaching Response Format:
             return None
     
     def invoke_agent(self, agent_id: str, alias_id: str, session_id: str, user_input: str) -> Dict:
-        """Invoke agent with user input"""
+        """Invoke agent with user input (retried with backoff on throttling)"""
+        started = time.monotonic()
         try:
-            response = self.bedrock_runtime.invoke_agent(
-                agentId=agent_id,
-                agentAliasId=alias_id,
-                sessionId=session_id,
-                inputText=user_input
+            response, _ = BEDROCK_RESILIENCE.call(
+                f"agent:{agent_id}",
+                lambda: self.bedrock_runtime.invoke_agent(
+                    agentId=agent_id,
+                    agentAliasId=alias_id,
+                    sessionId=session_id,
+                    inputText=user_input
+                )
+            )
+            output = response.get('output', '')
+            BEDROCK_METRICS.record(
+                agent_id, 'trend_agent', (time.monotonic() - started) * 1000,
+                input_tokens=estimate_tokens(user_input),
+                output_tokens=estimate_tokens(output if isinstance(output, str) else json.dumps(output)),
+                interview_id=session_id,
+                estimated_tokens=True
             )
             
             return {
                 'sessionId': session_id,
-                'response': response.get('output', ''),
+                'response': output,
                 'invokedAt': datetime.now().isoformat()
             }
         
         except Exception as e:
+            BEDROCK_METRICS.record(
+                agent_id, 'trend_agent', (time.monotonic() - started) * 1000,
+                interview_id=session_id,
+                status=error_code(e) or type(e).__name__
+            )
             print(f"❌ Error invoking agent: {e}")
             return None
     
@@ -246,8 +246,39 @@ def get_response_schemas():
                 "problem_solving_score": {"type": "number"},
                 "feedback": {"type": "string"},
                 "strengths": {"type": "array", "items": {"type": "string"}},
-                "improvements": {"type": "array", "items": {"type": "string"}}
-            }
+                "improvements": {"type": "array", "items": {"type": "string"}},
+                # Evaluator Agent output (sophia_evaluator_prompt.md JSON OUTPUT FORMAT)
+                "scores": {
+                    "type": "object",
+                    "properties": {
+                        "technical_knowledge": {"type": "number", "minimum": 0, "maximum": 10},
+                        "communication_clarity": {"type": "number", "minimum": 0, "maximum": 10},
+                        "confidence_level": {"type": "number", "minimum": 0, "maximum": 10},
+                        "problem_solving": {"type": "number", "minimum": 0, "maximum": 10}
+                    },
+                    "required": ["technical_knowledge", "communication_clarity", "confidence_level", "problem_solving"]
+                },
+                "overall_score": {"type": "number", "minimum": 0, "maximum": 10},
+                "weaknesses": {"type": "array", "items": {"type": "string"}},
+                "improvement_areas": {"type": "array", "items": {"type": "string"}},
+                "technical_depth": {
+                    "type": "object",
+                    "properties": {
+                        "topics_strong": {"type": "array", "items": {"type": "string"}},
+                        "topics_weak": {"type": "array", "items": {"type": "string"}}
+                    }
+                },
+                "communication_feedback": {"type": "object"},
+                "readiness_level": {
+                    "type": "string",
+                    "enum": ["Ready", "Almost Ready", "Needs Improvement", "Not Ready Yet"]
+                },
+                "overall_assessment": {"type": "string"}
+            },
+            "required": [
+                "scores", "overall_score", "readiness_level", "strengths", "weaknesses",
+                "improvement_areas", "overall_assessment"
+            ]
         },
         
         "CoachingFeedback": {
@@ -3,17 +3,26 @@ AWS Cognito Authentication Handlers for Sophia AI Interview Coach
 Handles user signup, login, profile management, and authentication
 """
 
+import os
+import sys
 import json
-import boto3
 import hashlib
 import secrets
 from typing import Dict, Any, Tuple, Optional
 from datetime import datetime, timedelta
 from botocore.exceptions import ClientError
 
-# AWS Clients
-cognito_client = boto3.client('cognito-idp', region_name='us-east-1')
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
+# Lambda loads this handler as src.auth_handlers; the shared modules sit next to it
+_SRC_DIR = os.path.dirname(os.path.abspath(__file__))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
+
+from storage_codec import STORAGE_CODEC
+from aws_clients import AWS_CLIENTS, lazy_client, lazy_resource
+
+# AWS Clients (built on first use)
+cognito_client = lazy_client('cognito-idp')
+dynamodb = lazy_resource('dynamodb')
 
 # Environment Variables
 COGNITO_USER_POOL_ID = 'us-east-1_S8nbIWo7v'  # Replace with actual pool ID
@@ -22,6 +31,9 @@ USERS_TABLE = 'sophia_users'
 USER_PROFILES_TABLE = 'sophia_user_profiles'
 INTERVIEW_HISTORY_TABLE = 'sophia_interview_history'
 
+# History attributes stored through STORAGE_CODEC (decoded only in the detail view)
+HISTORY_PAYLOADS = ('feedback', 'transcript')
+
 
 class AuthenticationHandler:
     """Handle user authentication with AWS Cognito"""
@@ -341,7 +353,7 @@ class ProfileManager:
     def create_profile(user_id: str, email: str, full_name: str) -> bool:
         """Create new user profile"""
         try:
-            table = dynamodb.Table(USER_PROFILES_TABLE)
+            table = AWS_CLIENTS.table(USER_PROFILES_TABLE)
             table.put_item(
                 Item={
                     'user_id': user_id,
@@ -369,7 +381,7 @@ class ProfileManager:
     def get_profile(user_id: str) -> Optional[Dict[str, Any]]:
         """Get user profile"""
         try:
-            table = dynamodb.Table(USER_PROFILES_TABLE)
+            table = AWS_CLIENTS.table(USER_PROFILES_TABLE)
             response = table.get_item(Key={'user_id': user_id})
             return response.get('Item')
         except ClientError as e:
@@ -380,7 +392,7 @@ class ProfileManager:
     def update_profile(user_id: str, updates: Dict[str, Any]) -> bool:
         """Update user profile"""
         try:
-            table = dynamodb.Table(USER_PROFILES_TABLE)
+            table = AWS_CLIENTS.table(USER_PROFILES_TABLE)
             
             # Build update expression
             update_expr = "SET updated_at = :now"
@@ -441,7 +453,7 @@ class InterviewHistoryManager:
     ) -> bool:
         """Save interview to history"""
         try:
-            table = dynamodb.Table(INTERVIEW_HISTORY_TABLE)
+            table = AWS_CLIENTS.table(INTERVIEW_HISTORY_TABLE)
             table.put_item(
                 Item={
                     'user_id': user_id,
@@ -451,8 +463,8 @@ class InterviewHistoryManager:
                     'role': role,
                     'end_time': end_time,
                     'score': score,
-                    'feedback': feedback,
-                    'transcript': transcript or '',
+                    'feedback': STORAGE_CODEC.encode(feedback, f"{interview_id}/history_feedback"),
+                    'transcript': STORAGE_CODEC.encode(transcript or '', f"{interview_id}/history_transcript"),
                     'created_at': datetime.utcnow().isoformat()
                 }
             )
@@ -474,32 +486,41 @@ class InterviewHistoryManager:
             print(f"Error saving interview: {e}")
             return False
     
+    @staticmethod
+    def _history_items(user_id: str, limit: int = 50) -> list:
+        """History items as stored (payload attributes still encoded)"""
+        table = AWS_CLIENTS.table(INTERVIEW_HISTORY_TABLE)
+        response = table.query(
+            KeyConditionExpression='user_id = :uid',
+            ExpressionAttributeValues={':uid': user_id},
+            ScanIndexForward=False,  # Latest first
+            Limit=limit
+        )
+        return response.get('Items', [])
+    
     @staticmethod
     def get_user_history(user_id: str, limit: int = 50) -> list:
-        """Get user interview history"""
+        """Get user interview history (large feedback/transcripts are summarised, not decoded)"""
         try:
-            table = dynamodb.Table(INTERVIEW_HISTORY_TABLE)
-            response = table.query(
-                KeyConditionExpression='user_id = :uid',
-                ExpressionAttributeValues={':uid': user_id},
-                ScanIndexForward=False,  # Latest first
-                Limit=limit
-            )
-            return response.get('Items', [])
+            items = InterviewHistoryManager._history_items(user_id, limit)
+            for item in items:
+                for attribute in HISTORY_PAYLOADS:
+                    if attribute in item:
+                        item[attribute] = STORAGE_CODEC.summary(item[attribute])
+            return items
         except ClientError as e:
             print(f"Error getting history: {e}")
             return []
     
     @staticmethod
     def get_interview_details(user_id: str, interview_id: str) -> Optional[Dict[str, Any]]:
-        """Get details of a specific interview"""
+        """Get details of a specific interview, feedback and transcript decoded"""
         try:
-            table = dynamodb.Table(INTERVIEW_HISTORY_TABLE)
-            
-            # First get the interview from history
-            history = InterviewHistoryManager.get_user_history(user_id)
-            for interview in history:
+            for interview in InterviewHistoryManager._history_items(user_id):
                 if interview['interview_id'] == interview_id:
+                    for attribute in HISTORY_PAYLOADS:
+                        if attribute in interview:
+                            interview[attribute] = STORAGE_CODEC.decode(interview[attribute])
                     return interview
             
             return None
@@ -509,27 +530,30 @@ class InterviewHistoryManager:
     
     @staticmethod
     def delete_interview(user_id: str, interview_id: str) -> bool:
-        """Delete interview from history"""
+        """Delete interview from history, with any payloads offloaded to S3"""
         try:
-            table = dynamodb.Table(INTERVIEW_HISTORY_TABLE)
+            table = AWS_CLIENTS.table(INTERVIEW_HISTORY_TABLE)
             
             # Get the interview first to find start_time
-            history = InterviewHistoryManager.get_user_history(user_id)
-            start_time = None
-            for interview in history:
-                if interview['interview_id'] == interview_id:
-                    start_time = interview['start_time']
-                    break
-            
-            if not start_time:
+            interview = next(
+                (item for item in InterviewHistoryManager._history_items(user_id) if item['interview_id'] == interview_id),
+                None
+            )
+            if interview is None:
                 return False
             
             table.delete_item(
                 Key={
                     'user_id': user_id,
-                    'start_time': start_time
+                    'start_time': interview['start_time']
                 }
             )
+            
+            for attribute in HISTORY_PAYLOADS:
+                try:
+                    STORAGE_CODEC.delete(interview.get(attribute))
+                except ClientError as e:
+                    print(f"Error deleting offloaded {attribute}: {e}")
             return True
         except ClientError as e:
             print(f"Error deleting interview: {e}")
@@ -0,0 +1,145 @@
+"""
+Lazy AWS Client Factory
+Builds each boto3 client/resource on first use, once per container, with
+tuned connection pools, so a cold start only pays for the services the
+invoked action actually touches
+"""
+
+import os
+import time
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from aws_endpoints import endpoint_url
+
+DEFAULT_REGION = os.environ.get('AWS_REGION', 'us-east-1')
+
+# Shared by every client; Lambda handles one request at a time, but the
+# background executors (summaries, hedged calls) share the pool
+MAX_POOL_CONNECTIONS = int(os.environ.get('AWS_MAX_POOL_CONNECTIONS', 25))
+CONNECT_TIMEOUT = float(os.environ.get('AWS_CONNECT_TIMEOUT', 3))
+READ_TIMEOUT = float(os.environ.get('AWS_READ_TIMEOUT', 60))
+
+# Bedrock calls are retried by bedrock_resilience; botocore retrying them as
+# well would multiply attempts under throttling
+SELF_RETRIED_SERVICES = ('bedrock-runtime', 'bedrock-agent-runtime')
+
+
+def client_config(service: str):
+    """botocore Config for a service"""
+    from botocore.config import Config
+    return Config(
+        max_pool_connections=MAX_POOL_CONNECTIONS,
+        connect_timeout=CONNECT_TIMEOUT,
+        read_timeout=READ_TIMEOUT,
+        tcp_keepalive=True,
+        retries={
+            'mode': 'standard',
+            'max_attempts': 1 if service in SELF_RETRIED_SERVICES else 3
+        }
+    )
+
+
+class AWSClientFactory:
+    """Memoizes boto3 clients, resources and DynamoDB tables per (service, region)"""
+
+    def __init__(self, region: str = DEFAULT_REGION):
+        self.region = region
+        # Re-entrant: building a table builds the dynamodb resource first
+        self._lock = threading.RLock()
+        self._cache: Dict[Tuple[str, str, str], Any] = {}
+        self.constructed: List[Dict[str, Any]] = []
+
+    def _get(self, kind: str, name: str, region: Optional[str], build: Callable[[str], Any]) -> Any:
+        key = (kind, name, region or self.region)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        with self._lock:
+            if key not in self._cache:
+                started = time.perf_counter()
+                self._cache[key] = build(key[2])
+                self.constructed.append({
+                    'kind': kind,
+                    'name': name,
+                    'region': key[2],
+                    'ms': round((time.perf_counter() - started) * 1000, 2)
+                })
+            return self._cache[key]
+
+    def client(self, service: str, region: Optional[str] = None, endpoint: Optional[str] = None):
+        """
+        Shared boto3 client for a service
+
+        Args:
+            service: boto3 service name
+            region: AWS region (defaults to the factory region)
+            endpoint: Explicit endpoint URL, e.g. a WebSocket API's management
+                      endpoint (defaults to aws_endpoints.endpoint_url)
+        """
+        def build(r):
+            # boto3 itself is imported on first use; it dominates import time
+            import boto3
+            return boto3.client(
+                service, region_name=r, endpoint_url=endpoint or endpoint_url(service), config=client_config(service)
+            )
+        name = service if endpoint is None else f"{service}@{endpoint}"
+        return self._get('client', name, region, build)
+
+    def resource(self, service: str, region: Optional[str] = None):
+        """Shared boto3 resource for a service"""
+        def build(r):
+            import boto3
+            return boto3.resource(
+                service, region_name=r, endpoint_url=endpoint_url(service), config=client_config(service)
+            )
+        return self._get('resource', service, region, build)
+
+    def table(self, name: str, region: Optional[str] = None):
+        """Shared DynamoDB Table resource"""
+        return self._get('table', name, region, lambda r: self.resource('dynamodb', r).Table(name))
+
+    def reset(self):
+        """Drop every cached client (tests / endpoint changes)"""
+        with self._lock:
+            self._cache.clear()
+            self.constructed.clear()
+
+
+class LazyAWS:
+    """
+    Module-level stand-in for a client, resource or table
+
+    Attribute access builds the real object through the factory on first
+    use, so modules can keep their `bedrock_client = ...` globals (and tests
+    can keep patching `module.bedrock_client.invoke_model`) without paying
+    for construction at import time.
+    """
+
+    def __init__(self, resolve: Callable[[], Any], label: str):
+        object.__setattr__(self, '_resolve', resolve)
+        object.__setattr__(self, '_label', label)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+    def __repr__(self) -> str:
+        return f"<LazyAWS {self._label}>"
+
+
+AWS_CLIENTS = AWSClientFactory()
+
+
+def lazy_client(service: str, region: Optional[str] = None) -> LazyAWS:
+    """Deferred AWS_CLIENTS.client(service)"""
+    return LazyAWS(lambda: AWS_CLIENTS.client(service, region), f"client:{service}")
+
+
+def lazy_resource(service: str, region: Optional[str] = None) -> LazyAWS:
+    """Deferred AWS_CLIENTS.resource(service)"""
+    return LazyAWS(lambda: AWS_CLIENTS.resource(service, region), f"resource:{service}")
+
+
+def lazy_table(name: str, region: Optional[str] = None) -> LazyAWS:
+    """Deferred AWS_CLIENTS.table(name)"""
+    return LazyAWS(lambda: AWS_CLIENTS.table(name, region), f"table:{name}")
@@ -0,0 +1,33 @@
+"""
+AWS Endpoint Configuration
+Lets the runtime clients point at a local stand-in (see fake_bedrock.py)
+instead of AWS, so interview flows can be exercised offline
+"""
+
+import os
+from typing import Optional
+
+# One local server answering every stand-in service below
+LOCAL_ENDPOINT_ENV = 'LOCAL_AWS_ENDPOINT_URL'
+
+# Services fake_bedrock.py implements
+LOCAL_SERVICES = ('bedrock-runtime', 'bedrock-agent-runtime', 'polly')
+
+
+def endpoint_url(service: str) -> Optional[str]:
+    """
+    Endpoint override for a boto3 client, or None for the AWS default
+
+    Args:
+        service: boto3 service name, e.g. 'bedrock-runtime'
+
+    Returns:
+        $AWS_ENDPOINT_URL_<SERVICE> if set, else $LOCAL_AWS_ENDPOINT_URL for
+        services the local stand-in implements, else None
+    """
+    specific = os.environ.get(f"AWS_ENDPOINT_URL_{service.upper().replace('-', '_')}")
+    if specific:
+        return specific
+    if service in LOCAL_SERVICES:
+        return os.environ.get(LOCAL_ENDPOINT_ENV) or None
+    return None
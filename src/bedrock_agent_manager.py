@@ -3,14 +3,19 @@ AWS Bedrock Agentic AI Module
 Manages Bedrock Agents, Action Groups, and Fine-tuning
 """
 
-import boto3
 import json
+import time
 from typing import Dict, List, Any, Optional
 from enum import Enum
 
-bedrock_agent_client = boto3.client('bedrock-agent', region_name='us-east-1')
-bedrock_runtime_client = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
-bedrock_client = boto3.client('bedrock', region_name='us-east-1')
+from aws_clients import lazy_client
+from bedrock_resilience import BEDROCK_RESILIENCE, error_code
+from bedrock_metrics import BEDROCK_METRICS, estimate_tokens
+
+# AWS Services (built on first use)
+bedrock_agent_client = lazy_client('bedrock-agent')
+bedrock_runtime_client = lazy_client('bedrock-agent-runtime')
+bedrock_client = lazy_client('bedrock')
 
 
 class InterviewAgentType(Enum):
@@ -164,22 +169,38 @@ class BedrockAgentManager:
         Returns:
             Agent response
         """
-        try:
-            response = bedrock_runtime_client.invoke_agent(
-                agentId=agent_id,
-                agentAliasId=agent_alias_id,
-                sessionId=session_id,
-                inputText=user_input,
-                enableTrace=enable_trace
-            )
+        def run():
+            started = time.monotonic()
+            first_chunk = []
+            try:
+                response = bedrock_runtime_client.invoke_agent(
+                    agentId=agent_id,
+                    agentAliasId=agent_alias_id,
+                    sessionId=session_id,
+                    inputText=user_input,
+                    enableTrace=enable_trace
+                )
+                
+                # Parse response
+                response_text = ""
+                for event in response.get('completion', response.get('body', [])):
+                    if 'chunk' in event:
+                        chunk = event['chunk']
+                        if 'bytes' in chunk:
+                            if not first_chunk:
+                                first_chunk.append(time.monotonic())
+                            response_text += chunk['bytes'].decode('utf-8')
+            except Exception as e:
+                self._record_metrics(agent_id, session_id, started, first_chunk, user_input, '',
+                                     status=error_code(e) or type(e).__name__)
+                raise
             
-            # Parse response
-            response_text = ""
-            for event in response['body']:
-                if 'chunk' in event:
-                    chunk = event['chunk']
-                    if 'bytes' in chunk:
-                        response_text += chunk['bytes'].decode('utf-8')
+            self._record_metrics(agent_id, session_id, started, first_chunk, user_input, response_text)
+            return response_text
+        
+        try:
+            # Agent calls carry session state, so they are retried but never hedged
+            response_text, _ = BEDROCK_RESILIENCE.call(f"agent:{agent_id}", run)
             
             return {
                 'response': response_text,
@@ -191,6 +212,30 @@ class BedrockAgentManager:
             print(f"Error invoking agent: {str(e)}")
             raise
     
+    def _record_metrics(
+        self,
+        agent_id: str,
+        session_id: str,
+        started: float,
+        first_chunk: List[float],
+        user_input: str,
+        response_text: str,
+        status: str = 'ok'
+    ):
+        """Emit the BEDROCK_METRICS record for one agent call (agents report no usage)"""
+        agent_type = next((t for t, a in self.agent_ids.items() if a == agent_id), 'agent')
+        BEDROCK_METRICS.record(
+            agent_id,
+            agent_type,
+            (time.monotonic() - started) * 1000,
+            input_tokens=estimate_tokens(user_input),
+            output_tokens=estimate_tokens(response_text),
+            ttft_ms=(first_chunk[0] - started) * 1000 if first_chunk else None,
+            interview_id=session_id,
+            status=status,
+            estimated_tokens=True
+        )
+    
     def create_agent_alias(self, agent_id: str, alias_name: str, description: str = "") -> Dict[str, Any]:
         """
         Create an alias for agent version
@@ -249,7 +294,7 @@ class BedrockFineTuning:
     """Manages fine-tuning for Bedrock models"""
     
     def __init__(self):
-        self.bedrock_client = boto3.client('bedrock', region_name='us-east-1')
+        self.bedrock_client = bedrock_client
         
     def create_fine_tuning_job(
         self,
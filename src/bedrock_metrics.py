@@ -0,0 +1,202 @@
+"""
+Bedrock Invocation Metrics
+Per-call tokens, time-to-first-token, latency and cost for every model/agent call
+Emitted as structured log lines and optionally batched into agent_performance_metrics
+"""
+
+import os
+import json
+import uuid
+import threading
+from bisect import bisect_left
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+
+from aws_clients import AWS_CLIENTS
+
+# Set to agent_performance_metrics to persist rows; unset keeps metrics log-only
+METRICS_TABLE = os.environ.get('BEDROCK_METRICS_TABLE')
+METRICS_BATCH_SIZE = int(os.environ.get('BEDROCK_METRICS_BATCH_SIZE', 25))
+
+# On-demand USD per 1K tokens (input, output)
+MODEL_PRICING = {
+    'anthropic.claude-3-haiku-20240307-v1:0': (0.00025, 0.00125),
+    'anthropic.claude-3-sonnet-20240229-v1:0': (0.003, 0.015),
+    'anthropic.claude-3-5-sonnet-20240620-v1:0': (0.003, 0.015),
+    'anthropic.claude-3-opus-20240229-v1:0': (0.015, 0.075)
+}
+
+# Upper bounds (ms) of the latency histogram buckets; the last bucket is open-ended
+LATENCY_BUCKETS_MS = [100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000]
+
+# Rough token estimate (English average) for calls that do not report usage
+# and for prompt budgeting; good enough for both, not for billing
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate from character count"""
+    return len(text) // CHARS_PER_TOKEN + 1 if text else 0
+
+
+def invocation_cost(model_id: str, input_tokens: int, output_tokens: int) -> Optional[float]:
+    """USD cost of one call, or None for models without a known price"""
+    pricing = MODEL_PRICING.get(model_id)
+    if pricing is None:
+        return None
+    return round(input_tokens / 1000 * pricing[0] + output_tokens / 1000 * pricing[1], 6)
+
+
+def latency_bucket(latency_ms: float) -> str:
+    """Histogram bucket label for a latency, e.g. 'le_2000' or 'gt_32000'"""
+    index = bisect_left(LATENCY_BUCKETS_MS, latency_ms)
+    if index == len(LATENCY_BUCKETS_MS):
+        return f"gt_{LATENCY_BUCKETS_MS[-1]}"
+    return f"le_{LATENCY_BUCKETS_MS[index]}"
+
+
+class BedrockMetrics:
+    """
+    Collects one metric per Bedrock invocation
+
+    Every record is printed as a single JSON line (metric=bedrock_invocation)
+    so CloudWatch Logs Insights can aggregate it, and counted into an
+    in-process latency histogram per interview phase. When a table name is
+    configured, records are also buffered and written to
+    agent_performance_metrics in batches: agent_id holds the agent type and
+    category holds 'latency#<phase>', so the category_index GSI returns the
+    per-phase latency rows (with their latency_bucket) in time order.
+    """
+
+    def __init__(self, table_name: Optional[str] = METRICS_TABLE, batch_size: int = METRICS_BATCH_SIZE, table=None):
+        """
+        Args:
+            table_name: DynamoDB table for metric rows (None disables persistence)
+            batch_size: Buffered rows that trigger a batch write
+            table: Table resource (created lazily from table_name if omitted)
+        """
+        self.table_name = table_name
+        self.batch_size = batch_size
+        self._table = table
+        self._lock = threading.Lock()
+        self._buffer: List[Dict[str, Any]] = []
+        self._histograms: Dict[str, Dict[str, int]] = {}
+
+    @property
+    def table(self):
+        if self._table is None and self.table_name:
+            self._table = AWS_CLIENTS.table(self.table_name)
+        return self._table
+
+    def record(
+        self,
+        model_id: str,
+        agent_type: str,
+        latency_ms: float,
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        ttft_ms: Optional[float] = None,
+        interview_id: Optional[str] = None,
+        phase: Optional[str] = None,
+        status: str = 'ok',
+        estimated_tokens: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Record one invocation
+
+        Args:
+            model_id: Bedrock model or agent ID that served the call
+            agent_type: interviewer, evaluator, coach, summarizer, agent...
+            latency_ms: Total call latency
+            input_tokens: Prompt tokens
+            output_tokens: Completion tokens
+            ttft_ms: Time to first streamed token (equals latency for blocking calls)
+            interview_id: Interview the call belongs to
+            phase: Interview phase at call time
+            status: ok, or the error code of a failed call
+            estimated_tokens: True if token counts are estimates, not usage
+
+        Returns:
+            The metric record
+        """
+        metric = {
+            'metric': 'bedrock_invocation',
+            'recorded_at': datetime.utcnow().isoformat(),
+            'model_id': model_id,
+            'agent_type': agent_type,
+            'interview_id': interview_id,
+            'phase': phase or 'unknown',
+            'status': status,
+            'input_tokens': input_tokens,
+            'output_tokens': output_tokens,
+            'estimated_tokens': estimated_tokens,
+            'latency_ms': round(latency_ms, 1),
+            'ttft_ms': round(ttft_ms if ttft_ms is not None else latency_ms, 1),
+            'latency_bucket': latency_bucket(latency_ms),
+            'cost_usd': invocation_cost(model_id, input_tokens, output_tokens)
+        }
+        print(json.dumps(metric))
+
+        flush = False
+        with self._lock:
+            histogram = self._histograms.setdefault(metric['phase'], {})
+            histogram[metric['latency_bucket']] = histogram.get(metric['latency_bucket'], 0) + 1
+            if self.table_name:
+                self._buffer.append(metric)
+                flush = len(self._buffer) >= self.batch_size
+        if flush:
+            self.flush()
+        return metric
+
+    def histogram(self, phase: Optional[str] = None) -> Dict[str, int]:
+        """Latency bucket counts for one phase, or across all phases"""
+        with self._lock:
+            if phase is not None:
+                return dict(self._histograms.get(phase, {}))
+            merged: Dict[str, int] = {}
+            for histogram in self._histograms.values():
+                for bucket, count in histogram.items():
+                    merged[bucket] = merged.get(bucket, 0) + count
+            return merged
+
+    def flush(self) -> int:
+        """
+        Write buffered rows to the metrics table
+
+        Returns:
+            Number of rows written
+        """
+        with self._lock:
+            rows, self._buffer = self._buffer, []
+        if not rows or self.table is None:
+            return 0
+
+        try:
+            with self.table.batch_writer() as batch:
+                for row in rows:
+                    batch.put_item(Item=self._to_item(row))
+            return len(rows)
+        except Exception as e:
+            # Metrics must never fail an interview turn
+            print(f"Metrics flush Error: {str(e)}")
+            return 0
+
+    @staticmethod
+    def _to_item(metric: Dict[str, Any]) -> Dict[str, Any]:
+        """Metric record as an agent_performance_metrics item"""
+        item = {
+            'metric_id': str(uuid.uuid4()),
+            'recorded_at': metric['recorded_at'],
+            'agent_id': metric['agent_type'],
+            'category': f"latency#{metric['phase']}"
+        }
+        for key, value in metric.items():
+            if key in ('metric', 'recorded_at') or value is None:
+                continue
+            item[key] = Decimal(str(value)) if isinstance(value, float) else value
+        return item
+
+
+# Shared per-container collector
+BEDROCK_METRICS = BedrockMetrics()
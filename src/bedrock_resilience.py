@@ -0,0 +1,326 @@
+"""
+Resilient Bedrock Invocation
+Jittered exponential backoff on throttling, per-model circuit breakers with
+fail-over to a fallback model, and optional hedged requests for tail latency
+"""
+
+import os
+import time
+import random
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Any, Callable, Deque, Dict, Iterable, Optional, Tuple
+
+from botocore.exceptions import (
+    ClientError,
+    ConnectionClosedError,
+    ConnectTimeoutError,
+    EndpointConnectionError,
+    ReadTimeoutError
+)
+
+# Error codes worth retrying; anything else (validation, access) fails fast
+THROTTLE_ERROR_CODES = {'ThrottlingException', 'TooManyRequestsException'}
+RETRYABLE_ERROR_CODES = THROTTLE_ERROR_CODES | {
+    'ServiceUnavailableException',
+    'ModelNotReadyException',
+    'InternalServerException'
+}
+# Transport failures below the API layer, also worth retrying
+RETRYABLE_CONNECTION_ERRORS = (
+    EndpointConnectionError,
+    ConnectTimeoutError,
+    ReadTimeoutError,
+    ConnectionClosedError
+)
+
+MAX_ATTEMPTS = int(os.environ.get('BEDROCK_MAX_ATTEMPTS', 4))
+BACKOFF_BASE_MS = float(os.environ.get('BEDROCK_BACKOFF_BASE_MS', 200))
+BACKOFF_MAX_MS = float(os.environ.get('BEDROCK_BACKOFF_MAX_MS', 5000))
+BREAKER_FAILURES = int(os.environ.get('BEDROCK_BREAKER_FAILURES', 5))
+BREAKER_RESET_SECONDS = float(os.environ.get('BEDROCK_BREAKER_RESET_SECONDS', 30))
+
+# Hedge a second request once the first runs past this latency percentile (0 disables).
+# Off by default: a hedge doubles the cost of the call, so call types opt in
+# through hedge_percentile in model_routing instead.
+HEDGE_PERCENTILE = float(os.environ.get('BEDROCK_HEDGE_PERCENTILE', 0))
+HEDGE_MIN_SAMPLES = 20
+LATENCY_SAMPLES = 200
+
+
+def error_code(error: BaseException) -> Optional[str]:
+    """AWS error code of a ClientError, else None"""
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code')
+    return None
+
+
+def is_throttle(error: BaseException) -> bool:
+    """True if Bedrock rejected the call for rate limiting"""
+    return error_code(error) in THROTTLE_ERROR_CODES
+
+
+def is_retryable(error: BaseException) -> bool:
+    """True if the call may succeed when repeated"""
+    return isinstance(error, RETRYABLE_CONNECTION_ERRORS) or error_code(error) in RETRYABLE_ERROR_CODES
+
+
+class CircuitOpenError(Exception):
+    """Raised when every candidate model has an open circuit"""
+
+    def __init__(self, keys: Iterable[str]):
+        self.keys = list(keys)
+        super().__init__(f"Circuit open for {', '.join(self.keys)}")
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker
+
+    Opens after `failure_threshold` failed calls in a row, rejects calls for
+    `reset_timeout` seconds, then lets a single probe through (half-open).
+    A successful probe closes the circuit; a failed or aborted one re-opens it.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURES, reset_timeout: float = BREAKER_RESET_SECONDS):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """True if a call may go through now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+    def record_abort(self):
+        """
+        A call ended with an error that says nothing about the model's health
+        (e.g. a validation error); a half-open probe re-opens the circuit so
+        the next probe is let through after the reset timeout
+        """
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+
+
+class ResilientInvoker:
+    """
+    Runs Bedrock calls with retries, circuit breaking, fail-over and hedging
+
+    Calls are keyed by model ID (or agent ID); each key gets its own breaker
+    and latency history. Callers pass zero-argument callables so the same
+    wrapper serves invoke_model, invoke_model_with_response_stream and
+    invoke_agent.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_ATTEMPTS,
+        backoff_base_ms: float = BACKOFF_BASE_MS,
+        backoff_max_ms: float = BACKOFF_MAX_MS,
+        failure_threshold: int = BREAKER_FAILURES,
+        reset_timeout: float = BREAKER_RESET_SECONDS,
+        hedge_percentile: float = HEDGE_PERCENTILE,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        """
+        Args:
+            max_attempts: Tries per model before failing over
+            backoff_base_ms: First backoff ceiling; doubles per attempt
+            backoff_max_ms: Upper bound on any single backoff
+            failure_threshold: Consecutive failures that open a model's circuit
+            reset_timeout: Seconds an open circuit waits before a probe
+            hedge_percentile: Latency percentile that triggers a hedged request
+                              (0 disables unless a call passes its own)
+            sleep: Sleep function (injectable for tests)
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base_ms = backoff_base_ms
+        self.backoff_max_ms = backoff_max_ms
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.hedge_percentile = hedge_percentile
+        self.sleep = sleep
+
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def breaker(self, key: str) -> CircuitBreaker:
+        """Circuit breaker for a model or agent"""
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[key]
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter backoff in seconds before retry number `attempt` (0-based)"""
+        ceiling = min(self.backoff_max_ms, self.backoff_base_ms * (2 ** attempt))
+        return random.uniform(0, ceiling) / 1000
+
+    def record_latency(self, key: str, seconds: float):
+        with self._lock:
+            self._latencies.setdefault(key, deque(maxlen=LATENCY_SAMPLES)).append(seconds)
+
+    def latency_percentile(self, key: str, percentile: Optional[float] = None) -> Optional[float]:
+        """Observed latency percentile in seconds, or None until enough samples exist"""
+        percentile = self.hedge_percentile if percentile is None else percentile
+        with self._lock:
+            samples = sorted(self._latencies.get(key, ()))
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return None
+        index = min(len(samples) - 1, int(len(samples) * percentile / 100))
+        return samples[index]
+
+    def _timed(self, key: str, fn: Callable[[], Any]) -> Any:
+        started = time.monotonic()
+        result = fn()
+        self.record_latency(key, time.monotonic() - started)
+        return result
+
+    def _hedged(self, key: str, fn: Callable[[], Any], percentile: Optional[float] = None) -> Any:
+        """Run fn; if it outlives the latency percentile, race a second copy"""
+        percentile = self.hedge_percentile if percentile is None else percentile
+        threshold = self.latency_percentile(key, percentile) if percentile > 0 else None
+        if threshold is None:
+            return self._timed(key, fn)
+
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='bedrock-hedge')
+            executor = self._executor
+        pending = {executor.submit(self._timed, key, fn)}
+        done, pending = wait(pending, timeout=threshold)
+        if not done:
+            pending.add(executor.submit(self._timed, key, fn))
+
+        error = None
+        while pending or done:
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        raise error
+
+    def _attempt(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        hedge: bool,
+        committed: Optional[Callable[[], bool]] = None,
+        hedge_percentile: Optional[float] = None
+    ) -> Any:
+        """Call one model with backoff on retryable errors"""
+        breaker = self.breaker(key)
+        for attempt in range(self.max_attempts):
+            try:
+                result = self._hedged(key, fn, hedge_percentile) if hedge else self._timed(key, fn)
+                breaker.record_success()
+                return result
+            except Exception as e:
+                if not is_retryable(e):
+                    breaker.record_abort()
+                    raise
+                breaker.record_failure()
+                if attempt + 1 == self.max_attempts or not breaker.allow() or (committed and committed()):
+                    raise
+                delay = self.backoff_delay(attempt)
+                print(f"Bedrock {error_code(e) or type(e).__name__} on {key}; retry {attempt + 1} in {delay:.2f}s")
+                self.sleep(delay)
+
+    def call(
+        self,
+        key: str,
+        fn: Callable[[], Any],
+        fallbacks: Iterable[Tuple[str, Callable[[], Any]]] = (),
+        hedge: bool = False,
+        committed: Optional[Callable[[], bool]] = None,
+        hedge_percentile: Optional[float] = None
+    ) -> Tuple[Any, str]:
+        """
+        Invoke with retries, falling over to the next candidate on exhaustion
+
+        Args:
+            key: Model or agent ID for the primary call
+            fn: Zero-argument callable performing the primary call
+            fallbacks: (key, callable) pairs tried in order when the primary
+                       circuit is open or its retries are exhausted
+            hedge: Race a duplicate request past the latency percentile
+                   (only for idempotent, non-streaming calls)
+            committed: For streamed calls, returns True once output has
+                       reached the caller; a failure after that is raised
+                       as-is instead of being retried or failed over
+            hedge_percentile: Percentile for this call's hedge, overriding
+                              the invoker default (0 disables)
+
+        Returns:
+            Tuple of (result, key that served it)
+        """
+        candidates = [(key, fn)] + [c for c in fallbacks if c[0] != key]
+        skipped = []
+        last_error: Optional[BaseException] = None
+
+        for candidate_key, candidate_fn in candidates:
+            if not self.breaker(candidate_key).allow():
+                skipped.append(candidate_key)
+                continue
+            try:
+                return self._attempt(
+                    candidate_key, candidate_fn, hedge, committed, hedge_percentile
+                ), candidate_key
+            except Exception as e:
+                if not is_retryable(e) or (committed and committed()):
+                    raise
+                last_error = e
+                print(f"Bedrock call on {candidate_key} failed: {str(e)}")
+
+        if last_error is not None:
+            raise last_error
+        raise CircuitOpenError(skipped)
+
+    def stats(self) -> Dict[str, Any]:
+        """Breaker state and p50/p95 latency (seconds) per key"""
+        with self._lock:
+            keys = set(self._breakers) | set(self._latencies)
+        return {
+            key: {
+                'circuit': self.breaker(key).state,
+                'p50': self.latency_percentile(key, 50),
+                'p95': self.latency_percentile(key, 95)
+            }
+            for key in keys
+        }
+
+
+# Shared per-container invoker; breaker and latency state persist across warm invocations
+BEDROCK_RESILIENCE = ResilientInvoker()
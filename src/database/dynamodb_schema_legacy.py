@@ -159,6 +159,170 @@ def create_transcripts_table():
             raise
 
 
+def create_transcript_turns_table():
+    """
+    Create table for storing interview transcripts one item per turn
+    
+    Attributes:
+    - interview_id (PK): UUID of the interview
+    - turn_seq (SK): 0-based position of the turn
+    - role: interviewer or candidate
+    - content: Turn text
+    - timestamp: ISO timestamp
+    """
+    
+    try:
+        response = dynamodb.create_table(
+            TableName='interview_transcript_turns',
+            KeySchema=[
+                {'AttributeName': 'interview_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'turn_seq', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'interview_id', 'AttributeType': 'S'},
+                {'AttributeName': 'turn_seq', 'AttributeType': 'N'}
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {'Key': 'Application', 'Value': 'AIInterviewCoach'},
+                {'Key': 'Environment', 'Value': 'production'}
+            ]
+        )
+        print("Created interview_transcript_turns table")
+        return response
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print("interview_transcript_turns table already exists")
+        else:
+            raise
+
+
+def create_question_cache_table():
+    """
+    Create table for speculatively prepared follow-up questions
+    
+    Attributes:
+    - interview_id (PK): UUID of the interview
+    - question_key (SK): Hash of the question the variants follow
+    - variants: Prepared follow-ups (pattern, keywords, question)
+    - model_id: Model that prepared them
+    - expires_at: Epoch seconds; DynamoDB TTL removes stale entries
+    """
+    
+    try:
+        response = dynamodb.create_table(
+            TableName='interview_question_cache',
+            KeySchema=[
+                {'AttributeName': 'interview_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'question_key', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'interview_id', 'AttributeType': 'S'},
+                {'AttributeName': 'question_key', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {'Key': 'Application', 'Value': 'AIInterviewCoach'},
+                {'Key': 'Environment', 'Value': 'production'}
+            ]
+        )
+        dynamodb.get_waiter('table_exists').wait(TableName='interview_question_cache')
+        dynamodb.update_time_to_live(
+            TableName='interview_question_cache',
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+        )
+        print("Created interview_question_cache table")
+        return response
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print("interview_question_cache table already exists")
+        else:
+            raise
+
+
+def create_turn_scores_table():
+    """
+    Create table for per-answer scores (incremental evaluation)
+    
+    Attributes:
+    - interview_id (PK): UUID of the interview
+    - turn_seq (SK): Position of the candidate turn that was scored
+    - question: Question that was answered
+    - topic: Short topic label
+    - scores: Dimension -> 0-10 score
+    - strengths / weaknesses: Short phrases noted for the answer
+    - model_id: Model that scored it
+    - evaluated_at: ISO timestamp
+    """
+    
+    try:
+        response = dynamodb.create_table(
+            TableName='interview_turn_scores',
+            KeySchema=[
+                {'AttributeName': 'interview_id', 'KeyType': 'HASH'},
+                {'AttributeName': 'turn_seq', 'KeyType': 'RANGE'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'interview_id', 'AttributeType': 'S'},
+                {'AttributeName': 'turn_seq', 'AttributeType': 'N'}
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {'Key': 'Application', 'Value': 'AIInterviewCoach'},
+                {'Key': 'Environment', 'Value': 'production'}
+            ]
+        )
+        print("Created interview_turn_scores table")
+        return response
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print("interview_turn_scores table already exists")
+        else:
+            raise
+
+
+def create_idempotency_keys_table():
+    """
+    Create table for idempotent action responses
+    
+    Attributes:
+    - idempotency_key (PK): Client-supplied key of the request
+    - fingerprint: Hash of the request fields the key was first used with
+    - record_status: in_progress or completed
+    - claim_token / lease_expires_at: Holder and expiry of an unfinished claim
+    - status_code / response_body: Stored response replayed on retries
+    - expires_at: Epoch seconds; DynamoDB TTL removes old keys
+    """
+    
+    try:
+        response = dynamodb.create_table(
+            TableName='interview_idempotency_keys',
+            KeySchema=[
+                {'AttributeName': 'idempotency_key', 'KeyType': 'HASH'}
+            ],
+            AttributeDefinitions=[
+                {'AttributeName': 'idempotency_key', 'AttributeType': 'S'}
+            ],
+            BillingMode='PAY_PER_REQUEST',
+            Tags=[
+                {'Key': 'Application', 'Value': 'AIInterviewCoach'},
+                {'Key': 'Environment', 'Value': 'production'}
+            ]
+        )
+        dynamodb.get_waiter('table_exists').wait(TableName='interview_idempotency_keys')
+        dynamodb.update_time_to_live(
+            TableName='interview_idempotency_keys',
+            TimeToLiveSpecification={'Enabled': True, 'AttributeName': 'expires_at'}
+        )
+        print("Created interview_idempotency_keys table")
+        return response
+    except ClientError as e:
+        if e.response['Error']['Code'] == 'ResourceInUseException':
+            print("interview_idempotency_keys table already exists")
+        else:
+            raise
+
+
 def create_candidate_profiles_table():
     """
     Create table for storing candidate profiles
@@ -215,6 +379,10 @@ def create_all_tables():
     create_interviews_table()
     create_evaluations_table()
     create_transcripts_table()
+    create_transcript_turns_table()
+    create_question_cache_table()
+    create_turn_scores_table()
+    create_idempotency_keys_table()
     create_candidate_profiles_table()
     print("\n✅ All DynamoDB tables created successfully!")
 
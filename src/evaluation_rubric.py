@@ -0,0 +1,15 @@
+"""
+Evaluator Rubric
+Scoring criteria and weights shared by the evaluator agent prompt and the
+orchestrator's chunked evaluation (kept free of AWS imports so the Lambda
+cold start does not pay for them)
+"""
+
+# (scoreBreakdown key, criterion, what it covers, weight in points out of 100)
+EVALUATION_RUBRIC = (
+    ('technicalKnowledge', 'Technical Knowledge', 'Fundamentals + relevant trends', 40),
+    ('problemSolving', 'Problem Solving', 'Approach, clear thinking, handling ambiguity', 25),
+    ('systemDesign', 'System Design', 'Architecture, scalability, trade-offs', 20),
+    ('communication', 'Communication', 'Clear explanation, listens to feedback', 10),
+    ('awareness', 'Awareness', 'AI/ML impact, security, cost awareness', 5)
+)
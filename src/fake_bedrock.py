@@ -0,0 +1,333 @@
+"""
+Local Bedrock Stand-in Server
+Answers bedrock-runtime, bedrock-agent-runtime and Polly calls on localhost
+with configurable latency, streaming, throttling and canned/echo responses
+
+Usage:
+    python src/fake_bedrock.py --port 4010 --latency-ms 800 --throttle-rate 0.05
+
+    export LOCAL_AWS_ENDPOINT_URL=http://127.0.0.1:4010
+    export AWS_ACCESS_KEY_ID=local AWS_SECRET_ACCESS_KEY=local
+
+With LOCAL_AWS_ENDPOINT_URL set, the orchestrator, BedrockAgentManager and
+the voice handler send their Bedrock/Polly traffic here (see aws_endpoints.py).
+DynamoDB and S3 are not faked; point them at DynamoDB Local / a local S3 with
+the standard AWS_ENDPOINT_URL_<SERVICE> variables.
+"""
+
+import re
+import json
+import time
+import base64
+import random
+import argparse
+import threading
+import binascii
+import struct
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+
+# Replies matched by case-insensitive substring of the system prompt
+DEFAULT_RESPONSES = [
+    ('you score one answer from a job interview', json.dumps({
+        'topic': 'Distributed systems',
+        'scores': {'technical_knowledge': 7, 'communication_clarity': 8, 'confidence_level': 7, 'problem_solving': 6},
+        'strengths': ['Clear communication'],
+        'weaknesses': ['Go deeper on trade-offs']
+    })),
+    ('you evaluate one segment of a job interview', json.dumps({
+        'scoreBreakdown': {'technicalKnowledge': 30, 'problemSolving': 18, 'systemDesign': 14, 'communication': 8, 'awareness': 3},
+        'scores': {'technical_knowledge': 7, 'communication_clarity': 8, 'confidence_level': 7, 'problem_solving': 6},
+        'strengths': ['Clear communication'],
+        'weaknesses': ['Go deeper on trade-offs'],
+        'assessment': 'Solid answers in this segment.'
+    })),
+    ('you fix specific fields of a json object', json.dumps({
+        'scores': {'technical_knowledge': 7.5, 'communication_clarity': 7.4, 'confidence_level': 7.0, 'problem_solving': 7.0},
+        'overall_score': 7.23,
+        'weaknesses': ['Go deeper on trade-offs'],
+        'improvement_areas': ['System design at scale'],
+        'overall_assessment': 'Solid fundamentals; go deeper on trade-offs.'
+    })),
+    ('evaluator agent', json.dumps({
+        'overall_score': 72,
+        'technical_knowledge': {'score': 75, 'feedback': 'Solid fundamentals.'},
+        'problem_solving': {'score': 70, 'feedback': 'Structured approach.'},
+        'communication': {'score': 74, 'feedback': 'Clear explanations.'},
+        'strengths': ['Clear communication'],
+        'improvements': ['Go deeper on trade-offs'],
+        'recommendation': 'hire'
+    })),
+    ('you finish a coaching report', '📊 PERFORMANCE SUMMARY\n- Solid fundamentals, explained clearly\n'
+     '🏆 FINAL READINESS VERDICT\nAlmost Ready\nExplanation: A little more depth on trade-offs gets you there.'),
+    ('coach agent', 'Focus on explaining trade-offs out loud. Practice two system design questions this week.'),
+    ('running summary', '- Asked: background and recent projects'),
+    ("next turn before the candidate has answered", json.dumps([
+        {'pattern': 'strong', 'keywords': ['trade-off', 'latency', 'idempotency'],
+         'question': 'Good detail. How did you test that retries stayed idempotent under load?'},
+        {'pattern': 'partial', 'keywords': ['trade-off', 'latency', 'idempotency'],
+         'question': 'Thanks. What trade-offs did that decision involve?'},
+        {'pattern': 'weak', 'keywords': [],
+         'question': 'No problem. Tell me about a project you are proud of.'}
+    ])),
+    ('', 'Thanks for that. Can you walk me through a recent technical decision and its trade-offs?')
+]
+
+# Roughly one token per word for usage reporting
+WORDS_PER_CHUNK = 3
+
+
+class FakeBedrockConfig:
+    """Behaviour of the stand-in server"""
+
+    def __init__(
+        self,
+        latency_ms: float = 600.0,
+        latency_sigma: float = 0.5,
+        ttft_ms: float = 250.0,
+        chunk_delay_ms: float = 20.0,
+        throttle_rate: float = 0.0,
+        mode: str = 'canned',
+        responses: Optional[List[Tuple[str, str]]] = None,
+        seed: Optional[int] = None
+    ):
+        """
+        Args:
+            latency_ms: Median total latency of a blocking call
+            latency_sigma: Log-normal sigma of the latency (0 = fixed latency)
+            ttft_ms: Median time to the first streamed chunk
+            chunk_delay_ms: Delay between streamed chunks
+            throttle_rate: Fraction of calls rejected with ThrottlingException
+            mode: 'canned' (DEFAULT_RESPONSES / responses) or 'echo' (user message)
+            responses: (system prompt substring, reply) pairs, first match wins
+            seed: Random seed for reproducible runs
+        """
+        self.latency_ms = latency_ms
+        self.latency_sigma = latency_sigma
+        self.ttft_ms = ttft_ms
+        self.chunk_delay_ms = chunk_delay_ms
+        self.throttle_rate = throttle_rate
+        self.mode = mode
+        self.responses = responses or DEFAULT_RESPONSES
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.throttled = 0
+
+    def sample_ms(self, median_ms: float) -> float:
+        """Log-normal sample around a median"""
+        with self._lock:
+            if self.latency_sigma <= 0:
+                return median_ms
+            return self.random.lognormvariate(0, self.latency_sigma) * median_ms
+
+    def should_throttle(self) -> bool:
+        with self._lock:
+            self.calls += 1
+            throttled = self.random.random() < self.throttle_rate
+            self.throttled += throttled
+            return throttled
+
+    def reply(self, system_prompt: str, user_message: str) -> str:
+        """Response text for a prompt"""
+        if self.mode == 'echo':
+            return user_message
+        system_prompt = system_prompt.lower()
+        for match, text in self.responses:
+            if match.lower() in system_prompt:
+                return text
+        return user_message
+
+
+def encode_event(payload: bytes, event_type: str = 'chunk') -> bytes:
+    """One frame of the AWS event-stream encoding (application/vnd.amazon.eventstream)"""
+    headers = b''
+    for name, value in ((':event-type', event_type), (':content-type', 'application/json'), (':message-type', 'event')):
+        name_bytes, value_bytes = name.encode(), value.encode()
+        headers += struct.pack('!B', len(name_bytes)) + name_bytes
+        headers += struct.pack('!BH', 7, len(value_bytes)) + value_bytes
+
+    total_length = 12 + len(headers) + len(payload) + 4
+    prelude = struct.pack('!II', total_length, len(headers))
+    prelude += struct.pack('!I', binascii.crc32(prelude) & 0xffffffff)
+    message = prelude + headers + payload
+    return message + struct.pack('!I', binascii.crc32(message) & 0xffffffff)
+
+
+def chunk_text(text: str) -> List[str]:
+    """Split a reply into streamed pieces of a few words"""
+    words = text.split(' ')
+    return [
+        ' '.join(words[i:i + WORDS_PER_CHUNK]) + (' ' if i + WORDS_PER_CHUNK < len(words) else '')
+        for i in range(0, len(words), WORDS_PER_CHUNK)
+    ]
+
+
+def count_tokens(text: str) -> int:
+    return len(text.split())
+
+
+class FakeBedrockHandler(BaseHTTPRequestHandler):
+    """Routes boto3 REST calls to the fake implementations"""
+
+    config: FakeBedrockConfig = FakeBedrockConfig()
+
+    ROUTES = [
+        (re.compile(r'^/model/(?P<model>[^/]+)/invoke$'), 'invoke_model'),
+        (re.compile(r'^/model/(?P<model>[^/]+)/invoke-with-response-stream$'), 'invoke_model_stream'),
+        (re.compile(r'^/agents/(?P<agent>[^/]+)/agentAliases/[^/]+/sessions/[^/]+/text$'), 'invoke_agent'),
+        (re.compile(r'^/v1/speech$'), 'synthesize_speech')
+    ]
+
+    def log_message(self, format, *args):
+        # One line per request is too noisy under load
+        pass
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length', 0))
+        body = json.loads(self.rfile.read(length) or b'{}')
+        path = self.path.split('?')[0]
+
+        for pattern, action in self.ROUTES:
+            if pattern.match(path):
+                if self.config.should_throttle():
+                    return self._error(429, 'ThrottlingException', 'Rate exceeded')
+                return getattr(self, action)(body)
+        self._error(404, 'ResourceNotFoundException', f"No fake for {path}")
+
+    def _prompt(self, body: Dict[str, Any]) -> Tuple[str, str]:
+        """(system, last user message) from an Anthropic messages request"""
+        messages = body.get('messages') or [{}]
+        content = messages[-1].get('content', '')
+        if isinstance(content, list):
+            content = ''.join(part.get('text', '') for part in content)
+        return body.get('system', ''), content
+
+    def _send(self, status: int, content_type: str, payload: bytes = b'', headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if payload:
+            self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def _error(self, status: int, code: str, message: str):
+        self._send(status, 'application/json', json.dumps({'message': message}).encode(),
+                   {'x-amzn-ErrorType': code})
+
+    def _stream(self, events: List[bytes]):
+        """Write event-stream frames with the configured TTFT and chunk spacing"""
+        self._send(200, 'application/vnd.amazon.eventstream')
+        time.sleep(self.config.sample_ms(self.config.ttft_ms) / 1000)
+        for i, event in enumerate(events):
+            if i:
+                time.sleep(self.config.chunk_delay_ms / 1000)
+            self.wfile.write(event)
+            self.wfile.flush()
+
+    def invoke_model(self, body: Dict[str, Any]):
+        system, user = self._prompt(body)
+        text = self.config.reply(system, user)
+        time.sleep(self.config.sample_ms(self.config.latency_ms) / 1000)
+        self._send(200, 'application/json', json.dumps({
+            'type': 'message',
+            'role': 'assistant',
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'usage': {'input_tokens': count_tokens(system + ' ' + user), 'output_tokens': count_tokens(text)}
+        }).encode())
+
+    def invoke_model_stream(self, body: Dict[str, Any]):
+        system, user = self._prompt(body)
+        text = self.config.reply(system, user)
+        chunks = [
+            {'type': 'message_start', 'message': {'usage': {'input_tokens': count_tokens(system + ' ' + user)}}}
+        ] + [
+            {'type': 'content_block_delta', 'index': 0, 'delta': {'type': 'text_delta', 'text': piece}}
+            for piece in chunk_text(text)
+        ] + [
+            {'type': 'message_delta', 'usage': {'output_tokens': count_tokens(text)}},
+            {'type': 'message_stop'}
+        ]
+        self._stream([
+            encode_event(json.dumps({'bytes': base64.b64encode(json.dumps(c).encode()).decode()}).encode())
+            for c in chunks
+        ])
+
+    def invoke_agent(self, body: Dict[str, Any]):
+        text = self.config.reply('', body.get('inputText', ''))
+        self._stream([
+            encode_event(json.dumps({'bytes': base64.b64encode(piece.encode()).decode()}).encode())
+            for piece in chunk_text(text)
+        ])
+
+    def synthesize_speech(self, body: Dict[str, Any]):
+        text = body.get('Text', '')
+        time.sleep(self.config.sample_ms(self.config.latency_ms) / 1000)
+        # Silence: one byte per character is close enough for size-sensitive tests
+        self._send(200, 'audio/mpeg', b'\x00' * max(1, len(text)),
+                   {'x-amzn-RequestCharacters': str(len(text))})
+
+
+def start_fake_bedrock(config: Optional[FakeBedrockConfig] = None, host: str = '127.0.0.1', port: int = 0):
+    """
+    Run the stand-in on a background thread
+
+    Args:
+        config: Server behaviour (defaults to FakeBedrockConfig())
+        host: Bind address
+        port: Bind port (0 picks a free one)
+
+    Returns:
+        Tuple of (server, endpoint URL); call server.shutdown() when done
+    """
+    handler = type('ConfiguredFakeBedrockHandler', (FakeBedrockHandler,), {'config': config or FakeBedrockConfig()})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local Bedrock stand-in for offline load testing')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4010)
+    parser.add_argument('--latency-ms', type=float, default=600.0)
+    parser.add_argument('--latency-sigma', type=float, default=0.5)
+    parser.add_argument('--ttft-ms', type=float, default=250.0)
+    parser.add_argument('--chunk-delay-ms', type=float, default=20.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--mode', choices=['canned', 'echo'], default='canned')
+    parser.add_argument('--responses', help='JSON file of [system prompt substring, reply] pairs')
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args()
+
+    responses = None
+    if args.responses:
+        with open(args.responses, 'r') as f:
+            responses = [tuple(pair) for pair in json.load(f)]
+
+    config = FakeBedrockConfig(
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        ttft_ms=args.ttft_ms,
+        chunk_delay_ms=args.chunk_delay_ms,
+        throttle_rate=args.throttle_rate,
+        mode=args.mode,
+        responses=responses,
+        seed=args.seed
+    )
+    handler = type('ConfiguredFakeBedrockHandler', (FakeBedrockHandler,), {'config': config})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    print(f"Fake Bedrock listening on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
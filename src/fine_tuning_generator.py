@@ -5,16 +5,17 @@ Generates interview Q&A pairs for specific IT categories
 """
 
 import json
-import boto3
 from typing import List, Dict, Any
 from datetime import datetime
 
+from aws_clients import lazy_client
+
 
 class FineTuningDataGenerator:
     """Generates training data for fine-tuning Bedrock models"""
     
     def __init__(self):
-        self.s3_client = boto3.client('s3', region_name='us-east-1')
+        self.s3_client = lazy_client('s3', 'us-east-1')
         self.bucket = 'interview-coach-training-data'
         
     def generate_python_backend_training_data(self) -> List[Dict[str, str]]:
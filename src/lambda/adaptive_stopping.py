@@ -0,0 +1,146 @@
+"""
+Adaptive Interview Length
+Tracks a mean and 95% confidence interval per scoring dimension from the
+per-turn scores; once every interval is tight (after a minimum number of
+answers) the interview closes instead of running a fixed 12-15 questions,
+and once the current topic's recent answers agree the interviewer moves on
+to a new topic
+"""
+
+import os
+import math
+from typing import Any, Dict, List
+
+from feature_flags import env_flag
+from turn_evaluation import DIMENSIONS
+
+ADAPTIVE_STOPPING_ENV = 'ADAPTIVE_STOPPING'
+MIN_QUESTIONS_ENV = 'ADAPTIVE_MIN_QUESTIONS'
+MAX_QUESTIONS_ENV = 'ADAPTIVE_MAX_QUESTIONS'
+HALF_WIDTH_ENV = 'ADAPTIVE_CI_HALF_WIDTH'
+TOPIC_HALF_WIDTH_ENV = 'ADAPTIVE_TOPIC_CI_HALF_WIDTH'
+
+DEFAULT_MIN_QUESTIONS = 5
+DEFAULT_MAX_QUESTIONS = 12
+
+# Interval half-widths on the 0-10 scale: the interview ends once every
+# dimension is known to within this, a topic once its last answers agree
+DEFAULT_HALF_WIDTH = 0.75
+DEFAULT_TOPIC_HALF_WIDTH = 1.0
+
+# Answers on the current topic looked at for a topic shift
+TOPIC_WINDOW = 3
+
+Z_95 = 1.96
+
+# Floor on the per-answer spread: a few identical scores are not certainty
+MIN_STD = 0.75
+
+CONTINUE = 'continue'
+SHIFT_TOPIC = 'shift_topic'
+STOP = 'stop'
+
+# Interviewer prompt FINAL MESSAGE, served without a model call
+CLOSING_MESSAGE = "Thank you for the interview! Your feedback will be analyzed and sent shortly.\nGood luck! 💪"
+
+SHIFT_TOPIC_INSTRUCTIONS = """
+        The candidate's level on the current topic is already clear.
+        Move to a different topic or skill area for the next question.
+        """
+
+
+def adaptive_stopping_enabled() -> bool:
+    """True if $ADAPTIVE_STOPPING ends interviews once the scores converge"""
+    return env_flag(ADAPTIVE_STOPPING_ENV)
+
+
+def min_questions() -> int:
+    """Answers always collected before the interview may close early"""
+    return int(os.environ.get(MIN_QUESTIONS_ENV, DEFAULT_MIN_QUESTIONS))
+
+
+def max_questions() -> int:
+    """Answers after which the interview closes regardless of convergence"""
+    return int(os.environ.get(MAX_QUESTIONS_ENV, DEFAULT_MAX_QUESTIONS))
+
+
+def estimate(values: List[float]) -> Dict[str, Any]:
+    """
+    Mean and 95% confidence half-width of a list of scores
+
+    Returns:
+        mean, half_width (None with fewer than two values) and n
+    """
+    n = len(values)
+    if n == 0:
+        return {'mean': None, 'half_width': None, 'n': 0}
+    mean = sum(values) / n
+    if n < 2:
+        return {'mean': mean, 'half_width': None, 'n': n}
+    std = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1))
+    return {'mean': mean, 'half_width': Z_95 * max(std, MIN_STD) / math.sqrt(n), 'n': n}
+
+
+def dimension_estimates(turn_scores: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """estimate() of each scoring dimension over the per-turn scores"""
+    return {
+        dimension: estimate([t['scores'][dimension] for t in turn_scores if dimension in t['scores']])
+        for dimension in DIMENSIONS
+    }
+
+
+def _tight(estimated: Dict[str, Any], half_width: float) -> bool:
+    return estimated['half_width'] is not None and estimated['half_width'] <= half_width
+
+
+def stopping_decision(turn_scores: List[Dict[str, Any]], answered: int, topic_start: int = -1) -> Dict[str, Any]:
+    """
+    Whether to keep going, change topic or close the interview
+
+    Args:
+        turn_scores: Per-turn scores available so far (parse_turn_score output plus turn_seq)
+        answered: Questions the candidate has answered, including the latest
+        topic_start: Transcript index where the current topic began; only
+                     answers after it count towards a topic shift
+
+    Returns:
+        action (continue, shift_topic or stop), reason and the per-dimension
+        estimates (rounded)
+    """
+    estimates = dimension_estimates(turn_scores)
+    half_width = float(os.environ.get(HALF_WIDTH_ENV, DEFAULT_HALF_WIDTH))
+    topic_half_width = float(os.environ.get(TOPIC_HALF_WIDTH_ENV, DEFAULT_TOPIC_HALF_WIDTH))
+
+    if answered >= max_questions():
+        action, reason = STOP, 'max_questions'
+    elif answered >= min_questions() and all(_tight(e, half_width) for e in estimates.values()):
+        action, reason = STOP, 'converged'
+    else:
+        topic = sorted((t for t in turn_scores if t['turn_seq'] > topic_start), key=lambda t: t['turn_seq'])
+        recent = [sum(t['scores'].values()) / len(t['scores']) for t in topic[-TOPIC_WINDOW:] if t['scores']]
+        if len(recent) >= TOPIC_WINDOW and _tight(estimate(recent), topic_half_width):
+            action, reason = SHIFT_TOPIC, 'topic_converged'
+        else:
+            action, reason = CONTINUE, None
+
+    return {
+        'action': action,
+        'reason': reason,
+        'estimates': {
+            dimension: {
+                'mean': round(e['mean'], 2) if e['mean'] is not None else None,
+                'half_width': round(e['half_width'], 2) if e['half_width'] is not None else None,
+                'n': e['n']
+            }
+            for dimension, e in estimates.items()
+        }
+    }
+
+
+def topic_start(turns: List[Dict[str, Any]]) -> int:
+    """Index of the interviewer turn that opened the current topic (-1 if none did)"""
+    for seq in range(len(turns) - 1, -1, -1):
+        turn = turns[seq]
+        if turn['role'] == 'interviewer' and (turn.get('question_id') or turn.get('topic_shift')):
+            return seq
+    return -1
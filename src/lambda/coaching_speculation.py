@@ -0,0 +1,115 @@
+"""
+Speculative Parallel Coaching
+The coach drafts its feedback from the transcript while the evaluator is
+still running; once the scores are in, a short reconciliation call writes
+only the score-dependent sections (performance summary, readiness verdict,
+missed weaknesses) and they are merged around the draft
+End-of-interview wall time becomes one model call plus a short one instead
+of two full calls back to back
+"""
+
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+from feature_flags import env_flag
+
+PARALLEL_COACHING_ENV = 'PARALLEL_COACHING'
+
+SUMMARY_SECTION = 'PERFORMANCE SUMMARY'
+VERDICT_SECTION = 'FINAL READINESS VERDICT'
+ADDENDUM_SECTION = 'ALSO FOCUS ON'
+AREAS_SECTION = 'AREAS TO IMPROVE'
+
+# Section titles of the coach output format (sophia_coach_prompt.md), plus the addendum
+COACHING_SECTIONS = (
+    SUMMARY_SECTION, 'WHAT YOU DID WELL', AREAS_SECTION, 'PREPARATION PLAN',
+    'ROLE-SPECIFIC RECOMMENDATIONS', VERDICT_SECTION, ADDENDUM_SECTION
+)
+
+# Sections that depend on the scores, so the draft leaves them out
+RECONCILED_SECTIONS = (SUMMARY_SECTION, VERDICT_SECTION, ADDENDUM_SECTION)
+
+DRAFT_INSTRUCTIONS = f"""
+        The evaluation is still running, so no scores are available yet.
+        Write every section except {SUMMARY_SECTION} and {VERDICT_SECTION};
+        those are added once the scores are in. Base strengths, areas to
+        improve and the preparation plan on the transcript.
+        """
+
+COACHING_RECONCILE_SYSTEM_PROMPT = f"""You finish a coaching report for a job interview candidate.
+The report body was drafted from the transcript before the evaluation finished. You get the final evaluation and the draft's areas to improve.
+Write ONLY these sections, in this order:
+📊 {SUMMARY_SECTION}
+- Overall impression, key achievements, main challenges (3 short bullets)
+🏆 {VERDICT_SECTION}
+The readiness level exactly as the evaluation gives it, then "Explanation:" and 1-2 sentences.
+If the evaluation lists a weakness the draft's areas to improve do not cover, add a third section:
+➕ {ADDENDUM_SECTION}
+- One bullet per missing weakness with a quick tip
+Use second person, be honest but encouraging, and do not repeat numeric scores."""
+
+
+def parallel_coaching_enabled() -> bool:
+    """True if $PARALLEL_COACHING drafts coaching alongside the evaluation"""
+    return env_flag(PARALLEL_COACHING_ENV)
+
+
+def _section_title(line: str) -> Optional[str]:
+    """Coaching section a header line opens, or None for body lines"""
+    stripped = line.strip()
+    if not stripped or len(stripped) > 60:
+        return None
+    words = re.sub(r'[^A-Za-z\- ]', ' ', stripped).split()
+    text = ' '.join(words)
+    if not text or text != text.upper():
+        return None
+    for title in COACHING_SECTIONS:
+        if title in text:
+            return title
+    return None
+
+
+def split_sections(text: str) -> List[Tuple[Optional[str], str]]:
+    """
+    Split coaching text at its section headers
+
+    Returns:
+        (section title, text including the header line) in order; text before
+        the first header has title None
+    """
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+    for line in text.splitlines():
+        title = _section_title(line)
+        if title is not None:
+            sections.append((title, []))
+        sections[-1][1].append(line)
+    return [(title, "\n".join(lines).strip()) for title, lines in sections if "\n".join(lines).strip()]
+
+
+def section(text: str, title: str) -> str:
+    """One section of coaching text ('' if absent)"""
+    return next((body for name, body in split_sections(text) if name == title), '')
+
+
+def merge_coaching(draft: str, reconciliation: str) -> str:
+    """
+    Final coaching feedback from the draft and the reconciliation
+
+    The summary goes first, then the draft body (any score-dependent section
+    the draft wrote anyway is dropped), the addendum and the verdict last.
+    A reconciliation without recognisable headers is used as the summary.
+    """
+    reconciled = dict((title, body) for title, body in split_sections(reconciliation) if title is not None)
+    if not reconciled:
+        reconciled = {SUMMARY_SECTION: reconciliation.strip()}
+    body = [text for title, text in split_sections(draft) if title not in RECONCILED_SECTIONS]
+    parts = [reconciled.get(SUMMARY_SECTION, '')] + body + [
+        reconciled.get(ADDENDUM_SECTION, ''), reconciled.get(VERDICT_SECTION, '')
+    ]
+    return "\n\n".join(part for part in parts if part)
+
+
+def evaluation_digest(evaluation: Dict[str, Any]) -> Dict[str, Any]:
+    """The evaluation fields the reconciliation needs (keeps its prompt short)"""
+    fields = ('overall_score', 'readiness_level', 'scores', 'strengths', 'weaknesses', 'improvement_areas')
+    return {field: evaluation[field] for field in fields if field in evaluation}
@@ -0,0 +1,144 @@
+"""
+Rolling Context Manager for the Interviewer Prompt
+Keeps a running summary of older turns plus a recent window of raw turns
+Prompt size stays under a token budget regardless of interview length
+"""
+
+import os
+from typing import Callable, List, Optional, Tuple
+
+from bedrock_metrics import estimate_tokens
+from transcript import Transcript
+
+CONTEXT_TOKEN_BUDGET_ENV = 'CONTEXT_TOKEN_BUDGET'
+
+SUMMARY_SYSTEM_PROMPT = """You maintain a compact running summary of a job interview for the interviewer.
+Keep: topics and questions already covered, the candidate's key claims, strengths and gaps observed,
+and any follow-ups the interviewer promised. Drop pleasantries and repetition.
+Return only the updated summary as short bullet points, under 200 words."""
+
+
+def extractive_summary(previous_summary: str, turns_text: str, max_chars: int = 160) -> str:
+    """
+    Model-free fallback summary: keep only the interviewer's questions, clipped
+
+    Used when the summariser call fails so the window still advances.
+    """
+    asked = [
+        f"- Asked: {line[len('INTERVIEWER: '):][:max_chars]}"
+        for line in turns_text.splitlines()
+        if line.startswith('INTERVIEWER: ')
+    ]
+    return "\n".join(filter(None, [previous_summary] + asked))
+
+
+class RollingContext:
+    """
+    Summary-plus-window view of the conversation for the interviewer
+
+    Turns that no longer fit in the recent window are folded into the running
+    summary by a summariser call. Folding is split into prepare_update (cheap,
+    on the request thread), fold (the model call, which leaves this context
+    untouched) and apply_update, so the model call can run in the background
+    and its result be applied whenever it is ready.
+    """
+
+    def __init__(
+        self,
+        token_budget: Optional[int] = None,
+        min_recent_turns: int = 2,
+        summary: str = '',
+        summarized_turns: int = 0
+    ):
+        """
+        Args:
+            token_budget: Max estimated tokens for summary + recent turns
+                          (defaults to $CONTEXT_TOKEN_BUDGET, then 1500)
+            min_recent_turns: Turns always kept verbatim, even over budget
+            summary: Existing running summary (when rehydrating)
+            summarized_turns: Number of leading turns already in the summary
+        """
+        if token_budget is None:
+            token_budget = int(os.environ.get(CONTEXT_TOKEN_BUDGET_ENV, 1500))
+        self.token_budget = token_budget
+        self.min_recent_turns = min_recent_turns
+        self.summary = summary
+        self.summarized_turns = summarized_turns
+
+    def window_start(self, transcript: Transcript) -> int:
+        """Index of the first turn that fits in the recent window"""
+        lines = transcript.lines()
+        remaining = self.token_budget - estimate_tokens(self.summary)
+        start = len(lines)
+        while start > 0:
+            cost = estimate_tokens(lines[start - 1])
+            if remaining - cost < 0 and len(lines) - start >= self.min_recent_turns:
+                break
+            remaining -= cost
+            start -= 1
+        return start
+
+    def render(self, transcript: Transcript) -> str:
+        """
+        Conversation context for the interviewer prompt
+
+        Turns not yet folded into the summary are always shown verbatim, so a
+        summary update that is still running never hides part of the interview.
+        """
+        recent = "\n".join(transcript.lines()[self.summarized_turns:])
+        if not self.summary:
+            return recent
+        return f"Summary of earlier conversation:\n{self.summary}\n\nRecent conversation:\n{recent}"
+
+    def prepare_update(self, transcript: Transcript) -> Optional[Tuple[int, str]]:
+        """
+        Work out which turns have fallen out of the window since the last fold
+
+        Returns:
+            (new summarized_turns, text of turns to fold), or None if up to date
+        """
+        start = self.window_start(transcript)
+        if start <= self.summarized_turns:
+            return None
+        pending: List[str] = transcript.lines()[self.summarized_turns:start]
+        return start, "\n".join(pending)
+
+    def fold(self, pending: Tuple[int, str], summarize: Callable[[str, str], str]) -> Tuple[int, str]:
+        """
+        Summarise pending turns without changing this context (safe off-thread)
+
+        Args:
+            pending: Result of prepare_update
+            summarize: Callable(previous_summary, new_turns_text) -> new summary
+
+        Returns:
+            (new summarized_turns, updated summary) for apply_update
+        """
+        new_summarized_turns, text = pending
+        return new_summarized_turns, summarize(self.summary, text).strip()
+
+    def apply_update(self, update: Tuple[int, str]) -> str:
+        """
+        Adopt a finished fold
+
+        Args:
+            update: Result of fold
+
+        Returns:
+            Updated summary
+        """
+        self.summarized_turns, self.summary = update
+        return self.summary
+
+    def run_update(self, pending: Tuple[int, str], summarize: Callable[[str, str], str]) -> str:
+        """
+        Fold pending turns into the summary
+
+        Args:
+            pending: Result of prepare_update
+            summarize: Callable(previous_summary, new_turns_text) -> new summary
+
+        Returns:
+            Updated summary
+        """
+        return self.apply_update(self.fold(pending, summarize))
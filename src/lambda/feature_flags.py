@@ -0,0 +1,28 @@
+"""
+Feature Flags
+Boolean switches read from the environment (set per stage in serverless.yml)
+"""
+
+import os
+
+TRUE_VALUES = ('1', 'true', 'yes', 'on')
+FALSE_VALUES = ('0', 'false', 'no', 'off')
+
+
+def env_flag(name: str, default: bool = False) -> bool:
+    """
+    Read a boolean feature flag from the environment
+
+    Args:
+        name: Environment variable name
+        default: Value when the variable is unset, empty or not a recognised boolean
+
+    Returns:
+        True for 1/true/yes/on, False for 0/false/no/off (case-insensitive), else default
+    """
+    value = os.environ.get(name, '').strip().lower()
+    if value in TRUE_VALUES:
+        return True
+    if value in FALSE_VALUES:
+        return False
+    return default
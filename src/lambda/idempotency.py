@@ -0,0 +1,213 @@
+"""
+Idempotent Actions
+A client retry of send_response, end_interview, evaluate or coach (API
+Gateway timeouts, WebSocket reconnects) carries the same idempotency key as
+the original request. The first request claims the key with a conditional
+write and stores its response; a retry gets that response back for a single
+read instead of new model calls and duplicate transcript turns.
+"""
+
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
+from typing import Any, Dict, Optional
+
+from botocore.exceptions import ClientError
+
+TTL_ENV = 'IDEMPOTENCY_TTL_SECONDS'
+LEASE_ENV = 'IDEMPOTENCY_LEASE_SECONDS'
+
+# Stored responses are replayable for a day
+DEFAULT_TTL_SECONDS = 86400
+
+# A claim older than the longest Lambda timeout belongs to a request that died
+DEFAULT_LEASE_SECONDS = 300
+
+# Actions that change state or call a model; reads are safe to repeat as-is
+IDEMPOTENT_ACTIONS = ('start_interview', 'send_response', 'end_interview', 'evaluate', 'coach')
+
+KEY_HEADER = 'idempotency-key'
+KEY_FIELD = 'idempotency_key'
+
+IN_PROGRESS = 'in_progress'
+COMPLETED = 'completed'
+
+_KEY_PATTERN = re.compile(r'^[A-Za-z0-9_.:\-]{1,128}$')
+
+# Event fields that are transport details, not part of the request
+_UNFINGERPRINTED = ('idempotency_key', 'headers', 'multiValueHeaders', 'requestContext', 'body', 'isBase64Encoded')
+
+
+class IdempotencyError(Exception):
+    """Request cannot run under its idempotency key"""
+    status_code = 400
+
+
+class RequestInProgressError(IdempotencyError):
+    """The original request with this key is still running"""
+    status_code = 409
+
+
+class KeyReuseError(IdempotencyError):
+    """The key was already used for a different request"""
+    status_code = 422
+
+
+def idempotency_key(event: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Optional[str]:
+    """
+    Client idempotency key of a request
+
+    Args:
+        event: Action payload (idempotency_key field)
+        headers: HTTP headers of the original event (Idempotency-Key header)
+
+    Returns:
+        The key, or None if the client sent none
+
+    Raises:
+        IdempotencyError: Key is not 1-128 letters, digits or _ . : -
+    """
+    key = event.get(KEY_FIELD)
+    if key is None and headers:
+        key = next((value for name, value in headers.items() if name.lower() == KEY_HEADER), None)
+    if key is None:
+        return None
+    if not isinstance(key, str) or not _KEY_PATTERN.match(key):
+        raise IdempotencyError("Idempotency key must be 1-128 characters of letters, digits, _ . : -")
+    return key
+
+
+def request_fingerprint(event: Dict[str, Any]) -> str:
+    """Hash of the request fields, so a key cannot be replayed for a different request"""
+    request = {field: value for field, value in event.items() if field not in _UNFINGERPRINTED}
+    return hashlib.sha256(json.dumps(request, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class IdempotencyStore:
+    """
+    Claims and stored responses per idempotency key
+
+    claim() conditionally writes an in-progress record (or takes over one
+    whose lease expired); complete() stores the response body; release()
+    drops a claim whose request failed so a retry runs it again.
+    """
+
+    def __init__(self, table, codec=None, ttl_seconds: Optional[int] = None, lease_seconds: Optional[int] = None):
+        """
+        Args:
+            table: DynamoDB Table resource for interview_idempotency_keys (TTL on expires_at)
+            codec: StorageCodec for response bodies (None stores them inline)
+            ttl_seconds: How long responses stay replayable
+                         (defaults to $IDEMPOTENCY_TTL_SECONDS, then a day)
+            lease_seconds: How long an unfinished claim blocks retries
+                           (defaults to $IDEMPOTENCY_LEASE_SECONDS, then 300)
+        """
+        if ttl_seconds is None:
+            ttl_seconds = int(os.environ.get(TTL_ENV, DEFAULT_TTL_SECONDS))
+        if lease_seconds is None:
+            lease_seconds = int(os.environ.get(LEASE_ENV, DEFAULT_LEASE_SECONDS))
+        self.table = table
+        self.codec = codec
+        self.ttl_seconds = ttl_seconds
+        self.lease_seconds = lease_seconds
+
+    def claim(self, key: str, fingerprint: str) -> Dict[str, Any]:
+        """
+        Claim a key for a new request, or find the response to replay
+
+        Args:
+            key: Client idempotency key
+            fingerprint: request_fingerprint of the request
+
+        Returns:
+            {'token': ...} for a new claim (pass it to complete/release), or
+            {'response': {...}} with the stored status code and body
+
+        Raises:
+            RequestInProgressError: The original request still holds the key
+            KeyReuseError: The key belongs to a different request
+        """
+        now = int(time.time())
+        token = str(uuid.uuid4())
+        try:
+            self.table.put_item(
+                Item={
+                    'idempotency_key': key,
+                    'fingerprint': fingerprint,
+                    'record_status': IN_PROGRESS,
+                    'claim_token': token,
+                    'lease_expires_at': now + self.lease_seconds,
+                    'expires_at': now + self.ttl_seconds
+                },
+                ConditionExpression='attribute_not_exists(idempotency_key) OR lease_expires_at < :now',
+                ExpressionAttributeValues={':now': now},
+                ReturnValuesOnConditionCheckFailure='ALL_OLD'
+            )
+            return {'token': token}
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            existing = e.response.get('Item')
+
+        # The failed write returns the record when DynamoDB supports it; otherwise read it
+        if existing is None:
+            existing = self.table.get_item(Key={'idempotency_key': key}, ConsistentRead=True).get('Item') or {}
+        else:
+            # Error responses are not converted by the Table resource
+            from boto3.dynamodb.types import TypeDeserializer
+            deserializer = TypeDeserializer()
+            existing = {name: deserializer.deserialize(value) for name, value in existing.items()}
+
+        if existing.get('fingerprint') != fingerprint:
+            raise KeyReuseError("Idempotency key was already used for a different request")
+        if existing.get('record_status') != COMPLETED:
+            raise RequestInProgressError("A request with this idempotency key is still in progress")
+        body = existing.get('response_body')
+        if self.codec is not None:
+            body = self.codec.decode(body)
+        return {'response': {'statusCode': int(existing.get('status_code', 200)), 'body': body}}
+
+    def complete(self, key: str, token: str, response: Dict[str, Any]):
+        """
+        Store the response of a claimed request
+
+        Skipped (with a log line) if the claim was taken over meanwhile, so a
+        slow request never overwrites the response a retry already stored.
+        """
+        body = response['body']
+        if self.codec is not None:
+            body = self.codec.encode(body, f"idempotency/{hashlib.sha256(key.encode('utf-8')).hexdigest()}")
+        try:
+            self.table.update_item(
+                Key={'idempotency_key': key},
+                UpdateExpression=(
+                    'SET record_status = :completed, status_code = :status_code, response_body = :body '
+                    'REMOVE lease_expires_at, claim_token'
+                ),
+                ConditionExpression='claim_token = :token',
+                ExpressionAttributeValues={
+                    ':completed': COMPLETED,
+                    ':status_code': response['statusCode'],
+                    ':body': body,
+                    ':token': token
+                }
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
+            print(f"Idempotency claim for {key} was taken over; response not stored")
+
+    def release(self, key: str, token: str):
+        """Drop a claim whose request failed (errors are not replayed; a retry runs again)"""
+        try:
+            self.table.delete_item(
+                Key={'idempotency_key': key},
+                ConditionExpression='claim_token = :token',
+                ExpressionAttributeValues={':token': token}
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'ConditionalCheckFailedException':
+                raise
@@ -0,0 +1,246 @@
+"""
+Post-Interview Job Queue
+Evaluation and coaching run as queued jobs after end_interview instead of as
+synchronous client-driven actions; the client polls get_status (or is
+notified over its WebSocket) until they finish
+Backed by SQS when $POST_INTERVIEW_QUEUE_URL is set, otherwise by an
+in-process worker pool that can persist pending jobs to a directory
+"""
+
+import os
+import json
+import uuid
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from feature_flags import env_flag
+
+ASYNC_ENV = 'ASYNC_POST_PROCESSING'
+QUEUE_URL_ENV = 'POST_INTERVIEW_QUEUE_URL'
+WORKERS_ENV = 'POST_INTERVIEW_WORKERS'
+QUEUE_DIR_ENV = 'POST_INTERVIEW_QUEUE_DIR'
+
+DEFAULT_WORKERS = 2
+
+# Local stand-in for the SQS redrive policy (maxReceiveCount)
+MAX_ATTEMPTS = 3
+
+# Job kinds, in pipeline order, and the session attribute holding each one's status
+JOB_STATUS_ATTRIBUTES = {
+    'evaluate': 'evaluation_status',
+    'coach': 'coaching_status'
+}
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def async_post_processing_enabled() -> bool:
+    """True if $ASYNC_POST_PROCESSING makes end_interview queue evaluation and coaching"""
+    return env_flag(ASYNC_ENV)
+
+
+def new_job(kind: str, interview_id: str, notify: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Build a job message
+
+    Args:
+        kind: evaluate or coach
+        interview_id: Interview the job belongs to
+        notify: WebSocket connection to tell when the job finishes (optional)
+    """
+    if kind not in JOB_STATUS_ATTRIBUTES:
+        raise ValueError(f"Unknown job kind: {kind}")
+    return {
+        'job_id': str(uuid.uuid4()),
+        'kind': kind,
+        'interview_id': interview_id,
+        'notify': notify,
+        'enqueued_at': datetime.utcnow().isoformat()
+    }
+
+
+class JobStatusStore:
+    """
+    Job status attributes on the interview_sessions item
+
+    Plain (unversioned) updates of attributes the session writes never
+    touch, so they cannot conflict with the versioned session updates.
+    """
+
+    def __init__(self, table):
+        """
+        Args:
+            table: DynamoDB Table resource for interview_sessions
+        """
+        self.table = table
+
+    def mark(self, interview_id: str, kind: str, status: str, error: Optional[str] = None):
+        """Record a job's status (and the error of a failed attempt)"""
+        attribute = JOB_STATUS_ATTRIBUTES[kind]
+        expression = f"SET {attribute} = :status, {attribute}_at = :at"
+        values = {':status': status, ':at': datetime.utcnow().isoformat()}
+        if error is not None:
+            expression += f", {attribute}_error = :error"
+            values[':error'] = error[:1000]
+        else:
+            expression += f" REMOVE {attribute}_error"
+        self.table.update_item(
+            Key={'interview_id': interview_id},
+            UpdateExpression=expression,
+            ExpressionAttributeValues=values
+        )
+
+    def get(self, interview_id: str) -> Dict[str, Dict[str, Optional[str]]]:
+        """
+        Status of every job kind
+
+        Returns:
+            kind -> {'status': ..., 'updated_at': ..., 'error': ...}
+            (status None if the job was never queued)
+        """
+        attributes = []
+        for attribute in JOB_STATUS_ATTRIBUTES.values():
+            attributes += [attribute, f"{attribute}_at", f"{attribute}_error"]
+        item = self.table.get_item(
+            Key={'interview_id': interview_id},
+            ProjectionExpression=', '.join(attributes),
+            ConsistentRead=True
+        ).get('Item') or {}
+        return {
+            kind: {
+                'status': item.get(attribute),
+                'updated_at': item.get(f"{attribute}_at"),
+                'error': item.get(f"{attribute}_error")
+            }
+            for kind, attribute in JOB_STATUS_ATTRIBUTES.items()
+        }
+
+
+class SQSJobQueue:
+    """Jobs sent to SQS; job_worker_handler consumes them via the event source mapping"""
+
+    def __init__(self, sqs_client, queue_url: str):
+        """
+        Args:
+            sqs_client: boto3 SQS client
+            queue_url: Queue URL
+        """
+        self.sqs_client = sqs_client
+        self.queue_url = queue_url
+
+    def enqueue(self, job: Dict[str, Any]):
+        """Send one job"""
+        self.sqs_client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(job))
+
+
+class LocalJobQueue:
+    """
+    In-process stand-in for SQS plus its Lambda consumer
+
+    Jobs run on a bounded worker pool and are retried up to MAX_ATTEMPTS
+    times. With a directory, each pending job is also written there and only
+    removed once it has finished, so jobs left by a stopped process are run
+    again on the next start. Only for local runs: Lambda freezes the worker
+    threads as soon as an invocation returns.
+    """
+
+    def __init__(self, handler: Callable[[Dict[str, Any]], None], max_workers: int = DEFAULT_WORKERS,
+                 directory: Optional[str] = None):
+        """
+        Args:
+            handler: Processes one job; raises to have it retried
+            max_workers: Jobs processed at once
+            directory: Where pending jobs are persisted (optional)
+        """
+        self.handler = handler
+        self.max_workers = max_workers
+        self.directory = directory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending = set()
+        self._lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            for name in sorted(os.listdir(directory)):
+                if name.endswith('.json'):
+                    with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+                        self._submit(json.load(f))
+
+    def _submit(self, job: Dict[str, Any]):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='post-interview')
+            future = self._executor.submit(self._run, job)
+            self._pending.add(future)
+        future.add_done_callback(self._finished)
+
+    def _finished(self, future):
+        with self._lock:
+            self._pending.discard(future)
+
+    def _path(self, job: Dict[str, Any]) -> str:
+        return os.path.join(self.directory, f"{job['job_id']}.json")
+
+    def enqueue(self, job: Dict[str, Any]):
+        """Persist (if configured) and schedule one job"""
+        if self.directory:
+            path = self._path(job)
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(job, f)
+            os.replace(path + '.tmp', path)
+        self._submit(job)
+
+    def _run(self, job: Dict[str, Any]):
+        for attempt in range(1, MAX_ATTEMPTS + 1):
+            try:
+                self.handler(job)
+                break
+            except Exception as e:
+                print(f"Post-interview job {job['kind']} attempt {attempt} Error: {str(e)}")
+        if self.directory:
+            try:
+                os.remove(self._path(job))
+            except OSError:
+                pass
+
+    def drain(self, timeout: Optional[float] = None):
+        """Wait until every job queued so far (and any it queued in turn) has finished"""
+        while True:
+            with self._lock:
+                pending = list(self._pending)
+            if not pending:
+                return
+            for future in pending:
+                future.result(timeout=timeout)
+
+
+def job_queue_from_env(handler: Callable[[Dict[str, Any]], None]):
+    """
+    Queue selected by the environment
+
+    Args:
+        handler: Job processor used by the local queue (SQS jobs are
+                 delivered to the worker Lambda instead)
+
+    Returns:
+        SQSJobQueue if $POST_INTERVIEW_QUEUE_URL is set, otherwise LocalJobQueue
+    """
+    queue_url = os.environ.get(QUEUE_URL_ENV)
+    if queue_url:
+        from aws_clients import lazy_client
+        return SQSJobQueue(lazy_client('sqs'), queue_url)
+    return LocalJobQueue(
+        handler,
+        max_workers=int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS)),
+        directory=os.environ.get(QUEUE_DIR_ENV)
+    )
+
+
+def jobs_from_sqs_event(event: Dict[str, Any]) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """(message ID, job) for each record of an SQS-triggered Lambda event"""
+    for record in event.get('Records', []):
+        yield record['messageId'], json.loads(record['body'])
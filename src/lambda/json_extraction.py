@@ -0,0 +1,258 @@
+"""
+Tolerant JSON Extraction
+Model replies wrap their JSON in prose or code fences, leave trailing commas
+or stop mid-object at the token limit. The extractor pulls the first valid
+object out of the text (fed whole or delta by delta as it streams), closes a
+truncated one at its last complete member, and validates the result against
+the JSON schema subset used by api_handlers.get_response_schemas so only the
+broken fields need a (short) repair call.
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+REPAIR_SYSTEM_PROMPT = """You fix specific fields of a JSON object produced by another model.
+You get the object, the fields that are missing or invalid with the problem and the schema for each, and the source material.
+Return only JSON with exactly those fields, corrected to match their schema. Do not return any other field."""
+
+# Commas (latest first) tried as the cut point when closing a truncated object
+MAX_PARTIAL_CANDIDATES = 20
+
+
+def _strip_trailing_commas(text: str) -> str:
+    """Remove commas directly before a closing bracket (outside strings)"""
+    out = []
+    in_string = escape = False
+    for i, c in enumerate(text):
+        if in_string:
+            if escape:
+                escape = False
+            elif c == '\\':
+                escape = True
+            elif c == '"':
+                in_string = False
+        elif c == '"':
+            in_string = True
+        elif c == ',':
+            rest = text[i + 1:].lstrip()
+            if rest[:1] in ('}', ']'):
+                continue
+        out.append(c)
+    return ''.join(out)
+
+
+def relaxed_loads(text: str) -> Any:
+    """json.loads that also accepts trailing commas; raises ValueError if still invalid"""
+    try:
+        return json.loads(text)
+    except ValueError:
+        return json.loads(_strip_trailing_commas(text))
+
+
+class JSONObjectExtractor:
+    """
+    First complete JSON object in text that arrives in pieces
+
+    feed() scans only the new text, tracking string and bracket state from
+    the first '{'; when that object closes but does not parse, the search
+    resumes at the next '{'. Usable directly as an on_delta callback.
+    """
+
+    def __init__(self):
+        self.text = ''
+        self.result: Optional[Dict[str, Any]] = None
+        self._scan = 0
+        self._restart()
+
+    def _restart(self):
+        self._start: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self._cuts: List[Tuple[int, Tuple[str, ...]]] = []  # (comma position, open brackets there)
+
+    def feed(self, delta: str) -> Optional[Dict[str, Any]]:
+        """
+        Add text
+
+        Returns:
+            The first valid object once it is complete, otherwise None
+        """
+        if self.result is not None:
+            return self.result
+        self.text += delta
+        i = self._scan
+        while i < len(self.text):
+            c = self.text[i]
+            if self._start is None:
+                if c == '{':
+                    self._start, self._stack = i, ['}']
+            elif self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif c == '\\':
+                    self._escape = True
+                elif c == '"':
+                    self._in_string = False
+            elif c == '"':
+                self._in_string = True
+            elif c in '{[':
+                self._stack.append('}' if c == '{' else ']')
+            elif c == ',':
+                self._cuts.append((i, tuple(self._stack)))
+            elif c in '}]':
+                if c != self._stack[-1]:
+                    i = self._abandon()
+                    continue
+                self._stack.pop()
+                if not self._stack:
+                    try:
+                        value = relaxed_loads(self.text[self._start:i + 1])
+                    except ValueError:
+                        value = None
+                    if isinstance(value, dict):
+                        self.result = value
+                        self._scan = i + 1
+                        return value
+                    i = self._abandon()
+                    continue
+            i += 1
+        self._scan = i
+        return None
+
+    def _abandon(self) -> int:
+        """Give up on the current candidate; returns where the search resumes"""
+        resume = self._start + 1
+        self._restart()
+        return resume
+
+    def partial(self) -> Optional[Dict[str, Any]]:
+        """
+        Best-effort object from a candidate the text ended inside of
+
+        Closes the open brackets, first after all the text (unless it ends
+        inside a string) and otherwise at the latest comma that leaves valid
+        JSON, dropping the unfinished member.
+        """
+        if self.result is not None:
+            return self.result
+        if self._start is None:
+            return None
+        candidates = []
+        if not self._in_string:
+            candidates.append((len(self.text), tuple(self._stack)))
+        candidates += list(reversed(self._cuts))[:MAX_PARTIAL_CANDIDATES]
+        for end, stack in candidates:
+            try:
+                value = relaxed_loads(self.text[self._start:end] + ''.join(reversed(stack)))
+            except ValueError:
+                continue
+            if isinstance(value, dict):
+                return value
+        return None
+
+
+def extract_json(text: str, allow_partial: bool = False) -> Optional[Dict[str, Any]]:
+    """
+    First JSON object in a model reply
+
+    Args:
+        text: Full reply (prose, code fences and trailing text are skipped)
+        allow_partial: Close a truncated object instead of returning None
+
+    Returns:
+        The object, or None if there is none
+    """
+    extractor = JSONObjectExtractor()
+    value = extractor.feed(text)
+    if value is None and allow_partial:
+        value = extractor.partial()
+    return value
+
+
+def _has_type(value: Any, expected: str) -> bool:
+    if expected == 'object':
+        return isinstance(value, dict)
+    if expected == 'array':
+        return isinstance(value, list)
+    if expected == 'string':
+        return isinstance(value, str)
+    if expected == 'boolean':
+        return isinstance(value, bool)
+    if expected == 'integer':
+        return isinstance(value, int) and not isinstance(value, bool)
+    if expected == 'number':
+        return isinstance(value, (int, float)) and not isinstance(value, bool)
+    return True
+
+
+def schema_errors(value: Any, schema: Dict[str, Any], path: str = '') -> List[Tuple[str, str]]:
+    """
+    Check a value against a JSON schema
+
+    Supports the subset api_handlers.get_response_schemas uses: type,
+    properties, required, items, enum, minimum and maximum.
+
+    Returns:
+        (path, problem) per violation, e.g. ('scores.problem_solving', 'is missing')
+    """
+    expected = schema.get('type')
+    if expected and not _has_type(value, expected):
+        return [(path, f"must be of type {expected}")]
+
+    errors = []
+    if 'enum' in schema and value not in schema['enum']:
+        errors.append((path, f"must be one of {schema['enum']}"))
+    if _has_type(value, 'number'):
+        if 'minimum' in schema and value < schema['minimum']:
+            errors.append((path, f"must be at least {schema['minimum']}"))
+        if 'maximum' in schema and value > schema['maximum']:
+            errors.append((path, f"must be at most {schema['maximum']}"))
+    if isinstance(value, dict):
+        for name in schema.get('required', []):
+            if name not in value:
+                errors.append((f"{path}.{name}" if path else name, 'is missing'))
+        for name, subschema in schema.get('properties', {}).items():
+            if name in value:
+                errors += schema_errors(value[name], subschema, f"{path}.{name}" if path else name)
+    if isinstance(value, list) and 'items' in schema:
+        for index, item in enumerate(value):
+            errors += schema_errors(item, schema['items'], f"{path}[{index}]")
+    return errors
+
+
+def malformed_fields(errors: List[Tuple[str, str]]) -> List[str]:
+    """Top-level fields with at least one violation, in order"""
+    fields = [path.split('.')[0].split('[')[0] for path, _ in errors]
+    return list(dict.fromkeys(field for field in fields if field))
+
+
+def repair_prompt(value: Dict[str, Any], schema: Dict[str, Any], errors: List[Tuple[str, str]], source: str) -> str:
+    """
+    User prompt asking for only the malformed fields
+
+    Args:
+        value: Object as extracted
+        schema: Schema it must match
+        errors: schema_errors(value, schema)
+        source: Material the fields are derived from (e.g. the transcript)
+    """
+    fields = malformed_fields(errors)
+    properties = schema.get('properties', {})
+    problems = "\n".join(f"- {path}: {problem}" for path, problem in errors)
+    field_schemas = json.dumps({field: properties.get(field, {}) for field in fields}, indent=2)
+    valid = {key: item for key, item in value.items() if key not in fields}
+    return f"""
+        Object (valid fields):
+        {json.dumps(valid, indent=2, default=str)}
+
+        Fields to return: {', '.join(fields)}
+        Problems:
+        {problems}
+
+        Schema of those fields:
+        {field_schemas}
+
+        Source:
+        {source}
+        """
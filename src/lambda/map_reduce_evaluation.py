@@ -0,0 +1,211 @@
+"""
+Map-Reduce Transcript Evaluation
+Long transcripts are split at question boundaries into chunks that are
+evaluated concurrently; the chunk results are merged with the evaluator
+rubric weights, so wall-clock time follows the longest chunk instead of
+the whole interview
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from feature_flags import env_flag
+from evaluation_rubric import EVALUATION_RUBRIC
+from json_extraction import extract_json
+from bedrock_metrics import estimate_tokens
+from transcript import format_turn
+from turn_evaluation import DIMENSIONS, readiness_level, ranked_notes
+
+MAP_REDUCE_ENV = 'MAP_REDUCE_EVALUATION'
+CHUNK_TOKENS_ENV = 'EVALUATION_CHUNK_TOKENS'
+WORKERS_ENV = 'EVALUATION_WORKERS'
+
+# Transcripts that fit in one chunk keep the single evaluator call
+DEFAULT_CHUNK_TOKENS = 3000
+DEFAULT_WORKERS = 4
+
+
+def _chunk_system_prompt() -> str:
+    """Segment evaluator prompt, built from the evaluator rubric"""
+    criteria = "\n".join(
+        f"- {key}: {label} - {description} (0-{weight} points)" for key, label, description, weight in EVALUATION_RUBRIC
+    )
+    breakdown = ', '.join(f'"{key}": 0' for key, _, _, _ in EVALUATION_RUBRIC)
+    dimensions = ', '.join(f'"{dimension}": 0' for dimension in DIMENSIONS)
+    return f"""You evaluate one segment of a job interview transcript. Other segments are evaluated separately.
+Judge only the answers in this segment, relative to the candidate's experience level.
+Award points per rubric criterion:
+{criteria}
+Also score each dimension from 0 to 10: {', '.join(DIMENSIONS)}.
+Return only JSON:
+{{"scoreBreakdown": {{{breakdown}}}, "scores": {{{dimensions}}},
+ "strengths": ["<short phrase>"], "weaknesses": ["<short phrase>"], "improvement_areas": ["<short phrase>"],
+ "topics_strong": ["<topic>"], "topics_weak": ["<topic>"], "assessment": "<one sentence>"}}"""
+
+
+CHUNK_SYSTEM_PROMPT = _chunk_system_prompt()
+
+
+def map_reduce_enabled() -> bool:
+    """True if $MAP_REDUCE_EVALUATION turns chunked evaluation on"""
+    return env_flag(MAP_REDUCE_ENV)
+
+
+def chunk_token_budget() -> int:
+    """Estimated transcript tokens per chunk"""
+    return int(os.environ.get(CHUNK_TOKENS_ENV, DEFAULT_CHUNK_TOKENS))
+
+
+def evaluation_workers() -> int:
+    """Chunk evaluations in flight at once (bounds concurrent Bedrock calls)"""
+    return int(os.environ.get(WORKERS_ENV, DEFAULT_WORKERS))
+
+
+def question_segments(turns: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+    """
+    Split turns into question segments
+
+    Each segment is an interviewer turn and the candidate turns answering it;
+    segments with no answer (e.g. the closing question) are dropped.
+    """
+    segments: List[List[Dict[str, Any]]] = []
+    for turn in turns:
+        if turn['role'] == 'interviewer' or not segments:
+            segments.append([])
+        segments[-1].append(turn)
+    return [segment for segment in segments if any(t['role'] == 'candidate' for t in segment)]
+
+
+def chunk_segments(segments: List[List[Dict[str, Any]]], max_tokens: int) -> List[List[Dict[str, Any]]]:
+    """
+    Pack consecutive segments into chunks of at most max_tokens
+
+    A segment is never split; one longer than the budget gets a chunk of its own.
+    """
+    chunks: List[List[Dict[str, Any]]] = []
+    current: List[Dict[str, Any]] = []
+    current_tokens = 0
+    for segment in segments:
+        tokens = sum(estimate_tokens(format_turn(turn)) for turn in segment)
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.extend(segment)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def answer_weight(chunk: List[Dict[str, Any]]) -> int:
+    """Merge weight of a chunk: estimated tokens the candidate spoke in it"""
+    return sum(estimate_tokens(turn['content']) for turn in chunk if turn['role'] == 'candidate') or 1
+
+
+def _clamped(values: Any, limits: Dict[str, float]) -> Dict[str, float]:
+    """Numeric entries of a model-returned dict, clamped to [0, limit]"""
+    clamped = {}
+    if not isinstance(values, dict):
+        return clamped
+    for key, limit in limits.items():
+        try:
+            clamped[key] = min(float(limit), max(0.0, float(values[key])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return clamped
+
+
+def parse_chunk_evaluation(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract a segment evaluation from a model reply
+
+    Returns:
+        Dict with score_breakdown (rubric points), scores (0-10), note lists
+        and assessment, or None if it has no usable scores
+    """
+    raw = extract_json(text, allow_partial=True)
+    if raw is None:
+        return None
+
+    breakdown = _clamped(raw.get('scoreBreakdown'), {key: weight for key, _, _, weight in EVALUATION_RUBRIC})
+    scores = _clamped(raw.get('scores'), {dimension: 10 for dimension in DIMENSIONS})
+    if not breakdown and not scores:
+        return None
+
+    def notes(field: str) -> List[str]:
+        value = raw.get(field)
+        return [str(note) for note in value] if isinstance(value, list) else []
+
+    return {
+        'score_breakdown': breakdown,
+        'scores': scores,
+        'strengths': notes('strengths'),
+        'weaknesses': notes('weaknesses'),
+        'improvement_areas': notes('improvement_areas'),
+        'topics_strong': notes('topics_strong'),
+        'topics_weak': notes('topics_weak'),
+        'assessment': str(raw.get('assessment') or '').strip()
+    }
+
+
+def _weighted_means(results: List[Tuple[Dict[str, Any], int]], field: str) -> Dict[str, float]:
+    """Weighted mean of each key of a per-chunk score dict, over the chunks that have it"""
+    totals: Dict[str, List[float]] = {}
+    for evaluation, weight in results:
+        for key, value in evaluation[field].items():
+            total = totals.setdefault(key, [0.0, 0.0])
+            total[0] += value * weight
+            total[1] += weight
+    return {key: value / weight for key, (value, weight) in totals.items()}
+
+
+def _unique(items: List[str]) -> List[str]:
+    """Items in first-seen order without repeats"""
+    return list(dict.fromkeys(item for item in items if item))
+
+
+def merge_chunk_evaluations(results: List[Tuple[Dict[str, Any], int]]) -> Dict[str, Any]:
+    """
+    Merge segment evaluations into one interview evaluation
+
+    Rubric points and dimension scores are averaged across chunks weighted by
+    how much the candidate said in each; the rubric score is the sum of the
+    criterion points (scaled up if a criterion was never scored), and the
+    overall score is that on the 0-10 scale. When no chunk returned rubric
+    points, the overall score is the mean of the dimension scores instead.
+
+    Args:
+        results: (parse_chunk_evaluation output, answer_weight) per chunk, in transcript order
+
+    Returns:
+        Evaluation fields: scores, score_breakdown, rubric_score, overall_score,
+        readiness_level, note lists, technical_depth, overall_assessment
+    """
+    breakdown = _weighted_means(results, 'score_breakdown')
+    scores = {key: round(value, 2) for key, value in _weighted_means(results, 'scores').items()}
+    scored_weight = sum(weight for key, _, _, weight in EVALUATION_RUBRIC if key in breakdown)
+    if scored_weight:
+        rubric_score = round(sum(breakdown.values()) * 100 / scored_weight, 2)
+        overall = round(rubric_score / 10, 2)
+    else:
+        # parse_chunk_evaluation keeps a chunk only if it has points or scores
+        overall = round(sum(scores.values()) / len(scores), 2)
+        rubric_score = round(overall * 10, 2)
+
+    evaluations = [evaluation for evaluation, _ in results]
+    return {
+        'scores': scores,
+        'score_breakdown': {key: round(value, 2) for key, value in breakdown.items()},
+        'rubric_score': rubric_score,
+        'overall_score': overall,
+        'readiness_level': readiness_level(overall),
+        'strengths': ranked_notes(s for e in evaluations for s in e['strengths']),
+        'weaknesses': ranked_notes(w for e in evaluations for w in e['weaknesses']),
+        'improvement_areas': ranked_notes(a for e in evaluations for a in e['improvement_areas']),
+        'technical_depth': {
+            'topics_strong': _unique([t for e in evaluations for t in e['topics_strong']]),
+            'topics_weak': _unique([t for e in evaluations for t in e['topics_weak']])
+        },
+        'overall_assessment': ' '.join(e['assessment'] for e in evaluations if e['assessment']),
+        'chunks_evaluated': len(results)
+    }
@@ -0,0 +1,199 @@
+"""
+Bedrock Model Router
+Picks a model per call type from config/aws_bedrock_config.json
+Degrades to a faster fallback model while the preferred one is slow or throttled,
+probing it periodically so it can recover
+"""
+
+import os
+import json
+import time
+import threading
+from pathlib import Path
+from typing import Any, Dict, NamedTuple, Optional, Set, Tuple
+
+DEFAULT_CONFIG_PATH = Path(__file__).resolve().parent.parent.parent / 'config' / 'aws_bedrock_config.json'
+CONFIG_PATH_ENV = 'BEDROCK_CONFIG_PATH'
+
+# Deployment overrides for the agent models (see serverless.yml)
+AGENT_MODEL_ENV = {
+    'interviewer_agent': 'BEDROCK_INTERVIEWER_MODEL',
+    'evaluator_agent': 'BEDROCK_EVALUATOR_MODEL',
+    'coach_agent': 'BEDROCK_COACH_MODEL'
+}
+
+# Used when the config file has no model_routing section
+DEFAULT_ROUTING = {
+    'greeting': {'model': 'claude_3_haiku'},
+    'follow_up': {'agent': 'interviewer_agent', 'fallback': 'claude_3_haiku', 'hedge_percentile': 95},
+    'summary': {'model': 'claude_3_haiku'},
+    'speculation': {'agent': 'interviewer_agent', 'fallback': 'claude_3_haiku'},
+    'turn_evaluation': {'model': 'claude_3_sonnet', 'fallback': 'claude_3_haiku'},
+    'evaluation_chunk': {'agent': 'evaluator_agent', 'fallback': 'claude_3_sonnet', 'latency_threshold_ms': 30000},
+    'evaluation': {'agent': 'evaluator_agent', 'fallback': 'claude_3_sonnet', 'latency_threshold_ms': 30000},
+    'evaluation_repair': {'model': 'claude_3_sonnet', 'fallback': 'claude_3_haiku'},
+    'coaching_draft': {'agent': 'coach_agent', 'fallback': 'claude_3_sonnet', 'latency_threshold_ms': 30000},
+    'coaching_reconcile': {'model': 'claude_3_haiku', 'fallback': 'claude_3_sonnet'},
+    'coaching': {'agent': 'coach_agent', 'fallback': 'claude_3_sonnet', 'latency_threshold_ms': 30000},
+    'latency_threshold_ms': 8000,
+    'latency_probe_seconds': 60,
+    'throttle_cooldown_seconds': 30
+}
+
+FALLBACK_MODEL_ID = 'anthropic.claude-3-sonnet-20240229-v1:0'
+
+# Weight of the newest sample in each call type's per-model latency average
+LATENCY_EWMA_ALPHA = 0.3
+
+
+class ModelChoice(NamedTuple):
+    """Model selected for one Bedrock call"""
+    model_id: str
+    max_tokens: int
+    temperature: Optional[float]
+    reason: str
+
+
+class ModelRouter:
+    """Routes each Bedrock call type to a model, aware of observed latency and throttling"""
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None, config_path: Optional[str] = None):
+        """
+        Args:
+            config: Parsed aws_bedrock_config.json (loaded from disk if omitted)
+            config_path: Path to the config file
+                         (defaults to $BEDROCK_CONFIG_PATH, then config/aws_bedrock_config.json)
+        """
+        if config is None:
+            path = Path(config_path or os.environ.get(CONFIG_PATH_ENV) or DEFAULT_CONFIG_PATH)
+            try:
+                with open(path, 'r') as f:
+                    config = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Model routing config unavailable ({e}); using defaults")
+                config = {}
+
+        self.models = config.get('bedrock_models', {})
+        self.agents = config.get('agent_configurations', {})
+        self.routing = dict(DEFAULT_ROUTING, **config.get('model_routing', {}))
+        self.latency_threshold_ms = float(self.routing['latency_threshold_ms'])
+        self.latency_probe_interval = float(self.routing['latency_probe_seconds'])
+        self.throttle_cooldown = float(self.routing['throttle_cooldown_seconds'])
+
+        self._lock = threading.Lock()
+        # Latency is tracked per (call_type, model_id): a long evaluation says
+        # nothing about how fast the same model answers a follow-up
+        self._latency_ms: Dict[Tuple[str, str], float] = {}
+        self._probed_at: Dict[Tuple[str, str], float] = {}
+        self._probing: Set[Tuple[str, str]] = set()
+        self._throttled_at: Dict[str, float] = {}
+
+    def _resolve(self, name: str) -> ModelChoice:
+        """Resolve a bedrock_models key or agent_configurations key to a model"""
+        if name in self.agents:
+            agent = self.agents[name]
+            model_id = os.environ.get(AGENT_MODEL_ENV.get(name, ''), agent.get('model_id', FALLBACK_MODEL_ID))
+            return ModelChoice(model_id, int(agent.get('max_tokens', 2000)), agent.get('temperature'), name)
+        if name in self.models:
+            model = self.models[name]
+            return ModelChoice(model['model_id'], int(model.get('max_tokens', 2000)), model.get('temperature'), name)
+        return ModelChoice(FALLBACK_MODEL_ID, 2000, None, 'default')
+
+    def preferred(self, call_type: str) -> ModelChoice:
+        """Model configured for a call type, ignoring health"""
+        route = self.routing.get(call_type, {})
+        return self._resolve(route.get('agent') or route.get('model', ''))
+
+    def fallback(self, call_type: str) -> Optional[ModelChoice]:
+        """Configured fallback model for a call type, if any"""
+        fallback = self.routing.get(call_type, {}).get('fallback')
+        return self._resolve(fallback) if fallback else None
+
+    def hedge_percentile(self, call_type: str) -> Optional[float]:
+        """Latency percentile past which a call type is hedged (None: resilience default)"""
+        percentile = self.routing.get(call_type, {}).get('hedge_percentile')
+        return None if percentile is None else float(percentile)
+
+    def latency_threshold(self, call_type: str) -> float:
+        """Average latency (ms) above which a model is too slow for a call type"""
+        return float(self.routing.get(call_type, {}).get('latency_threshold_ms', self.latency_threshold_ms))
+
+    def is_degraded(self, model_id: str, call_type: str) -> bool:
+        """
+        True if a model was throttled recently or is running slow for a call type
+
+        A model that is only slow is let through once per latency_probe_seconds
+        so a fresh sample can clear it; without probes it would never be
+        called again and never recover.
+        """
+        key = (call_type, model_id)
+        with self._lock:
+            now = time.monotonic()
+            throttled_at = self._throttled_at.get(model_id)
+            if throttled_at is not None and now - throttled_at < self.throttle_cooldown:
+                return True
+            if self._latency_ms.get(key, 0.0) <= self.latency_threshold(call_type):
+                self._probed_at.pop(key, None)
+                return False
+            # The probe interval starts when the model is first seen to be slow
+            if now - self._probed_at.setdefault(key, now) >= self.latency_probe_interval:
+                self._probed_at[key] = now
+                self._probing.add(key)
+                return False
+            return True
+
+    def route(self, call_type: str) -> ModelChoice:
+        """
+        Pick the model for a call
+
+        Args:
+            call_type: greeting, follow_up, summary, speculation, turn_evaluation,
+                       evaluation_chunk, evaluation, evaluation_repair, coaching_draft,
+                       coaching_reconcile or coaching
+
+        Returns:
+            Preferred model, or its fallback while the preferred model is degraded
+        """
+        choice = self.preferred(call_type)
+        fallback = self.routing.get(call_type, {}).get('fallback')
+        if fallback and self.is_degraded(choice.model_id, call_type):
+            backup = self._resolve(fallback)
+            if not self.is_degraded(backup.model_id, call_type):
+                return backup._replace(reason=f"{fallback} (fallback: {choice.reason} degraded)")
+        return choice
+
+    def record(self, model_id: str, latency_ms: float, throttled: bool = False, call_type: str = 'default'):
+        """
+        Record the outcome of a call so later routing can react to it
+
+        Args:
+            model_id: Model that served (or throttled) the call
+            latency_ms: Wall-clock latency of the call
+            throttled: The call was throttled (degrades the model for every call type)
+            call_type: Call type the latency is attributed to
+        """
+        key = (call_type, model_id)
+        with self._lock:
+            if throttled:
+                self._throttled_at[model_id] = time.monotonic()
+                return
+            previous = self._latency_ms.get(key)
+            if previous is None or key in self._probing:
+                # A probe's sample replaces the average it was sent to re-check
+                self._probing.discard(key)
+                self._latency_ms[key] = latency_ms
+            else:
+                self._latency_ms[key] = LATENCY_EWMA_ALPHA * latency_ms + (1 - LATENCY_EWMA_ALPHA) * previous
+
+    def stats(self) -> Dict[str, Any]:
+        """Current per-model latency averages and throttle state"""
+        with self._lock:
+            now = time.monotonic()
+            return {
+                'latency_ms': {f"{call_type}:{model_id}": ms for (call_type, model_id), ms in self._latency_ms.items()},
+                'throttled': [m for m, t in self._throttled_at.items() if now - t < self.throttle_cooldown]
+            }
+
+
+# Shared per-container router; health state persists across warm invocations
+MODEL_ROUTER = ModelRouter()
@@ -4,25 +4,111 @@ Coordinates Bedrock Agents: Interviewer, Evaluator, Coach
 Manages interview flow, action groups, and multi-turn conversations
 """
 
+import os
+import sys
 import json
-import boto3
 import uuid
+import time
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from decimal import Decimal
+from typing import Dict, Any, List, Iterator, AsyncIterator, Callable, Optional, Tuple
 from enum import Enum
+from botocore.exceptions import ClientError
 
-# AWS Services
-bedrock_agent_runtime = boto3.client('bedrock-agent-runtime', region_name='us-east-1')
-bedrock_client = boto3.client('bedrock-runtime', region_name='us-east-1')
-bedrock_agent_client = boto3.client('bedrock-agent', region_name='us-east-1')
-dynamodb = boto3.resource('dynamodb', region_name='us-east-1')
-s3_client = boto3.client('s3', region_name='us-east-1')
+# Helper modules sit next to this file; modules shared with the other Lambda
+# functions live one level up, in src/. Lambda loads the handler as
+# src.lambda.orchestrator, so neither directory is on sys.path by default
+_LAMBDA_DIR = os.path.dirname(os.path.abspath(__file__))
+_SRC_DIR = os.path.dirname(_LAMBDA_DIR)
+for _path in (_LAMBDA_DIR, _SRC_DIR):
+    if _path not in sys.path:
+        sys.path.append(_path)
 
-# DynamoDB Tables
-INTERVIEWS_TABLE = dynamodb.Table('interview_sessions')
-EVALUATIONS_TABLE = dynamodb.Table('evaluation_results')
-TRANSCRIPTS_TABLE = dynamodb.Table('interview_transcripts')
-CANDIDATE_PROFILES = dynamodb.Table('candidate_profiles')
+from aws_clients import AWS_CLIENTS, lazy_client, lazy_table
+from storage_codec import STORAGE_CODEC, json_default
+from bedrock_resilience import BEDROCK_RESILIENCE, is_throttle, error_code
+from bedrock_metrics import BEDROCK_METRICS, estimate_tokens
+from prompt_registry import PROMPT_REGISTRY
+from session_store import SessionStore, StaleSessionError
+from transcript import Transcript
+from model_router import MODEL_ROUTER
+from context_manager import RollingContext, SUMMARY_SYSTEM_PROMPT, extractive_summary
+from transcript_store import TranscriptStore, DEFAULT_PAGE_SIZE
+from speculation import SpeculationStore, SPECULATION_SYSTEM_PROMPT, speculation_enabled, parse_variants, choose_variant
+from turn_evaluation import (
+    TurnScoreStore, TURN_SCORING_SYSTEM_PROMPT, SYNTHESIS_INSTRUCTIONS, DIMENSIONS,
+    incremental_evaluation_enabled, parse_turn_score, reduce_turn_scores, answered_questions, readiness_level
+)
+from map_reduce_evaluation import (
+    CHUNK_SYSTEM_PROMPT, map_reduce_enabled, chunk_token_budget, evaluation_workers,
+    question_segments, chunk_segments, answer_weight, parse_chunk_evaluation, merge_chunk_evaluations
+)
+from transcript import format_turn
+from job_queue import (
+    JobStatusStore, async_post_processing_enabled, job_queue_from_env, jobs_from_sqs_event, new_job,
+    QUEUED, RUNNING, DONE, FAILED
+)
+from json_extraction import REPAIR_SYSTEM_PROMPT, extract_json, schema_errors, malformed_fields, repair_prompt
+from api_handlers import get_response_schemas
+from idempotency import (
+    IdempotencyStore, IdempotencyError, IDEMPOTENT_ACTIONS, idempotency_key, request_fingerprint
+)
+from adaptive_stopping import (
+    CLOSING_MESSAGE, SHIFT_TOPIC_INSTRUCTIONS, STOP, SHIFT_TOPIC,
+    adaptive_stopping_enabled, stopping_decision, topic_start
+)
+from coaching_speculation import (
+    DRAFT_INSTRUCTIONS, COACHING_RECONCILE_SYSTEM_PROMPT, AREAS_SECTION,
+    parallel_coaching_enabled, section, merge_coaching, evaluation_digest
+)
+from question_bank import QUESTION_BANK, GREETING_TEMPLATE, TRANSITION_TEMPLATE, question_bank_enabled, follow_ups_per_question
+
+# Evaluator output is validated against the API Evaluation schema
+EVALUATION_SCHEMA = get_response_schemas()['Evaluation']
+
+# Said when a streamed question turns out to repeat an earlier one
+DUPLICATE_CORRECTION_TEMPLATE = " Actually, we've covered that already. Let me ask something different: {question}"
+
+# AWS Services (built on first use; only the clients an action touches are constructed)
+bedrock_client = lazy_client('bedrock-runtime')
+
+# DynamoDB Tables (names from the serverless.yml environment)
+INTERVIEWS_TABLE = lazy_table(os.environ.get('INTERVIEWS_TABLE', 'interview_sessions'))
+EVALUATIONS_TABLE = lazy_table(os.environ.get('EVALUATIONS_TABLE', 'evaluation_results'))
+TRANSCRIPTS_TABLE = lazy_table(os.environ.get('TRANSCRIPTS_TABLE', 'interview_transcript_turns'))
+CANDIDATE_PROFILES = lazy_table('candidate_profiles')
+QUESTION_CACHE_TABLE = lazy_table(os.environ.get('QUESTION_CACHE_TABLE', 'interview_question_cache'))
+TURN_SCORES_TABLE = lazy_table(os.environ.get('TURN_SCORES_TABLE', 'interview_turn_scores'))
+IDEMPOTENCY_TABLE = lazy_table(os.environ.get('IDEMPOTENCY_TABLE', 'interview_idempotency_keys'))
+
+TRANSCRIPT_STORE = TranscriptStore(TRANSCRIPTS_TABLE, STORAGE_CODEC)
+SPECULATION_STORE = SpeculationStore(QUESTION_CACHE_TABLE)
+TURN_SCORE_STORE = TurnScoreStore(TURN_SCORES_TABLE)
+POST_INTERVIEW_STATUS = JobStatusStore(INTERVIEWS_TABLE)
+IDEMPOTENCY_STORE = IdempotencyStore(IDEMPOTENCY_TABLE, STORAGE_CODEC)
+
+# Side work (e.g. context summaries) that runs alongside the main model call
+BACKGROUND_EXECUTOR = ThreadPoolExecutor(max_workers=4)
+
+# Concurrent chunk evaluations of long transcripts (bounded so one evaluation cannot flood Bedrock)
+EVALUATION_EXECUTOR = ThreadPoolExecutor(max_workers=evaluation_workers())
+
+# Agent type reported in BEDROCK_METRICS for each routed call type
+CALL_AGENT_TYPES = {
+    'greeting': 'interviewer',
+    'follow_up': 'interviewer',
+    'speculation': 'interviewer',
+    'summary': 'summarizer',
+    'turn_evaluation': 'evaluator',
+    'evaluation_chunk': 'evaluator',
+    'evaluation': 'evaluator',
+    'evaluation_repair': 'evaluator',
+    'coaching_draft': 'coach',
+    'coaching_reconcile': 'coach',
+    'coaching': 'coach'
+}
 
 
 class InterviewPhase(Enum):
@@ -38,28 +124,154 @@ class InterviewOrchestrator:
     """Main orchestrator class for interview workflow"""
     
     def __init__(self):
-        self.interviewer_model = "anthropic.claude-3-sonnet-20240229-v1:0"
-        self.evaluator_model = "anthropic.claude-3-sonnet-20240229-v1:0"
-        self.coach_model = "anthropic.claude-3-sonnet-20240229-v1:0"
+        # Default models per agent; individual calls are routed by MODEL_ROUTER
+        self.interviewer_model = MODEL_ROUTER.preferred('follow_up').model_id
+        self.evaluator_model = MODEL_ROUTER.preferred('evaluation').model_id
+        self.coach_model = MODEL_ROUTER.preferred('coaching').model_id
         self.interview_id = str(uuid.uuid4())
+        self.job_role = None
+        self.experience_level = None
+        self.phase = InterviewPhase.INIT.value
+        self.version = 0  # Last interview_sessions version this instance saw
         self.conversation_history = []
+        self.context = RollingContext()
+        self.summary_update = None  # Future of the in-flight summary fold
+        self.speculation = None  # Future of the in-flight follow-up speculation
+        self.turn_evaluations = {}  # turn_seq -> Future of its per-turn score (this container)
+        self.coaching_draft = None  # Future of the coaching drafted alongside the last evaluation
+    
+    @property
+    def conversation_history(self) -> List[Dict[str, Any]]:
+        """Raw conversation turns (backed by the incremental transcript)"""
+        return self.transcript.turns
+    
+    @conversation_history.setter
+    def conversation_history(self, turns: List[Dict[str, Any]]):
+        self.transcript = Transcript(turns)
+    
+    @classmethod
+    def from_session_item(cls, item: Dict[str, Any]) -> 'InterviewOrchestrator':
+        """
+        Rehydrate orchestrator state from an interview_sessions item
+        
+        Args:
+            item: DynamoDB item for the interview session
+            
+        Returns:
+            Orchestrator positioned at the stored phase and version
+        """
+        orchestrator = cls()
+        orchestrator.interview_id = item['interview_id']
+        orchestrator.job_role = item.get('job_role')
+        orchestrator.experience_level = item.get('experience_level')
+        orchestrator.phase = item.get('phase', InterviewPhase.INIT.value)
+        orchestrator.version = int(item.get('version', 0))
+        orchestrator.conversation_history = list(item.get('conversation_history', []))
+        orchestrator.context = RollingContext(
+            summary=item.get('context_summary', ''),
+            summarized_turns=int(item.get('summarized_turns', 0))
+        )
+        return orchestrator
+    
+    def _update_session(
+        self,
+        update_expression: str,
+        names: Optional[Dict[str, str]] = None,
+        values: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Apply a versioned update to this interview's session item
+        
+        The write only succeeds if the stored version still matches the one
+        this instance last saw, which is what lets warm containers trust their
+        cached session without reading it first.
+        
+        Raises:
+            StaleSessionError: Another container advanced the session
+        """
+        names = dict(names or {}, **{'#version': 'version'})
+        values = dict(values or {}, **{':expected_version': self.version, ':one': 1, ':zero': 0})
+        
+        try:
+            INTERVIEWS_TABLE.update_item(
+                Key={'interview_id': self.interview_id},
+                UpdateExpression=f"{update_expression}, #version = if_not_exists(#version, :zero) + :one",
+                ConditionExpression='attribute_not_exists(#version) OR #version = :expected_version',
+                ExpressionAttributeNames=names,
+                ExpressionAttributeValues=values
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+                raise StaleSessionError(self.interview_id, self.version)
+            raise
+        
+        self.version += 1
         
     def generate_interviewer_prompt(self) -> str:
-        """Load Interviewer Agent system prompt"""
-        with open('src/agents/interviewer_agent_prompt.md', 'r') as f:
-            return f.read()
+        """Get Interviewer Agent system prompt, specialised for the job role"""
+        return PROMPT_REGISTRY.get_system_prompt('interviewer', getattr(self, 'job_role', None))
+    
+    def retrieval_grounding(self, query: str) -> str:
+        """
+        Reference questions and expected answers relevant to the query
+        
+        Returns:
+            Grounding block, or '' when retrieval is unavailable or the role
+            is not in the corpus (the role-specialised prompt is used instead)
+        """
+        category = QUESTION_BANK.match_category(self.job_role)
+        if category is None:
+            return ''
+        try:
+            # Imported on first use: NumPy stays off the cold-start path
+            from retrieval import QUESTION_INDEX, retrieval_enabled
+            if not retrieval_enabled():
+                return ''
+            return QUESTION_INDEX.grounding(query, category)
+        except Exception as e:
+            print(f"Retrieval grounding Error: {str(e)}")
+            return ''
     
     def generate_evaluator_prompt(self) -> str:
-        """Load Evaluator Agent system prompt"""
-        with open('src/agents/evaluator_agent_prompt.md', 'r') as f:
-            return f.read()
+        """Get Evaluator Agent system prompt"""
+        return PROMPT_REGISTRY.get_system_prompt('evaluator')
     
     def generate_coach_prompt(self) -> str:
-        """Load Coach Agent system prompt"""
-        with open('src/agents/coach_agent_prompt.md', 'r') as f:
-            return f.read()
+        """Get Coach Agent system prompt"""
+        return PROMPT_REGISTRY.get_system_prompt('coach')
+    
+    def _build_request_body(
+        self,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int = 2000,
+        temperature: Optional[float] = None
+    ) -> str:
+        """Build the Anthropic messages request body shared by all Bedrock calls"""
+        body = {
+            'anthropic_version': 'bedrock-2023-06-01',
+            'max_tokens': max_tokens,
+            'system': system_prompt,
+            'messages': [
+                {
+                    'role': 'user',
+                    'content': user_message
+                }
+            ]
+        }
+        if temperature is not None:
+            body['temperature'] = temperature
+        return json.dumps(body)
     
-    def call_bedrock(self, model_id: str, system_prompt: str, user_message: str) -> str:
+    def call_bedrock(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int = 2000,
+        usage: Optional[Dict[str, int]] = None,
+        temperature: Optional[float] = None
+    ) -> str:
         """
         Call AWS Bedrock with specified model and prompt
         
@@ -67,6 +279,9 @@ class InterviewOrchestrator:
             model_id: Bedrock model ID (Claude, Llama, etc.)
             system_prompt: System instructions
             user_message: User input
+            max_tokens: Completion token limit
+            usage: Optional dict filled with input_tokens/output_tokens
+            temperature: Sampling temperature (model default when None)
             
         Returns:
             Model response text
@@ -76,69 +291,536 @@ class InterviewOrchestrator:
                 modelId=model_id,
                 contentType='application/json',
                 accept='application/json',
-                body=json.dumps({
-                    'anthropic_version': 'bedrock-2023-06-01',
-                    'max_tokens': 2000,
-                    'system': system_prompt,
-                    'messages': [
-                        {
-                            'role': 'user',
-                            'content': user_message
-                        }
-                    ]
-                })
+                body=self._build_request_body(system_prompt, user_message, max_tokens, temperature)
             )
             
             response_body = json.loads(response['body'].read())
+            if usage is not None:
+                usage.update(response_body.get('usage', {}))
             return response_body['content'][0]['text']
             
         except Exception as e:
             print(f"Bedrock API Error: {str(e)}")
             raise
     
-    def start_interview(self, job_role: str, experience_level: str) -> Dict[str, Any]:
+    def stream_bedrock(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int = 2000,
+        usage: Optional[Dict[str, int]] = None,
+        temperature: Optional[float] = None
+    ) -> Iterator[str]:
+        """
+        Call AWS Bedrock with the response-stream API and yield text deltas
+        
+        Args:
+            model_id: Bedrock model ID (Claude, Llama, etc.)
+            system_prompt: System instructions
+            user_message: User input
+            max_tokens: Completion token limit
+            usage: Optional dict filled with input_tokens/output_tokens
+            temperature: Sampling temperature (model default when None)
+            
+        Yields:
+            Text deltas in the order the model produces them
+        """
+        try:
+            response = bedrock_client.invoke_model_with_response_stream(
+                modelId=model_id,
+                contentType='application/json',
+                accept='application/json',
+                body=self._build_request_body(system_prompt, user_message, max_tokens, temperature)
+            )
+            
+            for event in response['body']:
+                chunk = event.get('chunk')
+                if not chunk:
+                    continue
+                payload = json.loads(chunk['bytes'])
+                if payload.get('type') == 'content_block_delta':
+                    text = payload.get('delta', {}).get('text')
+                    if text:
+                        yield text
+                elif usage is not None and payload.get('type') == 'message_start':
+                    usage.update(payload.get('message', {}).get('usage', {}))
+                elif usage is not None and payload.get('type') == 'message_delta':
+                    usage.update(payload.get('usage', {}))
+                        
+        except Exception as e:
+            print(f"Bedrock Streaming API Error: {str(e)}")
+            raise
+    
+    async def astream_bedrock(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        max_tokens: int = 2000,
+        usage: Optional[Dict[str, int]] = None,
+        call_type: str = 'follow_up'
+    ) -> AsyncIterator[str]:
+        """
+        Async variant of stream_bedrock for WebSocket / asyncio callers
+        
+        The boto3 event stream is blocking, so each chunk is pulled on the
+        default executor to keep the event loop free between deltas. The call
+        is recorded in BEDROCK_METRICS like invoke() calls are.
+        
+        Args:
+            max_tokens: Completion token limit (the routed limit for call_type)
+            usage: Optional dict filled with input_tokens/output_tokens
+            call_type: MODEL_ROUTER call type the metrics are attributed to
+        """
+        loop = asyncio.get_running_loop()
+        usage = {} if usage is None else usage
+        first_delta = []
+        parts = []
+        started = time.monotonic()
+        deltas = self.stream_bedrock(model_id, system_prompt, user_message, max_tokens, usage)
+        done = object()
+        try:
+            while True:
+                delta = await loop.run_in_executor(None, next, deltas, done)
+                if delta is done:
+                    break
+                if not first_delta:
+                    first_delta.append(time.monotonic())
+                parts.append(delta)
+                yield delta
+        except Exception as e:
+            self._record_metrics(call_type, model_id, started, usage, first_delta,
+                                 status=error_code(e) or type(e).__name__)
+            raise
+        self._record_metrics(call_type, model_id, started, usage, first_delta,
+                             fallback_text=(system_prompt + user_message, ''.join(parts)))
+    
+    def generate(
+        self,
+        model_id: str,
+        system_prompt: str,
+        user_message: str,
+        on_delta: Optional[Callable[[str], None]] = None,
+        max_tokens: int = 2000,
+        usage: Optional[Dict[str, int]] = None,
+        temperature: Optional[float] = None
+    ) -> str:
+        """
+        Get a full completion, forwarding text deltas to on_delta when given
+        
+        Without a callback this is a plain blocking call_bedrock; with one the
+        response-stream API is used so the caller sees the first token early.
+        Token usage reported by the model is copied into `usage` when given.
+        """
+        if on_delta is None:
+            return self.call_bedrock(model_id, system_prompt, user_message, max_tokens, usage, temperature)
+        
+        parts = []
+        for delta in self.stream_bedrock(model_id, system_prompt, user_message, max_tokens, usage, temperature):
+            on_delta(delta)
+            parts.append(delta)
+        return ''.join(parts)
+    
+    def invoke(
+        self,
+        call_type: str,
+        system_prompt: str,
+        user_message: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Tuple[str, str]:
+        """
+        Generate with the model MODEL_ROUTER picks for this call type
+        
+        Latency and throttling are reported back to the router so the next
+        call can fail over to the faster model while this one is degraded.
+        Within a call, BEDROCK_RESILIENCE retries throttling with jittered
+        backoff and moves to the fallback model once retries run out or the
+        model's circuit is open.
+        
+        Args:
+            call_type: A MODEL_ROUTER call type (see CALL_AGENT_TYPES)
+            system_prompt: System instructions
+            user_message: User input
+            on_delta: Optional streaming callback
+            
+        Returns:
+            Tuple of (response text, model ID that served it)
+        """
+        primary = MODEL_ROUTER.route(call_type)
+        candidates = [primary]
+        fallback = MODEL_ROUTER.fallback(call_type)
+        if fallback is not None and fallback.model_id != primary.model_id:
+            candidates.append(fallback)
+        
+        # Once the client has text, a retry or fail-over would repeat or mix it
+        forwarded = []
+        
+        def attempt(choice):
+            def run():
+                usage = {}
+                first_delta = []
+                forward = None
+                if on_delta is not None:
+                    def forward(delta):
+                        if not first_delta:
+                            first_delta.append(time.monotonic())
+                            forwarded.append(choice.model_id)
+                        on_delta(delta)
+                
+                started = time.monotonic()
+                try:
+                    text = self.generate(
+                        choice.model_id, system_prompt, user_message, forward,
+                        choice.max_tokens, usage, choice.temperature
+                    )
+                except Exception as e:
+                    if is_throttle(e):
+                        MODEL_ROUTER.record(choice.model_id, 0, throttled=True)
+                    self._record_metrics(call_type, choice.model_id, started, usage, first_delta,
+                                         status=error_code(e) or type(e).__name__)
+                    raise
+                MODEL_ROUTER.record(choice.model_id, (time.monotonic() - started) * 1000, call_type=call_type)
+                self._record_metrics(call_type, choice.model_id, started, usage, first_delta,
+                                     fallback_text=(system_prompt + user_message, text))
+                return text
+            return run
+        
+        # Hedging would interleave two streams of deltas, so only hedge blocking
+        # calls, and only for call types whose route opts in
+        return BEDROCK_RESILIENCE.call(
+            primary.model_id,
+            attempt(primary),
+            fallbacks=[(choice.model_id, attempt(choice)) for choice in candidates[1:]],
+            hedge=on_delta is None,
+            committed=lambda: bool(forwarded),
+            hedge_percentile=MODEL_ROUTER.hedge_percentile(call_type)
+        )
+    
+    def _record_metrics(
+        self,
+        call_type: str,
+        model_id: str,
+        started: float,
+        usage: Dict[str, int],
+        first_delta: List[float],
+        status: str = 'ok',
+        fallback_text: Optional[Tuple[str, str]] = None
+    ):
+        """Emit the BEDROCK_METRICS record for one model call"""
+        latency_ms = (time.monotonic() - started) * 1000
+        estimated = not usage and fallback_text is not None
+        if estimated:
+            usage = {
+                'input_tokens': estimate_tokens(fallback_text[0]),
+                'output_tokens': estimate_tokens(fallback_text[1])
+            }
+        BEDROCK_METRICS.record(
+            model_id,
+            CALL_AGENT_TYPES.get(call_type, call_type),
+            latency_ms,
+            input_tokens=int(usage.get('input_tokens', 0)),
+            output_tokens=int(usage.get('output_tokens', 0)),
+            ttft_ms=(first_delta[0] - started) * 1000 if first_delta else None,
+            interview_id=self.interview_id,
+            phase=getattr(self.phase, 'value', self.phase),
+            status=status,
+            estimated_tokens=estimated
+        )
+    
+    def _summarize_context(self, previous_summary: str, turns_text: str) -> str:
+        """
+        Fold older turns into the running interview summary
+        
+        Falls back to a model-free extractive summary on error so the context
+        window keeps advancing even when the summariser is unavailable.
+        """
+        user_message = f"""
+        Current summary:
+        {previous_summary or '(none yet)'}
+        
+        New turns to fold in:
+        {turns_text}
+        """
+        try:
+            summary, _ = self.invoke('summary', SUMMARY_SYSTEM_PROMPT, user_message)
+            return summary
+        except Exception as e:
+            print(f"Context summary failed, using extractive fallback: {str(e)}")
+            return extractive_summary(previous_summary, turns_text)
+    
+    def collect_summary(self):
+        """Adopt the background summary fold if it has finished (never waits for it)"""
+        if self.summary_update is not None and self.summary_update.done():
+            self.context.apply_update(self.summary_update.result())
+            self.summary_update = None
+    
+    def _speculate_follow_ups(self, question: str, conversation_context: str):
+        """
+        Prepare follow-up variants for the question just asked (runs in the background)
+        
+        Failures only cost the speculation; the next answer falls back to a
+        normal follow_up call.
+        """
+        user_message = f"""
+        Current interview context:
+        Job Role: {self.job_role}
+        Experience Level: {self.experience_level}
+        
+        Conversation so far:
+        {conversation_context}
+        
+        Question just asked:
+        {question}
+        """
+        try:
+            text, model_id = self.invoke('speculation', SPECULATION_SYSTEM_PROMPT, user_message)
+            variants = parse_variants(text)
+            if variants:
+                SPECULATION_STORE.put(self.interview_id, question, variants, model_id)
+        except Exception as e:
+            print(f"Speculative follow-ups Error: {str(e)}")
+    
+    def speculate(self, question: str, streaming: bool):
+        """
+        Start preparing follow-ups for a question while the candidate answers it
+        
+        Only for streamed (WebSocket) replies, which are finished before the
+        handler returns: an HTTP response is only sent on return, after which
+        Lambda freezes the container, so the speculation would either stall or
+        hold up the response for a whole model call.
+        """
+        if streaming and speculation_enabled():
+            self.speculation = BACKGROUND_EXECUTOR.submit(
+                self._speculate_follow_ups, question, self.context.render(self.transcript)
+            )
+    
+    def wait_for_background(self):
+        """Block until in-flight speculation, turn scoring, summary folding and coaching drafts have finished"""
+        if self.speculation is not None:
+            self.speculation.result()
+            self.speculation = None
+        for future in list(self.turn_evaluations.values()):
+            future.result()
+        # The finished fold is adopted (and stored) with the next turn
+        if self.summary_update is not None:
+            self.summary_update.result()
+        if self.coaching_draft is not None:
+            self.coaching_draft.result()
+    
+    def _score_turn(self, pair: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Score one answered question and store it in interview_turn_scores
+        
+        Args:
+            pair: answered_questions() entry
+            
+        Returns:
+            Turn score, or None if scoring failed (evaluate_interview retries it)
+        """
+        reference = QUESTION_BANK.get(pair['question_id']) if pair.get('question_id') else None
+        reference_text = f"Reference answer: {reference.expected_answer}" if reference else ''
+        user_message = f"""
+        Job Role: {self.job_role}
+        Experience Level: {self.experience_level}
+        
+        Question:
+        {pair['question']}
+        {reference_text}
+        
+        Candidate answer:
+        {pair['answer']}
+        """
+        try:
+            text, model_id = self.invoke('turn_evaluation', TURN_SCORING_SYSTEM_PROMPT, user_message)
+            turn_score = parse_turn_score(text)
+            if turn_score is None:
+                print(f"Turn evaluation returned no scores for turn {pair['turn_seq']}")
+                return None
+            turn_score.update(turn_seq=pair['turn_seq'], question=pair['question'])
+            TURN_SCORE_STORE.put(self.interview_id, turn_score, model_id)
+            return turn_score
+        except Exception as e:
+            print(f"Turn evaluation Error: {str(e)}")
+            return None
+    
+    def evaluate_turn_async(self, turn_seq: int):
+        """
+        Start scoring an answer
+        
+        Args:
+            turn_seq: Transcript index of the candidate turn; call only once the
+                      session write holding it has committed, so a stale attempt
+                      never stores a score under another answer's turn_seq
+        """
+        if not incremental_evaluation_enabled():
+            return
+        pairs = answered_questions(self.transcript.turns[max(0, turn_seq - 1):turn_seq + 1])
+        if pairs:
+            pair = dict(pairs[0], turn_seq=turn_seq)
+            self.turn_evaluations[turn_seq] = BACKGROUND_EXECUTOR.submit(self._score_turn, pair)
+    
+    def length_decision(self) -> Optional[Dict[str, Any]]:
+        """
+        Adaptive stopping decision for the answer about to be recorded
+        
+        Uses the per-turn scores already finished (recent answers may still
+        be being scored, so decisions lag); scores from other containers are
+        read only when this one did not score some of the earlier answers.
+        
+        Returns:
+            stopping_decision() output, or None when adaptive stopping is off
+        """
+        if not adaptive_stopping_enabled():
+            return None
+        turns = self.transcript.turns
+        pairs = answered_questions(turns)
+        scores = {}
+        for seq, future in list(self.turn_evaluations.items()):
+            if future.done() and future.result() is not None:
+                scores[seq] = future.result()
+        if any(p['turn_seq'] not in self.turn_evaluations for p in pairs):
+            try:
+                stored = TURN_SCORE_STORE.get_all(self.interview_id)
+                scores.update({seq: score for seq, score in stored.items() if seq not in scores})
+            except Exception as e:
+                print(f"Turn score lookup Error: {str(e)}")
+        return stopping_decision(list(scores.values()), len(pairs) + 1, topic_start(turns))
+    
+    def prepared_follow_up(self, candidate_answer: str) -> Optional[Tuple[str, str]]:
+        """
+        Speculated follow-up matching the candidate's answer to the last question
+        
+        Returns:
+            Tuple of (question, model ID that prepared it), or None on a miss
+        """
+        turns = self.transcript.turns
+        if not speculation_enabled() or not turns or turns[-1]['role'] != 'interviewer':
+            return None
+        try:
+            prepared = SPECULATION_STORE.get(self.interview_id, turns[-1]['content'])
+        except Exception as e:
+            print(f"Speculation lookup Error: {str(e)}")
+            return None
+        variant = choose_variant(prepared['variants'], candidate_answer) if prepared else None
+        if variant is None or self.repeated_question(variant['question']) is not None:
+            return None
+        return variant['question'], prepared['model_id']
+    
+    def repeated_question(self, question: str) -> Optional[str]:
+        """
+        Earlier interviewer turn that a new question nearly duplicates
+        
+        Returns:
+            The earlier turn's text, or None if the question is new (or the
+            guard is unavailable)
+        """
+        try:
+            # Imported on first use: NumPy stays off the cold-start path
+            from question_guard import QUESTION_GUARD, duplicate_guard_enabled
+            if QUESTION_GUARD is None or not duplicate_guard_enabled():
+                return None
+            asked = [t['content'] for t in self.transcript.turns if t['role'] == 'interviewer']
+            match = QUESTION_GUARD.find_duplicate(question, asked)
+        except Exception as e:
+            print(f"Duplicate question guard Error: {str(e)}")
+            return None
+        if match is None:
+            return None
+        print(f"Duplicate question detected (similarity {match[1]:.2f}): {question}")
+        return asked[match[0]]
+    
+    def next_bank_question(self, warm_up: bool = False, due: bool = False):
+        """
+        Curated question to serve locally instead of a follow_up call
+        
+        A bank question is due at the start of the interview and once the
+        current one has had its adaptive follow-ups.
+        
+        Args:
+            warm_up: Pick the opening question
+            due: Pick one now regardless of follow-ups (replacing a repeat)
+            
+        Returns:
+            BankQuestion, or None when a model-generated follow-up is due (or
+            the role is not in the bank)
+        """
+        if not question_bank_enabled():
+            return None
+        asked = [t['question_id'] for t in self.transcript.turns if t.get('question_id')]
+        if not warm_up and not due:
+            follow_ups = 0
+            for turn in reversed(self.transcript.turns):
+                if turn['role'] != 'interviewer':
+                    continue
+                if turn.get('question_id'):
+                    break
+                follow_ups += 1
+            # Interviews that did not open from the bank stay model-driven
+            if not asked or follow_ups < follow_ups_per_question():
+                return None
+        return QUESTION_BANK.pick(self.job_role, self.experience_level, self.interview_id, asked, warm_up)
+    
+    def start_interview(
+        self,
+        job_role: str,
+        experience_level: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """
         Start a new interview session
         
         Args:
             job_role: Job position (Software Engineer, Data Analyst, PM, etc.)
             experience_level: Fresher / 1-3 yrs / 3+ yrs
+            on_delta: Optional callback receiving greeting text deltas as they stream
             
         Returns:
             Greeting message from Interviewer Agent
         """
         self.job_role = job_role
         self.experience_level = experience_level
+        start_time = datetime.utcnow().isoformat()
+        
+        # Get greeting from Interviewer Agent
+        system_prompt = self.generate_interviewer_prompt()
+        greeting_message = f"Start the interview for a {job_role} position. Candidate experience: {experience_level}."
+        
+        # Warm-up from the local question bank when the role is known; no model call
+        bank_question = self.next_bank_question(warm_up=True)
+        if bank_question is not None:
+            interviewer_response = GREETING_TEMPLATE.format(job_role=job_role, question=bank_question.question)
+            if on_delta is not None:
+                on_delta(interviewer_response)
+            self.transcript.append('interviewer', interviewer_response, question_id=bank_question.question_id)
+        else:
+            interviewer_response, model_id = self.invoke(
+                'greeting',
+                system_prompt,
+                greeting_message,
+                on_delta
+            )
+            
+            # Store in conversation history
+            self.transcript.append('interviewer', interviewer_response, model_id=model_id)
+        self.speculate(interviewer_response, streaming=on_delta is not None)
         
-        # Store interview session in DynamoDB
+        # Store interview session in DynamoDB, greeting included so the
+        # session can be rehydrated by any container
         interview_session = {
             'interview_id': self.interview_id,
             'job_role': job_role,
             'experience_level': experience_level,
-            'start_time': datetime.utcnow().isoformat(),
+            'start_time': start_time,
             'phase': InterviewPhase.INIT.value,
             'questions_count': 0,
-            'conversation_history': []
+            'conversation_history': self.conversation_history,
+            'version': 0
         }
         
         INTERVIEWS_TABLE.put_item(Item=interview_session)
-        
-        # Get greeting from Interviewer Agent
-        system_prompt = self.generate_interviewer_prompt()
-        greeting_message = f"Start the interview for a {job_role} position. Candidate experience: {experience_level}."
-        
-        interviewer_response = self.call_bedrock(
-            self.interviewer_model,
-            system_prompt,
-            greeting_message
-        )
-        
-        # Store in conversation history
-        self.conversation_history.append({
-            'role': 'interviewer',
-            'content': interviewer_response,
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        self.phase = InterviewPhase.INIT.value
+        self.version = 0
         
         return {
             'interview_id': self.interview_id,
@@ -147,31 +829,69 @@ class InterviewOrchestrator:
             'phase': InterviewPhase.INIT.value
         }
     
-    def process_candidate_response(self, candidate_answer: str) -> Dict[str, Any]:
+    def process_candidate_response(
+        self,
+        candidate_answer: str,
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
         """
         Process candidate response and generate next question
         
         Args:
             candidate_answer: Candidate's response to interview question
+            on_delta: Optional callback receiving question text deltas as they stream
             
         Returns:
-            Next interview question from Interviewer Agent
+            Next interview question from Interviewer Agent; with adaptive
+            stopping, the closing message (interview_complete) once the
+            scores have converged
         """
-        # Store candidate response
-        self.conversation_history.append({
-            'role': 'candidate',
-            'content': candidate_answer,
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        # With adaptive stopping, close once the scores have converged and
+        # leave a topic once its answers agree
+        decision = self.length_decision()
+        closing = decision is not None and decision['action'] == STOP
+        shift_topic = decision is not None and decision['action'] == SHIFT_TOPIC
         
-        # Build conversation context
-        conversation_context = "\n".join([
-            f"{turn['role'].upper()}: {turn['content']}" 
-            for turn in self.conversation_history[-6:]  # Last 6 turns
-        ])
+        # Next curated question once this topic has had its follow-ups; otherwise
+        # a follow-up prepared while the candidate was answering, if one fits
+        bank_question = self.next_bank_question(due=shift_topic) if not closing else None
+        prepared = None
+        if bank_question is None and not closing and not shift_topic:
+            prepared = self.prepared_follow_up(candidate_answer)
         
-        # Get next question from Interviewer Agent
-        system_prompt = self.generate_interviewer_prompt()
+        # Store candidate response (scored once the session write commits)
+        candidate_turn = self.transcript.append('candidate', candidate_answer)
+        candidate_seq = len(self.transcript) - 1
+        
+        # Build conversation context: running summary + recent turns under budget.
+        # Turns that fell out of the window are folded into the summary in the
+        # background; the fold is stored with the first session write after it
+        # finishes, so no turn waits on the summariser. Unfolded turns are
+        # rendered verbatim meanwhile.
+        self.collect_summary()
+        pending_summary = None
+        if self.summary_update is None:
+            pending_summary = self.context.prepare_update(self.transcript)
+        conversation_context = self.context.render(self.transcript)
+        if pending_summary is not None:
+            self.summary_update = BACKGROUND_EXECUTOR.submit(
+                self.context.fold, pending_summary, self._summarize_context
+            )
+        
+        # Get next question from Interviewer Agent. With retrieval grounding the
+        # few relevant reference Q&As replace the full role document.
+        grounding = ''
+        if bank_question is None and prepared is None and not closing:
+            grounding = self.retrieval_grounding(self.transcript.window(2))
+        if grounding:
+            system_prompt = PROMPT_REGISTRY.get_system_prompt('interviewer')
+            reference = f"""
+        Reference questions for this role (adapt, do not read verbatim):
+        {grounding}
+        """
+        else:
+            system_prompt = self.generate_interviewer_prompt()
+            reference = ''
         next_question_prompt = f"""
         Current interview context:
         Job Role: {self.job_role}
@@ -179,87 +899,376 @@ class InterviewOrchestrator:
         
         Conversation so far:
         {conversation_context}
-        
+        {reference}{SHIFT_TOPIC_INSTRUCTIONS if shift_topic else ''}
         Based on the candidate's response, generate the next appropriate question.
         """
         
-        interviewer_response = self.call_bedrock(
-            self.interviewer_model,
-            system_prompt,
-            next_question_prompt
-        )
-        
-        # Store in conversation history
-        self.conversation_history.append({
-            'role': 'interviewer',
-            'content': interviewer_response,
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        if closing:
+            interviewer_response = CLOSING_MESSAGE
+            if on_delta is not None:
+                on_delta(interviewer_response)
+            interviewer_turn = self.transcript.append('interviewer', interviewer_response, closing=True)
+        elif bank_question is not None:
+            interviewer_response = TRANSITION_TEMPLATE.format(question=bank_question.question)
+            if on_delta is not None:
+                on_delta(interviewer_response)
+            interviewer_turn = self.transcript.append(
+                'interviewer', interviewer_response, question_id=bank_question.question_id
+            )
+        elif prepared is not None:
+            interviewer_response, model_id = prepared
+            if on_delta is not None:
+                on_delta(interviewer_response)
+            interviewer_turn = self.transcript.append(
+                'interviewer', interviewer_response, model_id=model_id, speculative=True
+            )
+        else:
+            interviewer_response, model_id = self.invoke(
+                'follow_up',
+                system_prompt,
+                next_question_prompt,
+                on_delta
+            )
+            metadata = {'model_id': model_id}
+            if shift_topic:
+                metadata['topic_shift'] = True
+            
+            # Near-repeat of an earlier question: swap in a bank question (free),
+            # else regenerate once with the repeat called out (blocking calls only;
+            # a streamed question can only be corrected by appending)
+            repeated = self.repeated_question(interviewer_response)
+            if repeated is not None:
+                replacement = self.next_bank_question(due=True)
+                if replacement is not None and on_delta is not None:
+                    correction = DUPLICATE_CORRECTION_TEMPLATE.format(question=replacement.question)
+                    on_delta(correction)
+                    interviewer_response += correction
+                    metadata['question_id'] = replacement.question_id
+                elif replacement is not None:
+                    interviewer_response = TRANSITION_TEMPLATE.format(question=replacement.question)
+                    metadata['question_id'] = replacement.question_id
+                elif on_delta is None:
+                    interviewer_response, model_id = self.invoke(
+                        'follow_up',
+                        system_prompt,
+                        next_question_prompt + f"\nThis was already asked; ask about something else: {repeated}\n"
+                    )
+                    metadata['model_id'] = model_id
+            
+            # Store in conversation history
+            interviewer_turn = self.transcript.append('interviewer', interviewer_response, **metadata)
         
-        # Update interview session
-        interview_session = INTERVIEWS_TABLE.get_item(Key={'interview_id': self.interview_id})
-        INTERVIEWS_TABLE.update_item(
-            Key={'interview_id': self.interview_id},
-            UpdateExpression='SET questions_count = questions_count + 1, #phase = :phase, conversation_history = :conv',
-            ExpressionAttributeNames={'#phase': 'phase'},
-            ExpressionAttributeValues={
+        # Append only this turn's two entries; the stored history is never rewritten
+        self._update_session(
+            'SET questions_count = questions_count + :one, #phase = :phase, '
+            'conversation_history = list_append(if_not_exists(conversation_history, :empty), :turns), '
+            'context_summary = :summary, summarized_turns = :summarized',
+            {'#phase': 'phase'},
+            {
                 ':phase': InterviewPhase.IN_PROGRESS.value,
-                ':conv': self.conversation_history
+                ':turns': [candidate_turn, interviewer_turn],
+                ':empty': [],
+                ':summary': self.context.summary,
+                ':summarized': self.context.summarized_turns
             }
         )
+        self.phase = InterviewPhase.IN_PROGRESS.value
         
-        return {
+        # Background work only for turns that are now stored: after a
+        # StaleSessionError the action is replayed on a fresh transcript
+        self.evaluate_turn_async(candidate_seq)
+        if not closing:
+            self.speculate(interviewer_response, streaming=on_delta is not None)
+        
+        result = {
             'interview_id': self.interview_id,
             'status': 'in_progress',
             'message': interviewer_response,
-            'questions_asked': len([t for t in self.conversation_history if t['role'] == 'interviewer']),
+            'questions_asked': self.transcript.questions_asked,
             'phase': InterviewPhase.IN_PROGRESS.value
         }
+        if decision is not None:
+            result['interview_complete'] = closing
+            result['length_decision'] = decision
+        return result
     
-    def end_interview(self) -> Dict[str, Any]:
-        """End interview and move to evaluation"""
+    def end_interview(self, notify: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """
+        End interview and move to evaluation
+        
+        Args:
+            notify: WebSocket connection told when queued jobs finish (optional)
+        """
         
         # Update interview status
-        INTERVIEWS_TABLE.update_item(
-            Key={'interview_id': self.interview_id},
-            UpdateExpression='SET #phase = :phase, end_time = :end_time',
-            ExpressionAttributeNames={'#phase': 'phase'},
-            ExpressionAttributeValues={
+        self._update_session(
+            'SET #phase = :phase, end_time = :end_time, turn_count = :turn_count',
+            {'#phase': 'phase'},
+            {
                 ':phase': InterviewPhase.COMPLETED.value,
-                ':end_time': datetime.utcnow().isoformat()
+                ':end_time': datetime.utcnow().isoformat(),
+                ':turn_count': len(self.transcript)
             }
         )
+        self.phase = InterviewPhase.COMPLETED.value
         
-        # Build full transcript
-        transcript = "\n".join([
-            f"{turn['role'].upper()}: {turn['content']}" 
-            for turn in self.conversation_history
-        ])
+        # Store transcript one item per turn
+        TRANSCRIPT_STORE.write_turns(self.interview_id, self.conversation_history)
+        
+        result = {
+            'interview_id': self.interview_id,
+            'status': 'completed',
+            'message': 'Interview completed. Evaluation in progress...',
+            'phase': InterviewPhase.COMPLETED.value
+        }
+        
+        # Evaluation (then coaching) runs on the job queue; the client polls get_status
+        if async_post_processing_enabled():
+            self.enqueue_post_processing('evaluate', notify)
+            result['jobs'] = {'evaluate': QUEUED}
+        
+        return result
+    
+    def enqueue_post_processing(self, kind: str, notify: Optional[Dict[str, str]] = None):
+        """
+        Queue an evaluate or coach job for this interview
+        
+        Args:
+            kind: evaluate or coach
+            notify: WebSocket connection told when the job finishes (optional)
+        """
+        POST_INTERVIEW_STATUS.mark(self.interview_id, kind, QUEUED)
+        POST_INTERVIEW_QUEUE.enqueue(new_job(kind, self.interview_id, notify))
+    
+    def get_post_processing_status(self) -> Dict[str, Any]:
+        """Status of the queued evaluation and coaching jobs"""
+        jobs = POST_INTERVIEW_STATUS.get(self.interview_id)
+        statuses = {kind: job['status'] for kind, job in jobs.items()}
+        return {
+            'interview_id': self.interview_id,
+            'jobs': jobs,
+            'complete': all(status == DONE for status in statuses.values()),
+            'failed': any(status == FAILED for status in statuses.values())
+        }
+    
+    def stored_evaluation(self) -> Dict[str, Any]:
+        """Evaluation written by evaluate_interview (numbers as int/float)"""
+        item = EVALUATIONS_TABLE.get_item(
+            Key={'interview_id': self.interview_id},
+            ProjectionExpression='evaluation_result'
+        ).get('Item') or {}
+        evaluation = STORAGE_CODEC.decode(item.get('evaluation_result'))
+        if evaluation is None:
+            raise ValueError(f"No evaluation stored for interview {self.interview_id}")
+        return json.loads(json.dumps(evaluation, default=json_default))
+    
+    def evaluate_interview(self) -> Dict[str, Any]:
+        """
+        Evaluate interview using Evaluator Agent
+        
+        With incremental evaluation the answers were scored as they arrived,
+        so this is a reduction plus a short synthesis call. Otherwise a long
+        transcript is evaluated in concurrent chunks and a short one in a
+        single call.
+        
+        With parallel coaching the coach drafts its feedback from the
+        transcript at the same time; the draft is added to the stored
+        evaluation by a separate write once it is ready.
+        """
+        coaching_draft = BACKGROUND_EXECUTOR.submit(self._draft_coaching) if parallel_coaching_enabled() else None
+        self.coaching_draft = coaching_draft
+        
+        if incremental_evaluation_enabled():
+            evaluation_result, evaluator_model = self._evaluate_incrementally()
+        else:
+            evaluation_result, evaluator_model = self._evaluate_chunked() or self._evaluate_transcript()
         
-        # Store transcript
-        TRANSCRIPTS_TABLE.put_item(Item={
+        # Store evaluation in DynamoDB (which rejects floats, so scores go in as Decimal)
+        stored_result = json.loads(json.dumps(evaluation_result, default=str), parse_float=Decimal)
+        item = {
             'interview_id': self.interview_id,
-            'transcript': transcript,
-            'role': self.job_role,
+            'evaluation_result': STORAGE_CODEC.encode(stored_result, f"{self.interview_id}/evaluation_result"),
+            'job_role': self.job_role,
             'experience_level': self.experience_level,
+            'evaluator_model': evaluator_model,
             'timestamp': datetime.utcnow().isoformat()
-        })
+        }
+        EVALUATIONS_TABLE.put_item(Item=item)
+        
+        # The evaluation is not held back for the draft; it is written after
+        # put_item, which would otherwise replace it
+        if coaching_draft is not None:
+            self.coaching_draft = BACKGROUND_EXECUTOR.submit(self._store_coaching_draft, coaching_draft)
+        
+        # Update interview phase
+        self._update_session(
+            'SET #phase = :phase',
+            {'#phase': 'phase'},
+            {':phase': InterviewPhase.EVALUATED.value}
+        )
+        self.phase = InterviewPhase.EVALUATED.value
         
         return {
             'interview_id': self.interview_id,
-            'status': 'completed',
-            'message': 'Interview completed. Evaluation in progress...',
-            'phase': InterviewPhase.COMPLETED.value
+            'status': 'evaluated',
+            'evaluation': evaluation_result,
+            'phase': InterviewPhase.EVALUATED.value
         }
     
-    def evaluate_interview(self) -> Dict[str, Any]:
-        """Evaluate interview using Evaluator Agent"""
+    def _collect_turn_scores(self) -> List[Dict[str, Any]]:
+        """
+        Per-turn scores for every answered question
+        
+        Uses this container's in-flight results first, then scores stored by
+        other containers, and scores whatever is still missing concurrently.
+        """
+        pairs = answered_questions(self.transcript.turns)
+        scores = {}
+        for seq, future in list(self.turn_evaluations.items()):
+            result = future.result()
+            if result is not None:
+                scores[seq] = result
+        
+        if any(p['turn_seq'] not in scores for p in pairs):
+            try:
+                stored = TURN_SCORE_STORE.get_all(self.interview_id)
+                scores.update({seq: score for seq, score in stored.items() if seq not in scores})
+            except Exception as e:
+                print(f"Turn score lookup Error: {str(e)}")
+        
+        missing = [p for p in pairs if p['turn_seq'] not in scores]
+        for turn_score in BACKGROUND_EXECUTOR.map(self._score_turn, missing):
+            if turn_score is not None:
+                scores[turn_score['turn_seq']] = turn_score
+        
+        return [scores[p['turn_seq']] for p in pairs if p['turn_seq'] in scores]
+    
+    def _evaluate_incrementally(self) -> Tuple[Dict[str, Any], str]:
+        """
+        Reduce per-turn scores and synthesise the narrative fields
+        
+        Returns:
+            Tuple of (evaluation, model ID of the synthesis call)
+        """
+        reduced = reduce_turn_scores(self._collect_turn_scores())
+        notes = "\n".join(
+            f"- {q['topic'] or q['question'][:80]}: {q['score']}/10"
+            for q in reduced['question_scores']
+        )
+        synthesis_prompt = f"""
+        Synthesize the evaluation of this interview:
+        
+        Job Role: {self.job_role}
+        Experience Level: {self.experience_level}
+        
+        Scores: {json.dumps(reduced['scores'])}
+        Overall score: {reduced['overall_score']}
+        Readiness level: {reduced['readiness_level']}
+        
+        Per-answer results:
+        {notes}
+        Noted strengths: {json.dumps(reduced['strengths'])}
+        Noted weaknesses: {json.dumps(reduced['weaknesses'])}
+        {SYNTHESIS_INSTRUCTIONS}"""
+        
+        synthesis, evaluator_model = {}, 'turn_scores'
+        try:
+            synthesis_json, evaluator_model = self.invoke('evaluation', self.generate_evaluator_prompt(), synthesis_prompt)
+            synthesis = extract_json(synthesis_json, allow_partial=True)
+        except Exception as e:
+            # The reduction alone is a complete evaluation; only the prose is lost
+            print(f"Evaluation synthesis Error: {str(e)}")
+        
+        evaluation_result = {
+            'role_evaluated': self.job_role,
+            'experience_level': self.experience_level,
+            **(synthesis if isinstance(synthesis, dict) else {})
+        }
+        # Scores always come from the per-turn reduction, never the synthesis
+        evaluation_result.update({k: v for k, v in reduced.items() if k != 'technical_depth'})
+        evaluation_result.setdefault('technical_depth', reduced['technical_depth'])
+        return evaluation_result, evaluator_model
+    
+    def _evaluate_chunk(self, index: int, total: int, chunk: List[Dict[str, Any]]) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Evaluate one chunk of question segments
+        
+        Returns:
+            Tuple of (parsed chunk evaluation, model ID), or None if the call
+            failed or returned no usable scores
+        """
+        segment_text = "\n".join(format_turn(turn) for turn in chunk)
+        chunk_prompt = f"""
+        Evaluate segment {index + 1} of {total} of this interview:
+        
+        Job Role: {self.job_role}
+        Experience Level: {self.experience_level}
+        
+        Transcript segment:
+        {segment_text}
+        
+        Return ONLY JSON evaluation (no additional text).
+        """
+        try:
+            chunk_json, model_id = self.invoke('evaluation_chunk', CHUNK_SYSTEM_PROMPT, chunk_prompt)
+        except Exception as e:
+            print(f"Chunk evaluation Error: {str(e)}")
+            return None
+        
+        chunk_evaluation = parse_chunk_evaluation(chunk_json)
+        if chunk_evaluation is None:
+            print(f"Chunk evaluation {index + 1}/{total} returned no scores")
+            return None
+        return chunk_evaluation, model_id
+    
+    def _evaluate_chunked(self) -> Optional[Tuple[Dict[str, Any], str]]:
+        """
+        Map-reduce evaluation of a long transcript
+        
+        Chunks of question segments are evaluated concurrently on
+        EVALUATION_EXECUTOR and merged with the evaluator rubric weights; the
+        merged evaluation is validated and repaired like a single-call one.
+        
+        Returns:
+            Tuple of (evaluation, evaluator model ID), or None when the
+            transcript fits one chunk, chunking is off, or every chunk failed
+        """
+        if not map_reduce_enabled():
+            return None
+        chunks = chunk_segments(question_segments(self.transcript.turns), chunk_token_budget())
+        if len(chunks) < 2:
+            return None
+        
+        futures = [
+            EVALUATION_EXECUTOR.submit(self._evaluate_chunk, index, len(chunks), chunk)
+            for index, chunk in enumerate(chunks)
+        ]
+        results, models = [], []
+        for chunk, future in zip(chunks, futures):
+            outcome = future.result()
+            if outcome is not None:
+                results.append((outcome[0], answer_weight(chunk)))
+                models.append(outcome[1])
+        if not results:
+            return None
         
+        evaluation_result = {
+            'role_evaluated': self.job_role,
+            'experience_level': self.experience_level,
+            **merge_chunk_evaluations(results),
+            'chunks_failed': len(chunks) - len(results)
+        }
+        return self._repair_evaluation(evaluation_result, self.transcript.render()), models[0]
+    
+    def _evaluate_transcript(self) -> Tuple[Dict[str, Any], str]:
+        """
+        Evaluate the full transcript in one evaluator call
+        
+        Returns:
+            Tuple of (evaluation, evaluator model ID)
+        """
         # Build full transcript
-        transcript = "\n".join([
-            f"{turn['role'].upper()}: {turn['content']}" 
-            for turn in self.conversation_history
-        ])
+        transcript = self.transcript.render()
         
         # Call Evaluator Agent
         system_prompt = self.generate_evaluator_prompt()
@@ -275,59 +1284,82 @@ class InterviewOrchestrator:
         Return ONLY JSON evaluation (no additional text).
         """
         
-        evaluation_json = self.call_bedrock(
-            self.evaluator_model,
+        evaluation_json, evaluator_model = self.invoke(
+            'evaluation',
             system_prompt,
             evaluation_prompt
         )
         
-        # Parse evaluation
-        try:
-            evaluation_result = json.loads(evaluation_json)
-        except:
-            # If JSON parsing fails, return structured error
-            evaluation_result = {
+        # Parse evaluation (prose, code fences and truncation are tolerated)
+        evaluation_result = extract_json(evaluation_json, allow_partial=True)
+        if evaluation_result is None:
+            # If no JSON object can be recovered, return structured error
+            return {
                 'error': 'Evaluation JSON parsing failed',
                 'raw_response': evaluation_json
-            }
+            }, evaluator_model
         
-        # Store evaluation in DynamoDB
-        EVALUATIONS_TABLE.put_item(Item={
-            'interview_id': self.interview_id,
-            'evaluation_result': evaluation_result,
-            'job_role': self.job_role,
-            'experience_level': self.experience_level,
-            'timestamp': datetime.utcnow().isoformat()
-        })
+        return self._repair_evaluation(evaluation_result, transcript), evaluator_model
+    
+    def _derive_evaluation_fields(self, evaluation: Dict[str, Any]):
+        """Fill overall_score and readiness_level from the scores when they are missing or invalid"""
+        scores = evaluation.get('scores')
+        if not schema_errors(scores, EVALUATION_SCHEMA['properties']['scores']) and \
+                schema_errors(evaluation.get('overall_score'), EVALUATION_SCHEMA['properties']['overall_score']):
+            evaluation['overall_score'] = round(sum(scores[d] for d in DIMENSIONS) / len(DIMENSIONS), 2)
+        overall_score = evaluation.get('overall_score')
+        if not schema_errors(overall_score, EVALUATION_SCHEMA['properties']['overall_score']) and \
+                schema_errors(evaluation.get('readiness_level'), EVALUATION_SCHEMA['properties']['readiness_level']):
+            evaluation['readiness_level'] = readiness_level(overall_score)
+    
+    def _repair_evaluation(self, evaluation: Dict[str, Any], transcript: str) -> Dict[str, Any]:
+        """
+        Validate an evaluation against EVALUATION_SCHEMA and fix only what is broken
         
-        # Update interview phase
-        INTERVIEWS_TABLE.update_item(
-            Key={'interview_id': self.interview_id},
-            UpdateExpression='SET #phase = :phase',
-            ExpressionAttributeNames={'#phase': 'phase'},
-            ExpressionAttributeValues={':phase': InterviewPhase.EVALUATED.value}
-        )
+        Fields derivable from the scores are filled locally; any other missing
+        or invalid top-level field is asked for in one short repair call. What
+        still fails validation is listed under validation_errors.
+        """
+        self._derive_evaluation_fields(evaluation)
+        errors = schema_errors(evaluation, EVALUATION_SCHEMA)
+        if not errors:
+            return evaluation
         
-        return {
-            'interview_id': self.interview_id,
-            'status': 'evaluated',
-            'evaluation': evaluation_result,
-            'phase': InterviewPhase.EVALUATED.value
-        }
+        fields = malformed_fields(errors)
+        try:
+            repair_json, _ = self.invoke(
+                'evaluation_repair',
+                REPAIR_SYSTEM_PROMPT,
+                repair_prompt(evaluation, EVALUATION_SCHEMA, errors, transcript)
+            )
+            repaired = extract_json(repair_json, allow_partial=True) or {}
+            evaluation.update({field: repaired[field] for field in fields if field in repaired})
+        except Exception as e:
+            print(f"Evaluation repair Error: {str(e)}")
+        
+        self._derive_evaluation_fields(evaluation)
+        remaining = schema_errors(evaluation, EVALUATION_SCHEMA)
+        if remaining:
+            evaluation['validation_errors'] = [f"{path}: {problem}" for path, problem in remaining]
+        return evaluation
     
-    def generate_coaching_feedback(self, evaluation: Dict[str, Any]) -> Dict[str, Any]:
-        """Generate personalized coaching feedback using Coach Agent"""
+    def _coaching_prompt(self, evaluation: Optional[Dict[str, Any]]) -> str:
+        """Coach user prompt; without an evaluation the coach drafts from the transcript alone"""
+        transcript = self.transcript.render()
         
-        # Build feedback prompt
-        system_prompt = self.generate_coach_prompt()
+        if evaluation is None:
+            return f"""
+        Candidate Interview Summary:
+        Role: {self.job_role}
+        Experience: {self.experience_level}
         
-        # Build transcript
-        transcript = "\n".join([
-            f"{turn['role'].upper()}: {turn['content']}" 
-            for turn in self.conversation_history
-        ])
+        Interview Transcript:
+        {transcript}
         
-        coaching_prompt = f"""
+        Generate personalized coaching feedback and 7-14 day preparation plan.
+        {DRAFT_INSTRUCTIONS}"""
+        
+        return f"""
         Candidate Interview Summary:
         Role: {self.job_role}
         Experience: {self.experience_level}
@@ -340,20 +1372,115 @@ class InterviewOrchestrator:
         
         Generate personalized coaching feedback and 7-14 day preparation plan.
         """
+    
+    def _draft_coaching(self) -> Optional[str]:
+        """Coaching drafted from the transcript while the evaluation runs (None on failure)"""
+        try:
+            draft, _ = self.invoke('coaching_draft', self.generate_coach_prompt(), self._coaching_prompt(None))
+            return draft.strip() or None
+        except Exception as e:
+            print(f"Coaching draft Error: {str(e)}")
+            return None
+    
+    def _store_coaching_draft(self, draft: Future) -> Optional[str]:
+        """
+        Add a finished draft to the stored evaluation (runs in the background)
         
-        coaching_feedback = self.call_bedrock(
-            self.coach_model,
-            system_prompt,
-            coaching_prompt
+        Returns:
+            The draft, or None if drafting failed
+        """
+        coaching_draft = draft.result()
+        if coaching_draft:
+            try:
+                EVALUATIONS_TABLE.update_item(
+                    Key={'interview_id': self.interview_id},
+                    UpdateExpression='SET coaching_draft = :draft',
+                    ConditionExpression='attribute_exists(interview_id)',
+                    ExpressionAttributeValues={
+                        ':draft': STORAGE_CODEC.encode(coaching_draft, f"{self.interview_id}/coaching_draft")
+                    }
+                )
+            except Exception as e:
+                print(f"Coaching draft store Error: {str(e)}")
+        return coaching_draft
+    
+    def _stored_coaching_draft(self) -> Optional[str]:
+        """Draft from this instance's evaluation, or the one stored with the evaluation"""
+        if self.coaching_draft is not None:
+            return self.coaching_draft.result()
+        try:
+            item = EVALUATIONS_TABLE.get_item(
+                Key={'interview_id': self.interview_id},
+                ProjectionExpression='coaching_draft'
+            ).get('Item') or {}
+            return STORAGE_CODEC.decode(item.get('coaching_draft'))
+        except Exception as e:
+            print(f"Coaching draft lookup Error: {str(e)}")
+            return None
+    
+    def _reconcile_coaching(self, draft: str, evaluation: Dict[str, Any]) -> Tuple[str, str]:
+        """
+        Finish a drafted coaching report with the final scores
+        
+        Returns:
+            Tuple of (coaching feedback, model ID of the reconciliation call)
+        """
+        reconcile_prompt = f"""
+        Role: {self.job_role}
+        Experience: {self.experience_level}
+        
+        Final Evaluation:
+        {json.dumps(evaluation_digest(evaluation), indent=2, default=json_default)}
+        
+        Draft Areas To Improve:
+        {section(draft, AREAS_SECTION) or '(none)'}
+        """
+        reconciliation, model_id = self.invoke(
+            'coaching_reconcile',
+            COACHING_RECONCILE_SYSTEM_PROMPT,
+            reconcile_prompt
         )
+        return merge_coaching(draft, reconciliation), model_id
+    
+    def generate_coaching_feedback(
+        self,
+        evaluation: Dict[str, Any],
+        on_delta: Optional[Callable[[str], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Generate personalized coaching feedback using Coach Agent
+        
+        If the coach drafted its feedback alongside the evaluation, only a
+        short reconciliation call is made and the merged report is sent to
+        on_delta in one piece; otherwise the full coaching call streams.
+        """
+        draft = self._stored_coaching_draft() if parallel_coaching_enabled() else None
+        
+        coaching_feedback = None
+        if draft:
+            try:
+                coaching_feedback, coach_model = self._reconcile_coaching(draft, evaluation)
+                if on_delta:
+                    on_delta(coaching_feedback)
+            except Exception as e:
+                print(f"Coaching reconciliation Error: {str(e)}")
+        
+        if coaching_feedback is None:
+            coaching_feedback, coach_model = self.invoke(
+                'coaching',
+                self.generate_coach_prompt(),
+                self._coaching_prompt(evaluation),
+                on_delta
+            )
         
         # Store coaching feedback in DynamoDB
         EVALUATIONS_TABLE.update_item(
             Key={'interview_id': self.interview_id},
-            UpdateExpression='SET coaching_feedback = :feedback, #phase = :phase',
+            UpdateExpression='SET coaching_feedback = :feedback, coach_model = :coach_model, #phase = :phase',
             ExpressionAttributeNames={'#phase': 'phase'},
             ExpressionAttributeValues={
-                ':feedback': coaching_feedback,
+                ':feedback': STORAGE_CODEC.encode(coaching_feedback, f"{self.interview_id}/coaching_feedback"),
+                ':coach_model': coach_model,
                 ':phase': InterviewPhase.COACHED.value
             }
         )
@@ -368,20 +1495,213 @@ class InterviewOrchestrator:
     def get_final_report(self) -> Dict[str, Any]:
         """Generate final interview report with all components"""
         
-        evaluation = EVALUATIONS_TABLE.get_item(Key={'interview_id': self.interview_id})['Item']
-        interview = INTERVIEWS_TABLE.get_item(Key={'interview_id': self.interview_id})['Item']
+        evaluation = EVALUATIONS_TABLE.get_item(
+            Key={'interview_id': self.interview_id},
+            ProjectionExpression='evaluation_result, coaching_feedback'
+        )['Item']
+        # The session item carries the full conversation; only read the report fields
+        interview = INTERVIEWS_TABLE.get_item(
+            Key={'interview_id': self.interview_id},
+            ProjectionExpression='questions_count, start_time, end_time'
+        )['Item']
         
         return {
             'interview_id': self.interview_id,
             'job_role': self.job_role,
             'experience_level': self.experience_level,
             'interview_duration': interview.get('questions_count', 0),
-            'evaluation_scores': evaluation.get('evaluation_result'),
-            'coaching_feedback': evaluation.get('coaching_feedback'),
+            'evaluation_scores': STORAGE_CODEC.decode(evaluation.get('evaluation_result')),
+            'coaching_feedback': STORAGE_CODEC.decode(evaluation.get('coaching_feedback')),
             'start_time': interview.get('start_time'),
             'end_time': interview.get('end_time'),
             'status': 'complete'
         }
+    
+    def get_transcript_page(self, start_seq: int = 0, page_size: int = DEFAULT_PAGE_SIZE) -> Dict[str, Any]:
+        """
+        Get a page of stored transcript turns
+        
+        Args:
+            start_seq: First turn sequence number to return
+            page_size: Maximum number of turns
+            
+        Returns:
+            Turns plus the sequence number to continue from (None when done)
+        """
+        turns, next_seq = TRANSCRIPT_STORE.get_page(self.interview_id, start_seq, page_size)
+        
+        return {
+            'interview_id': self.interview_id,
+            'turns': turns,
+            'next_turn_seq': next_seq
+        }
+
+
+# Warm sessions survive between invocations of the same container
+SESSION_STORE = SessionStore(INTERVIEWS_TABLE, InterviewOrchestrator.from_session_item)
+
+
+def websocket_connection(event: Dict[str, Any]) -> Optional[Dict[str, str]]:
+    """
+    WebSocket connection an event arrived on
+    
+    Args:
+        event: API Gateway event (requestContext carries the connection)
+        
+    Returns:
+        connection_id, domain_name and stage, or None for non-WebSocket events
+    """
+    request_context = event.get('requestContext') or {}
+    if not request_context.get('connectionId'):
+        return None
+    return {
+        'connection_id': request_context['connectionId'],
+        'domain_name': request_context['domainName'],
+        'stage': request_context['stage']
+    }
+
+
+def post_to_connection(connection: Dict[str, str], payload: Dict[str, Any]):
+    """Push one JSON message to a WebSocket client"""
+    management_client = AWS_CLIENTS.client(
+        'apigatewaymanagementapi',
+        endpoint=f"https://{connection['domain_name']}/{connection['stage']}"
+    )
+    management_client.post_to_connection(
+        ConnectionId=connection['connection_id'],
+        Data=json.dumps(payload, default=json_default).encode('utf-8')
+    )
+
+
+def websocket_delta_forwarder(event: Dict[str, Any]) -> Optional[Callable[[str], None]]:
+    """
+    Build a callback that pushes streamed text deltas to a WebSocket client
+    
+    Args:
+        event: API Gateway WebSocket event (requestContext carries the connection)
+        
+    Returns:
+        Delta callback, or None when the event did not arrive over a WebSocket
+    """
+    connection = websocket_connection(event)
+    if connection is None:
+        return None
+    
+    def forward(delta: str) -> None:
+        post_to_connection(connection, {'type': 'delta', 'text': delta})
+    
+    return forward
+
+
+def load_orchestrator(interview_id: Optional[str]) -> InterviewOrchestrator:
+    """
+    Get the orchestrator for an interview, warm from this container if possible
+    
+    Args:
+        interview_id: Existing interview ID (may be None)
+        
+    Returns:
+        Cached or rehydrated orchestrator, or a fresh one if the session is unknown
+    """
+    orchestrator = SESSION_STORE.get(interview_id) if interview_id else None
+    if orchestrator is None:
+        orchestrator = InterviewOrchestrator()
+        if interview_id:
+            orchestrator.interview_id = interview_id
+    return orchestrator
+
+
+def dispatch_action(
+    orchestrator: InterviewOrchestrator,
+    action: str,
+    event: Dict[str, Any],
+    on_delta: Optional[Callable[[str], None]] = None,
+    connection: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Run a single lambda_handler action against an orchestrator"""
+    
+    if action == 'start_interview':
+        job_role = event.get('job_role')
+        experience_level = event.get('experience_level')
+        return orchestrator.start_interview(job_role, experience_level, on_delta)
+        
+    elif action == 'send_response':
+        candidate_answer = event.get('candidate_answer')
+        return orchestrator.process_candidate_response(candidate_answer, on_delta)
+        
+    elif action == 'end_interview':
+        return orchestrator.end_interview(connection)
+        
+    elif action == 'evaluate':
+        return orchestrator.evaluate_interview()
+        
+    elif action == 'coach':
+        evaluation = event.get('evaluation')
+        return orchestrator.generate_coaching_feedback(evaluation, on_delta)
+        
+    elif action == 'get_report':
+        return orchestrator.get_final_report()
+        
+    elif action == 'get_status':
+        return orchestrator.get_post_processing_status()
+        
+    elif action == 'get_transcript':
+        start_seq = int(event.get('start_turn_seq', 0))
+        page_size = int(event.get('page_size', DEFAULT_PAGE_SIZE))
+        return orchestrator.get_transcript_page(start_seq, page_size)
+    
+    return {'error': f'Unknown action: {action}'}
+
+
+def handle_action(
+    event: Dict[str, Any],
+    on_delta: Optional[Callable[[str], None]] = None,
+    connection: Optional[Dict[str, str]] = None
+) -> Dict[str, Any]:
+    """Load (or create) the session, run one action and cache the session"""
+    
+    action = event.get('action')
+    interview_id = event.get('interview_id')
+    
+    # New interviews start fresh; everything else resumes the stored session
+    if action == 'start_interview':
+        orchestrator = InterviewOrchestrator()
+        if interview_id:
+            orchestrator.interview_id = interview_id
+    else:
+        orchestrator = load_orchestrator(interview_id)
+    
+    forwarded = []
+    stream = None
+    if on_delta is not None:
+        def stream(delta: str) -> None:
+            forwarded.append(len(delta))
+            on_delta(delta)
+    
+    try:
+        result = dispatch_action(orchestrator, action, event, stream, connection)
+    except StaleSessionError:
+        # Another container advanced this session (after the version probe in
+        # SESSION_STORE.get): rehydrate and replay once. Text the client already
+        # received is not streamed a second time; the result carries the reply.
+        SESSION_STORE.evict(orchestrator.interview_id)
+        orchestrator = load_orchestrator(orchestrator.interview_id)
+        result = dispatch_action(orchestrator, action, event, None if forwarded else on_delta, connection)
+    except Exception:
+        # In-memory state may be ahead of DynamoDB; force a reload next time
+        SESSION_STORE.evict(orchestrator.interview_id)
+        raise
+    
+    if orchestrator.job_role is not None:
+        SESSION_STORE.put(orchestrator)
+    
+    # Finish the background work before returning so Lambda does not freeze
+    # it mid-call. A streamed question has already reached the candidate; an
+    # HTTP reply waits for the answer's score, which adaptive stopping and the
+    # final evaluation rely on (HTTP turns do not speculate).
+    orchestrator.wait_for_background()
+    
+    return result
 
 
 def lambda_handler(event, context):
@@ -390,51 +1710,59 @@ def lambda_handler(event, context):
     
     Event structure:
     {
-        "action": "start_interview" | "send_response" | "end_interview" | "evaluate" | "coach" | "get_report",
+        "action": "start_interview" | "send_response" | "end_interview" | "evaluate" | "coach" | "get_report" |
+                  "get_status" | "get_transcript",
         "interview_id": "uuid (optional for existing interview)",
         "job_role": "string (required for start_interview)",
         "experience_level": "string (required for start_interview)",
-        "candidate_answer": "string (required for send_response)"
+        "candidate_answer": "string (required for send_response)",
+        "start_turn_seq": "int (optional for get_transcript, default 0)",
+        "page_size": "int (optional for get_transcript)",
+        "idempotency_key": "string (optional; or the Idempotency-Key header)"
     }
+    
+    Over an API Gateway WebSocket the same structure arrives as the JSON body,
+    and interviewer/coach text is pushed to the connection as it streams.
+    With ASYNC_POST_PROCESSING, end_interview queues evaluation and coaching;
+    poll get_status (WebSocket clients are also sent a job_status message).
+    A retried state-changing action with the same idempotency key gets the
+    original response back without running again.
     """
     
     try:
-        action = event.get('action')
-        interview_id = event.get('interview_id')
+        connection = websocket_connection(event)
+        on_delta = websocket_delta_forwarder(event)
+        headers = event.get('headers')
+        if on_delta is not None and isinstance(event.get('body'), str):
+            event = json.loads(event['body'])
         
-        # Use existing orchestrator or create new
-        orchestrator = InterviewOrchestrator()
-        if interview_id:
-            orchestrator.interview_id = interview_id
+        key = idempotency_key(event, headers) if event.get('action') in IDEMPOTENT_ACTIONS else None
+        claim = IDEMPOTENCY_STORE.claim(key, request_fingerprint(event)) if key else None
+        if claim and 'response' in claim:
+            return claim['response']
         
-        if action == 'start_interview':
-            job_role = event.get('job_role')
-            experience_level = event.get('experience_level')
-            result = orchestrator.start_interview(job_role, experience_level)
-            
-        elif action == 'send_response':
-            candidate_answer = event.get('candidate_answer')
-            result = orchestrator.process_candidate_response(candidate_answer)
-            
-        elif action == 'end_interview':
-            result = orchestrator.end_interview()
-            
-        elif action == 'evaluate':
-            result = orchestrator.evaluate_interview()
-            
-        elif action == 'coach':
-            evaluation = event.get('evaluation')
-            result = orchestrator.generate_coaching_feedback(evaluation)
-            
-        elif action == 'get_report':
-            result = orchestrator.get_final_report()
-            
-        else:
-            result = {'error': f'Unknown action: {action}'}
+        try:
+            result = handle_action(event, on_delta, connection)
+        except Exception:
+            if claim:
+                IDEMPOTENCY_STORE.release(key, claim['token'])
+            raise
         
-        return {
+        response = {
             'statusCode': 200,
-            'body': json.dumps(result)
+            'body': json.dumps(result, default=json_default)
+        }
+        if claim:
+            try:
+                IDEMPOTENCY_STORE.complete(key, claim['token'], response)
+            except Exception as e:
+                print(f"Idempotency record Error: {str(e)}")
+        return response
+        
+    except IdempotencyError as e:
+        return {
+            'statusCode': e.status_code,
+            'body': json.dumps({'error': str(e)})
         }
         
     except Exception as e:
@@ -442,6 +1770,96 @@ def lambda_handler(event, context):
             'statusCode': 500,
             'body': json.dumps({'error': str(e)})
         }
+    
+    finally:
+        # No-op unless BEDROCK_METRICS_TABLE is set
+        BEDROCK_METRICS.flush()
+
+
+def run_post_interview_job(job: Dict[str, Any]):
+    """
+    Process one queued evaluate or coach job
+    
+    A finished evaluation queues the coaching job before it is marked done,
+    so a failed enqueue is retried with it; its coaching draft is stored
+    first so the coaching job can use it. Raises on failure so the queue
+    retries it (SQS redelivers the message; the local pool re-runs it).
+    
+    Args:
+        job: Job built by job_queue.new_job
+    """
+    interview_id, kind = job['interview_id'], job['kind']
+    if POST_INTERVIEW_STATUS.get(interview_id)[kind]['status'] == DONE:
+        return  # Redelivered after it already finished
+    
+    POST_INTERVIEW_STATUS.mark(interview_id, kind, RUNNING)
+    
+    def run(orchestrator: InterviewOrchestrator):
+        if kind == 'evaluate':
+            orchestrator.evaluate_interview()
+        else:
+            orchestrator.generate_coaching_feedback(orchestrator.stored_evaluation())
+    
+    try:
+        orchestrator = load_orchestrator(interview_id)
+        try:
+            run(orchestrator)
+        except StaleSessionError:
+            SESSION_STORE.evict(interview_id)
+            orchestrator = load_orchestrator(interview_id)
+            run(orchestrator)
+        if kind == 'evaluate':
+            orchestrator.wait_for_background()
+            orchestrator.enqueue_post_processing('coach', job.get('notify'))
+    except Exception as e:
+        SESSION_STORE.evict(interview_id)
+        POST_INTERVIEW_STATUS.mark(interview_id, kind, FAILED, str(e))
+        notify_job_status(job, FAILED)
+        raise
+    
+    POST_INTERVIEW_STATUS.mark(interview_id, kind, DONE)
+    if orchestrator.job_role is not None:
+        SESSION_STORE.put(orchestrator)
+    notify_job_status(job, DONE)
+
+
+def notify_job_status(job: Dict[str, Any], status: str):
+    """Tell the job's WebSocket client (if any) that it finished; a gone client is ignored"""
+    if not job.get('notify'):
+        return
+    try:
+        post_to_connection(job['notify'], {
+            'type': 'job_status',
+            'interview_id': job['interview_id'],
+            'job': job['kind'],
+            'status': status
+        })
+    except Exception as e:
+        print(f"Job status notification Error: {str(e)}")
+
+
+# SQS in production ($POST_INTERVIEW_QUEUE_URL); an in-process worker pool locally
+POST_INTERVIEW_QUEUE = job_queue_from_env(run_post_interview_job)
+
+
+def job_worker_handler(event, context):
+    """
+    SQS-triggered entry point for post-interview jobs
+    
+    Failed messages are reported individually (ReportBatchItemFailures), so
+    only they are redelivered; after maxReceiveCount they go to the DLQ.
+    """
+    failures = []
+    try:
+        for message_id, job in jobs_from_sqs_event(event):
+            try:
+                run_post_interview_job(job)
+            except Exception as e:
+                print(f"Post-interview job Error: {str(e)}")
+                failures.append({'itemIdentifier': message_id})
+    finally:
+        BEDROCK_METRICS.flush()
+    return {'batchItemFailures': failures}
 
 
 if __name__ == "__main__":
@@ -0,0 +1,180 @@
+"""
+Prompt Registry for Bedrock Agents
+Loads Sophia agent prompts and role fragments once per Lambda container
+Invalidates cached templates when the markdown files change on disk
+"""
+
+import os
+import re
+import time
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+# Prompts ship in src/agents next to this lambda directory unless overridden
+DEFAULT_PROMPTS_ROOT = Path(__file__).resolve().parent.parent / 'agents'
+PROMPTS_ROOT_ENV = 'SOPHIA_PROMPTS_ROOT'
+CHECK_INTERVAL_ENV = 'SOPHIA_PROMPTS_CHECK_INTERVAL'
+
+AGENT_PROMPT_FILES = {
+    'interviewer': 'sophia_interviewer_prompt.md',
+    'evaluator': 'sophia_evaluator_prompt.md',
+    'coach': 'sophia_coach_prompt.md'
+}
+
+ROLE_FRAGMENT_PREFIX = 'role_'
+
+# Role fragments are written in the interviewer's voice
+ROLE_AWARE_AGENTS = ('interviewer',)
+
+
+class PromptRegistry:
+    """Per-container cache of agent prompts and pre-assembled role prompts"""
+
+    def __init__(self, root: Optional[str] = None, check_interval: Optional[float] = None):
+        """
+        Args:
+            root: Directory holding the prompt markdown files
+                  (defaults to $SOPHIA_PROMPTS_ROOT, then src/agents)
+            check_interval: Seconds between on-disk change checks
+                            (defaults to $SOPHIA_PROMPTS_CHECK_INTERVAL, then 60)
+        """
+        self.root = Path(root or os.environ.get(PROMPTS_ROOT_ENV) or DEFAULT_PROMPTS_ROOT)
+        if check_interval is None:
+            check_interval = float(os.environ.get(CHECK_INTERVAL_ENV, 60))
+        self.check_interval = check_interval
+
+        self._files: Dict[str, Tuple[float, int, str]] = {}  # name -> (mtime, size, sha256)
+        self._texts: Dict[str, str] = {}
+        self._assembled: Dict[Tuple[str, Optional[str]], str] = {}
+        self._role_matches: Dict[str, Optional[str]] = {}
+        self._last_check: Optional[float] = None
+        # Background threads (summaries, hedged calls) read prompts concurrently;
+        # without it a reader could see _last_check set before the first load finished
+        self._lock = threading.RLock()
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Rescan the prompt root and reload any file whose mtime or size moved
+
+        A file is only treated as changed when its content hash differs, so a
+        touched-but-identical file does not throw away the assembled prompts.
+
+        Returns:
+            True if any prompt text changed
+        """
+        with self._lock:
+            return self._refresh(force)
+
+    def _refresh(self, force: bool) -> bool:
+        now = time.monotonic()
+        if not force and self._last_check is not None and now - self._last_check < self.check_interval:
+            return False
+        self._last_check = now
+
+        changed = False
+        seen = set()
+        for path in self.root.glob('*.md'):
+            name = path.name
+            if name not in AGENT_PROMPT_FILES.values() and not name.startswith(ROLE_FRAGMENT_PREFIX):
+                continue
+            seen.add(name)
+
+            stat = path.stat()
+            cached = self._files.get(name)
+            if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+                continue
+
+            text = path.read_text(encoding='utf-8')
+            digest = hashlib.sha256(text.encode('utf-8')).hexdigest()
+            if not cached or cached[2] != digest:
+                self._texts[name] = text
+                changed = True
+            self._files[name] = (stat.st_mtime, stat.st_size, digest)
+
+        for name in set(self._files) - seen:
+            del self._files[name]
+            self._texts.pop(name, None)
+            changed = True
+
+        if changed:
+            self._assembled.clear()
+            self._role_matches.clear()
+            self._assemble_all()
+
+        return changed
+
+    def _assemble_all(self):
+        """Pre-assemble every agent prompt and every interviewer/role combination"""
+        for agent_type in AGENT_PROMPT_FILES:
+            base = self._texts.get(AGENT_PROMPT_FILES[agent_type])
+            if base is None:
+                continue
+            self._assembled[(agent_type, None)] = base
+            if agent_type not in ROLE_AWARE_AGENTS:
+                continue
+            for role_key in self.role_keys():
+                fragment = self._texts[f"{ROLE_FRAGMENT_PREFIX}{role_key}.md"]
+                self._assembled[(agent_type, role_key)] = f"{base}\n\n{fragment}"
+
+    def role_keys(self):
+        """Role fragment keys currently loaded (e.g. 'python_backend')"""
+        return sorted(
+            name[len(ROLE_FRAGMENT_PREFIX):-len('.md')]
+            for name in self._texts
+            if name.startswith(ROLE_FRAGMENT_PREFIX)
+        )
+
+    def match_role(self, job_role: Optional[str]) -> Optional[str]:
+        """
+        Map a free-text job role to a role fragment key
+
+        A fragment matches when every word of its key appears in the job role,
+        so 'Python Backend Engineer' resolves to 'python_backend'. The most
+        specific (longest) match wins.
+        """
+        if not job_role:
+            return None
+        if job_role in self._role_matches:
+            return self._role_matches[job_role]
+
+        words = set(re.findall(r'[a-z0-9]+', job_role.lower()))
+        best = None
+        for role_key in self.role_keys():
+            key_words = role_key.split('_')
+            if all(word in words for word in key_words):
+                if best is None or len(key_words) > len(best.split('_')):
+                    best = role_key
+
+        self._role_matches[job_role] = best
+        return best
+
+    def get_system_prompt(self, agent_type: str, job_role: Optional[str] = None) -> str:
+        """
+        Get the system prompt for an agent, specialised for the job role when
+        a matching role fragment exists
+
+        Args:
+            agent_type: interviewer, evaluator or coach
+            job_role: Free-text job role from the interview session
+
+        Returns:
+            Pre-assembled system prompt text
+        """
+        if agent_type not in AGENT_PROMPT_FILES:
+            raise ValueError(f"Unknown agent type: {agent_type}")
+
+        with self._lock:
+            self.refresh()
+            role_key = self.match_role(job_role) if agent_type in ROLE_AWARE_AGENTS else None
+            prompt = self._assembled.get((agent_type, role_key))
+        if prompt is None:
+            raise FileNotFoundError(
+                f"Prompt file {AGENT_PROMPT_FILES[agent_type]} not found under {self.root}"
+            )
+        return prompt
+
+
+# Shared per-container registry; files are read on first use, not at import
+PROMPT_REGISTRY = PromptRegistry()
@@ -0,0 +1,217 @@
+"""
+Local Question Bank
+In-memory index of the curated InterviewTrendsDataGenerator questions, keyed
+by role, level and trend, built once per container
+Serves warm-up and standard questions with no model call; Bedrock is only
+needed for the adaptive follow-ups in between
+"""
+
+import os
+import re
+import hashlib
+import threading
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from feature_flags import env_flag
+
+QUESTION_BANK_ENV = 'LOCAL_QUESTION_BANK'
+FOLLOW_UPS_ENV = 'QUESTION_BANK_FOLLOW_UPS'
+
+LEVELS = ('junior', 'mid', 'senior')
+
+# Words that do not tell roles apart ("Python Backend Engineer" -> python backend)
+GENERIC_ROLE_WORDS = {'engineer', 'developer', 'senior', 'junior', 'lead', 'staff', 'principal'}
+
+GREETING_TEMPLATE = (
+    "Hi, I'm Sophia, and I'll be your interviewer today for the {job_role} position. "
+    "Let's start with a warm-up question: {question}"
+)
+
+TRANSITION_TEMPLATE = "Thanks, let's move on to another topic. {question}"
+
+
+class BankQuestion(NamedTuple):
+    """One curated question"""
+    question_id: str
+    category: str
+    role: str
+    level: str
+    trend: str
+    question: str
+    expected_answer: str
+
+
+def question_bank_enabled() -> bool:
+    """True unless $LOCAL_QUESTION_BANK turns the local bank off"""
+    return env_flag(QUESTION_BANK_ENV, default=True)
+
+
+def follow_ups_per_question() -> int:
+    """Adaptive follow-ups asked on a bank question before moving to the next one"""
+    return int(os.environ.get(FOLLOW_UPS_ENV, 2))
+
+
+def experience_to_level(experience_level: Optional[str]) -> str:
+    """
+    Map free-text experience ('Fresher', '1-3 yrs', '3+ years') to a bank level
+
+    Returns:
+        junior, mid or senior
+    """
+    text = (experience_level or '').lower()
+    for level in LEVELS:
+        if level in text:
+            return level
+    if any(word in text for word in ('fresher', 'entry', 'intern', 'graduate')):
+        return 'junior'
+    years = re.findall(r'\d+', text)
+    if not years:
+        return 'mid'
+    first = int(years[0])
+    if first < 1:
+        return 'junior'
+    if first < 3 and '+' not in text:
+        return 'mid'
+    return 'senior'
+
+
+def role_words(role: str) -> Tuple[str, ...]:
+    """Distinguishing words of a role name"""
+    return tuple(w for w in re.findall(r'[a-z0-9]+', role.lower()) if w not in GENERIC_ROLE_WORDS)
+
+
+class QuestionBank:
+    """
+    Role/level/trend index over the curated trend questions
+
+    The index is built on first use (not at import) and shared by every
+    interview in the container. Entries are immutable tuples, so lookups need
+    no locking once the index exists.
+    """
+
+    def __init__(self, source: Optional[Dict[str, List[Dict]]] = None):
+        """
+        Args:
+            source: Category -> question dicts, as returned by
+                    InterviewTrendsDataGenerator.generate_all_trends_data()
+                    (generated on first use if omitted)
+        """
+        self._source = source
+        self._lock = threading.Lock()
+        self._by_role_level: Optional[Dict[Tuple[str, str], Tuple[BankQuestion, ...]]] = None
+        self._by_trend: Dict[Tuple[str, str], Tuple[BankQuestion, ...]] = {}
+        self._by_id: Dict[str, BankQuestion] = {}
+        self._role_keys: Dict[str, Tuple[str, ...]] = {}
+
+    def _index(self) -> Dict[Tuple[str, str], Tuple[BankQuestion, ...]]:
+        """Build the index once"""
+        if self._by_role_level is not None:
+            return self._by_role_level
+        with self._lock:
+            if self._by_role_level is None:
+                source = self._source
+                if source is None:
+                    from trends_data_generator import InterviewTrendsDataGenerator
+                    source = InterviewTrendsDataGenerator().generate_all_trends_data()
+
+                by_role_level: Dict[Tuple[str, str], List[BankQuestion]] = {}
+                by_trend: Dict[Tuple[str, str], List[BankQuestion]] = {}
+                for category, items in source.items():
+                    for position, item in enumerate(items):
+                        entry = BankQuestion(
+                            question_id=f"{category}:{position}",
+                            category=category,
+                            role=item['role'],
+                            level=item['level'],
+                            trend=item['trend'],
+                            question=item['question'],
+                            expected_answer=item.get('expected_answer', '')
+                        )
+                        self._by_id[entry.question_id] = entry
+                        self._role_keys.setdefault(category, role_words(item['role']))
+                        by_role_level.setdefault((category, entry.level), []).append(entry)
+                        by_trend.setdefault((category, entry.trend.lower()), []).append(entry)
+
+                self._by_trend = {key: tuple(entries) for key, entries in by_trend.items()}
+                self._by_role_level = {key: tuple(entries) for key, entries in by_role_level.items()}
+        return self._by_role_level
+
+    def match_category(self, job_role: Optional[str]) -> Optional[str]:
+        """
+        Map a free-text job role to a bank category
+
+        A category matches when every distinguishing word of its role name
+        appears in the job role (spaces ignored, so 'Fullstack Developer'
+        matches 'Full Stack Engineer'); the most specific match wins.
+        """
+        if not job_role:
+            return None
+        self._index()
+        words = role_words(job_role)
+        compact = ''.join(words)
+        best, best_len = None, 0
+        for category, key_words in self._role_keys.items():
+            if key_words and (all(w in words for w in key_words) or ''.join(key_words) in compact):
+                if len(key_words) > best_len:
+                    best, best_len = category, len(key_words)
+        return best
+
+    def questions(self, category: str, level: Optional[str] = None, trend: Optional[str] = None) -> Tuple[BankQuestion, ...]:
+        """Questions for a category, filtered by level and/or trend"""
+        index = self._index()
+        if trend is not None:
+            entries = self._by_trend.get((category, trend.lower()), ())
+            return tuple(e for e in entries if level is None or e.level == level)
+        if level is not None:
+            return index.get((category, level), ())
+        return tuple(e for lvl in LEVELS for e in index.get((category, lvl), ()))
+
+    def get(self, question_id: str) -> Optional[BankQuestion]:
+        """Question by ID"""
+        self._index()
+        return self._by_id.get(question_id)
+
+    def pick(
+        self,
+        job_role: Optional[str],
+        experience_level: Optional[str],
+        seed: str,
+        asked: Iterable[str] = (),
+        warm_up: bool = False
+    ) -> Optional[BankQuestion]:
+        """
+        Choose an unasked question for the candidate
+
+        Args:
+            job_role: Free-text job role
+            experience_level: Free-text experience level
+            seed: Stable per-interview value (e.g. interview ID) so different
+                  interviews get different questions
+            asked: Question IDs already asked in this interview
+            warm_up: Prefer the easiest level at or below the candidate's
+
+        Returns:
+            A question, or None if the role is not in the bank or every
+            matching question was asked
+        """
+        category = self.match_category(job_role)
+        if category is None:
+            return None
+
+        target = LEVELS.index(experience_to_level(experience_level))
+        # Own level first, then easier, then harder; a warm-up starts easiest
+        order = list(range(target, -1, -1)) + list(range(target + 1, len(LEVELS)))
+        if warm_up:
+            order = list(range(0, target + 1)) + list(range(target + 1, len(LEVELS)))
+
+        asked = set(asked)
+        for level_index in order:
+            candidates = [q for q in self.questions(category, LEVELS[level_index]) if q.question_id not in asked]
+            if candidates:
+                offset = int(hashlib.sha256(f"{seed}:{len(asked)}".encode('utf-8')).hexdigest(), 16)
+                return candidates[offset % len(candidates)]
+        return None
+
+
+# Shared per-container bank; the index is built on first use, not at import
+QUESTION_BANK = QuestionBank()
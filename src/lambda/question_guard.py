@@ -0,0 +1,170 @@
+"""
+Duplicate Question Guard
+MinHash signatures over each interviewer question, compared against every
+question already asked in one batched NumPy operation, so a near-identical
+re-ask can be replaced before the candidate spends a turn on it
+"""
+
+import re
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Set, Tuple
+
+from feature_flags import env_flag
+from retrieval import np, STOP_WORDS
+
+# Mersenne prime for the (a * x + b) mod p hash family; with a < 2^31 and
+# 32-bit shingle hashes every a * x + b fits in uint64
+MERSENNE_PRIME = (1 << 61) - 1
+
+GUARD_ENV = 'DUPLICATE_QUESTION_GUARD'
+
+DEFAULT_NUM_PERM = 64
+
+# Estimated Jaccard over content-word shingles above which two questions count as the same
+DEFAULT_THRESHOLD = 0.5
+
+# How a question is phrased, not what it asks about
+QUESTION_FRAME_WORDS = {
+    'could', 'tell', 'walk', 'through', 'explain', 'describe', 'difference', 'between', 'versus', 'vs',
+    'us', 'about', 'some', 'example', 'give', 'please', 'thanks', 'great', 'let', 'let\'s', 'talk'
+}
+
+
+
+def question_text(turn_text: str) -> str:
+    """
+    The question part of an interviewer turn
+
+    Turns usually open with an acknowledgement ("Great, thanks."), which
+    must not make two different questions look alike.
+    """
+    questions = [s.strip() for s in re.findall(r'[^.!?]*\?', turn_text) if s.strip()]
+    return ' '.join(questions) if questions else turn_text
+
+
+def duplicate_guard_enabled() -> bool:
+    """True unless $DUPLICATE_QUESTION_GUARD turns the guard off"""
+    return env_flag(GUARD_ENV, default=True)
+
+
+def stem(word: str) -> str:
+    """Crude suffix stripping so 'designing'/'design' and 'threads'/'thread' match"""
+    if len(word) > 5 and word.endswith('ing'):
+        return word[:-3]
+    if len(word) > 4 and word.endswith('ed'):
+        return word[:-2]
+    if word.endswith('es') and word[:-2].endswith(('s', 'x', 'ch', 'sh')):
+        return word[:-2]
+    if len(word) > 3 and word.endswith('s') and not word.endswith('ss'):
+        return word[:-1]
+    return word
+
+
+def shingles(text: str) -> Set[str]:
+    """Stemmed content words of a question and their adjacent pairs"""
+    words = [
+        stem(word) for word in re.findall(r"[a-z0-9+#']+", text.lower())
+        if word not in STOP_WORDS and word not in QUESTION_FRAME_WORDS
+    ]
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+
+class DuplicateQuestionGuard:
+    """MinHash near-duplicate detector for interviewer questions"""
+
+    def __init__(
+        self,
+        num_perm: int = DEFAULT_NUM_PERM,
+        threshold: float = DEFAULT_THRESHOLD,
+        seed: int = 1,
+        max_cached: int = 4096
+    ):
+        """
+        Args:
+            num_perm: Hash functions per signature (more = finer Jaccard estimate)
+            threshold: Estimated Jaccard at or above which a question is a duplicate
+            seed: Seed for the hash family (signatures are only comparable under one seed)
+            max_cached: Signatures memoized per container (questions recur every turn)
+        """
+        rng = np.random.default_rng(seed)
+        self.num_perm = num_perm
+        self.threshold = threshold
+        self._a = rng.integers(1, 1 << 31, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, MERSENNE_PRIME, size=num_perm, dtype=np.uint64)
+        self._cache: 'OrderedDict[str, np.ndarray]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_cached = max_cached
+
+    def signature(self, text: str):
+        """
+        MinHash signature of a question's shingles
+
+        Returns:
+            uint64 array of length num_perm, or None if the text has no content words
+        """
+        key = question_text(text)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
+
+        question_shingles = shingles(key)
+        if not question_shingles:
+            return None
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') for s in question_shingles),
+            dtype=np.uint64, count=len(question_shingles)
+        )
+        # (num_perm, shingles) in one shot, then min per hash function
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % np.uint64(MERSENNE_PRIME)
+        signature = permuted.min(axis=1)
+
+        with self._lock:
+            self._cache[key] = signature
+            while len(self._cache) > self.max_cached:
+                self._cache.popitem(last=False)
+        return signature
+
+    def similarities(self, text: str, asked: List[str]):
+        """
+        Estimated Jaccard similarity of a question to each asked question
+
+        Questions without content words (no signature) are never compared and score 0.
+        """
+        scores = np.zeros(len(asked))
+        signature = self.signature(text)
+        if signature is None:
+            return scores
+        previous = [(index, self.signature(question)) for index, question in enumerate(asked)]
+        previous = [(index, sig) for index, sig in previous if sig is not None]
+        if previous:
+            indexes = [index for index, _ in previous]
+            signatures = np.stack([sig for _, sig in previous])
+            scores[indexes] = (signatures == signature[None, :]).mean(axis=1)
+        return scores
+
+    def find_duplicate(self, text: str, asked: List[str]) -> Optional[Tuple[int, float]]:
+        """
+        Most similar asked question, if it is a near-duplicate
+
+        Args:
+            text: Candidate next question
+            asked: Questions already asked in this interview
+
+        Returns:
+            (index into asked, estimated similarity), or None
+        """
+        scores = self.similarities(text, asked)
+        if not len(scores):
+            return None
+        best = int(scores.argmax())
+        if scores[best] >= self.threshold:
+            return best, float(scores[best])
+        return None
+
+
+# Shared per-container guard (signatures of recurring questions are memoized)
+QUESTION_GUARD = DuplicateQuestionGuard() if np is not None else None
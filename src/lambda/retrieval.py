@@ -0,0 +1,291 @@
+"""
+Question Corpus Retrieval
+Embeds the trend and fine-tuning Q&A corpus once into a contiguous float32
+matrix (memory-mapped from disk) and answers top-k cosine queries with a
+single matrix-vector product
+Used to ground interviewer calls with a few relevant questions and expected
+answers instead of the full role document
+"""
+
+import os
+import re
+import json
+import hashlib
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # Optional dependency: grounding is skipped without it
+    np = None
+
+from feature_flags import env_flag
+
+RETRIEVAL_ENV = 'RETRIEVAL_GROUNDING'
+INDEX_DIR_ENV = 'RETRIEVAL_INDEX_DIR'
+DEFAULT_INDEX_DIR = '/tmp/question_index'
+
+VECTORS_FILE = 'vectors.f32'
+DOCUMENTS_FILE = 'documents.json'
+
+EMBEDDING_DIM = 512
+
+# Below this cosine a hit is too weak to be worth prompt tokens
+MIN_SCORE = 0.1
+
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'can', 'do', 'does', 'for', 'from', 'how', 'i', 'in',
+    'is', 'it', 'me', 'my', 'of', 'on', 'or', 'so', 'that', 'the', 'this', 'to', 'we', 'what', 'when',
+    'which', 'with', 'would', 'you', 'your'
+}
+
+
+def retrieval_enabled() -> bool:
+    """True if NumPy is available and $RETRIEVAL_GROUNDING does not turn grounding off"""
+    return np is not None and env_flag(RETRIEVAL_ENV, default=True)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased content words plus adjacent-word bigrams"""
+    words = [w for w in re.findall(r'[a-z0-9+#]+', text.lower()) if w not in STOP_WORDS]
+    return words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+
+
+class HashingEmbedder:
+    """
+    Feature-hashing text embedder
+
+    Tokens are hashed (stable across processes) into `dim` signed buckets with
+    log-scaled term frequency, then L2-normalised so a dot product is the
+    cosine. Queries embed locally in microseconds, so grounding adds no model
+    call to the interviewer's critical path.
+    """
+
+    name = 'hashing-v1'
+
+    def __init__(self, dim: int = EMBEDDING_DIM):
+        self.dim = dim
+
+    def embed(self, texts: List[str]):
+        """
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 array of shape (len(texts), dim), rows L2-normalised
+        """
+        vectors = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            counts: Dict[Tuple[int, float], int] = {}
+            for token in tokenize(text):
+                digest = hashlib.blake2b(token.encode('utf-8'), digest_size=8).digest()
+                value = int.from_bytes(digest, 'little')
+                key = (value % self.dim, 1.0 if value >> 63 else -1.0)
+                counts[key] = counts.get(key, 0) + 1
+            for (bucket, sign), count in counts.items():
+                vectors[row, bucket] += sign * (1.0 + np.log(count))
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        np.divide(vectors, norms, out=vectors, where=norms > 0)
+        return vectors
+
+
+def corpus_documents() -> List[Dict[str, Any]]:
+    """Question/expected-answer documents from both training data generators"""
+    from trends_data_generator import InterviewTrendsDataGenerator
+    from fine_tuning_generator import FineTuningDataGenerator
+
+    documents = []
+    for category, items in InterviewTrendsDataGenerator().generate_all_trends_data().items():
+        for position, item in enumerate(items):
+            documents.append({
+                'doc_id': f"trend:{category}:{position}",
+                'category': category,
+                'level': item['level'],
+                'trend': item['trend'],
+                'question': item['question'],
+                'expected_answer': item.get('expected_answer', '')
+            })
+
+    generator = FineTuningDataGenerator()
+    fine_tuning = {
+        'python_backend': generator.generate_python_backend_training_data(),
+        'react_frontend': generator.generate_react_frontend_training_data(),
+        'devops': generator.generate_devops_training_data(),
+        'data_scientist': generator.generate_data_scientist_training_data()
+    }
+    for category, pairs in fine_tuning.items():
+        for position, pair in enumerate(pairs):
+            documents.append({
+                'doc_id': f"finetune:{category}:{position}",
+                'category': category,
+                'level': None,
+                'trend': None,
+                'question': pair['user'],
+                'expected_answer': pair['assistant']
+            })
+    return documents
+
+
+def corpus_fingerprint(documents: List[Dict[str, Any]], embedder) -> str:
+    """Changes whenever the corpus or embedder changes (triggers a rebuild)"""
+    payload = json.dumps([embedder.name, embedder.dim, documents], sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class VectorIndex:
+    """Row-aligned document metadata and embedding matrix"""
+
+    def __init__(self, documents: List[Dict[str, Any]], vectors, embedder, fingerprint: Optional[str] = None):
+        """
+        Args:
+            documents: Document metadata, one per row
+            vectors: float32 (n, dim) matrix, rows L2-normalised (may be a memmap)
+            embedder: Embedder used for the rows and for queries
+            fingerprint: corpus_fingerprint the rows were built from
+        """
+        self.documents = documents
+        self.vectors = vectors
+        self.embedder = embedder
+        self.fingerprint = fingerprint
+        self._categories = np.array([d['category'] for d in documents])
+
+    @classmethod
+    def build(cls, documents: List[Dict[str, Any]], embedder, directory: str) -> 'VectorIndex':
+        """Embed the documents and write the index to a directory"""
+        vectors = embedder.embed([f"{d['question']} {d['expected_answer']}" for d in documents])
+        os.makedirs(directory, exist_ok=True)
+
+        # Write-then-rename so a concurrent reader never maps a half-written file
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        vectors_path = os.path.join(directory, VECTORS_FILE)
+        np.ascontiguousarray(vectors, dtype=np.float32).tofile(vectors_path + suffix)
+        os.replace(vectors_path + suffix, vectors_path)
+
+        documents_path = os.path.join(directory, DOCUMENTS_FILE)
+        with open(documents_path + suffix, 'w', encoding='utf-8') as f:
+            json.dump({
+                'fingerprint': corpus_fingerprint(documents, embedder),
+                'dim': embedder.dim,
+                'documents': documents
+            }, f)
+        os.replace(documents_path + suffix, documents_path)
+
+        return cls.load(directory, embedder)
+
+    @classmethod
+    def load(cls, directory: str, embedder) -> 'VectorIndex':
+        """Map an index written by build() (read-only, no copy)"""
+        with open(os.path.join(directory, DOCUMENTS_FILE), 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        documents = meta['documents']
+        vectors = np.memmap(
+            os.path.join(directory, VECTORS_FILE), dtype=np.float32, mode='r',
+            shape=(len(documents), meta['dim'])
+        )
+        return cls(documents, vectors, embedder, meta['fingerprint'])
+
+    def search(self, query: str, k: int = 3, category: Optional[str] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Top-k documents by cosine similarity
+
+        Args:
+            query: Free text
+            k: Number of results
+            category: Restrict to one corpus category (e.g. 'devops')
+
+        Returns:
+            (score, document) pairs, best first
+        """
+        if not self.documents:
+            return []
+        scores = self.vectors @ self.embedder.embed([query])[0]
+        if category is not None:
+            scores = np.where(self._categories == category, scores, -np.inf)
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(float(scores[i]), self.documents[i]) for i in top if np.isfinite(scores[i])]
+
+
+class QuestionIndex:
+    """
+    Per-container retrieval index over the question corpus
+
+    Loaded on first use: mapped from $RETRIEVAL_INDEX_DIR when the stored
+    fingerprint matches the current corpus, otherwise rebuilt there once.
+    """
+
+    def __init__(self, directory: Optional[str] = None, embedder=None, documents: Optional[List[Dict[str, Any]]] = None):
+        """
+        Args:
+            directory: Index directory (defaults to $RETRIEVAL_INDEX_DIR, then /tmp/question_index)
+            embedder: Embedder (defaults to HashingEmbedder)
+            documents: Corpus (defaults to corpus_documents())
+        """
+        self.directory = directory or os.environ.get(INDEX_DIR_ENV) or DEFAULT_INDEX_DIR
+        self.embedder = embedder
+        self._documents = documents
+        self._index: Optional[VectorIndex] = None
+        self._lock = threading.Lock()
+
+    @property
+    def index(self) -> VectorIndex:
+        if self._index is None:
+            with self._lock:
+                if self._index is None:
+                    embedder = self.embedder or HashingEmbedder()
+                    documents = self._documents if self._documents is not None else corpus_documents()
+                    fingerprint = corpus_fingerprint(documents, embedder)
+                    index = None
+                    try:
+                        index = VectorIndex.load(self.directory, embedder)
+                    except (OSError, ValueError, KeyError):
+                        pass
+                    if index is None or index.fingerprint != fingerprint:
+                        index = VectorIndex.build(documents, embedder, self.directory)
+                    self._index = index
+        return self._index
+
+    def search(self, query: str, k: int = 3, category: Optional[str] = None) -> List[Tuple[float, Dict[str, Any]]]:
+        """Top-k cosine search (see VectorIndex.search)"""
+        return self.index.search(query, k, category)
+
+    def grounding(self, query: str, category: Optional[str] = None, k: int = 3) -> str:
+        """
+        Reference block for an interviewer prompt
+
+        Returns:
+            Numbered questions with expected answers, or '' if nothing scores
+            above MIN_SCORE
+        """
+        lines = []
+        for score, document in self.search(query, k, category):
+            if score < MIN_SCORE:
+                continue
+            lines.append(
+                f"{len(lines) + 1}. Q: {document['question']}\n"
+                f"   Expected: {document['expected_answer']}"
+            )
+        return "\n".join(lines)
+
+
+# Shared per-container index; built or mapped on first use, not at import
+QUESTION_INDEX = QuestionIndex()
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    parser = argparse.ArgumentParser(description='Build the question retrieval index')
+    parser.add_argument('--dir', default=os.environ.get(INDEX_DIR_ENV) or DEFAULT_INDEX_DIR)
+    parser.add_argument('--query', help='Run one search against the built index')
+    parser.add_argument('--category')
+    args = parser.parse_args()
+
+    question_index = QuestionIndex(args.dir)
+    print(f"{len(question_index.index.documents)} documents indexed in {args.dir}")
+    if args.query:
+        for score, document in question_index.search(args.query, 5, args.category):
+            print(f"{score:.3f}  [{document['doc_id']}] {document['question']}")
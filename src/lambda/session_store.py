@@ -0,0 +1,129 @@
+"""
+Interview Session Store
+Rehydrates orchestrator state from the interview_sessions table
+Keeps recently active sessions warm in the Lambda container (LRU)
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+SESSION_CACHE_SIZE_ENV = 'SESSION_CACHE_SIZE'
+
+
+class StaleSessionError(Exception):
+    """Raised when a versioned session write finds a newer version in DynamoDB"""
+
+    def __init__(self, interview_id: str, expected_version: int):
+        super().__init__(
+            f"Session {interview_id} changed since version {expected_version}"
+        )
+        self.interview_id = interview_id
+        self.expected_version = expected_version
+
+
+class SessionStore:
+    """
+    LRU of warm interview sessions backed by DynamoDB
+
+    A cached session costs one projected read of its version instead of the
+    whole item; if another container advanced it, it is rehydrated before any
+    model call is spent on stale state. Every session write is still
+    conditional on the version the container last saw, so a race between the
+    probe and the write surfaces as StaleSessionError; the caller then evicts
+    the session and rehydrates from the table.
+    """
+
+    def __init__(
+        self,
+        table,
+        rehydrate: Callable[[Dict[str, Any]], Any],
+        max_sessions: Optional[int] = None
+    ):
+        """
+        Args:
+            table: DynamoDB Table resource for interview_sessions
+            rehydrate: Builds a session object from a table item
+            max_sessions: Warm sessions kept per container
+                          (defaults to $SESSION_CACHE_SIZE, then 128)
+        """
+        self.table = table
+        self.rehydrate = rehydrate
+        if max_sessions is None:
+            max_sessions = int(os.environ.get(SESSION_CACHE_SIZE_ENV, 128))
+        self.max_sessions = max_sessions
+        self._sessions: 'OrderedDict[str, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, interview_id: str) -> Optional[Any]:
+        """
+        Get a session, from the warm cache when possible
+
+        Args:
+            interview_id: Interview session ID
+
+        Returns:
+            Session object, or None if the interview does not exist
+        """
+        with self._lock:
+            session = self._sessions.get(interview_id)
+            if session is not None:
+                self._sessions.move_to_end(interview_id)
+
+        if session is not None:
+            if self._is_current(session):
+                with self._lock:
+                    self.hits += 1
+                return session
+            self.evict(interview_id)
+            with self._lock:
+                self.stale += 1
+
+        with self._lock:
+            self.misses += 1
+        item = self.table.get_item(
+            Key={'interview_id': interview_id},
+            ConsistentRead=True
+        ).get('Item')
+        if item is None:
+            return None
+
+        session = self.rehydrate(item)
+        self.put(session)
+        return session
+
+    def _is_current(self, session: Any) -> bool:
+        """True if the stored version still matches the cached session (one projected read)"""
+        version = getattr(session, 'version', None)
+        if version is None:
+            return True
+        item = self.table.get_item(
+            Key={'interview_id': session.interview_id},
+            ProjectionExpression='#version',
+            ExpressionAttributeNames={'#version': 'version'},
+            ConsistentRead=True
+        ).get('Item')
+        return item is not None and int(item.get('version', 0)) == version
+
+    def put(self, session: Any):
+        """Add or refresh a session in the warm cache"""
+        with self._lock:
+            self._sessions[session.interview_id] = session
+            self._sessions.move_to_end(session.interview_id)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+
+    def evict(self, interview_id: str):
+        """Drop a session whose in-memory state can no longer be trusted"""
+        with self._lock:
+            self._sessions.pop(interview_id, None)
+
+    def __contains__(self, interview_id: str) -> bool:
+        return interview_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
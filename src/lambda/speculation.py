@@ -0,0 +1,170 @@
+"""
+Speculative Follow-up Questions
+While the candidate is answering, prepare follow-up variants for the question
+just asked (one per likely answer quality), persisted with a short TTL
+process_candidate_response uses a prepared variant when the answer fits one
+"""
+
+import os
+import re
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from feature_flags import env_flag
+
+SPECULATION_ENV = 'SPECULATIVE_FOLLOW_UPS'
+SPECULATION_TTL_ENV = 'SPECULATION_TTL_SECONDS'
+
+# Variants are keyed by how the candidate answers
+ANSWER_PATTERNS = ('strong', 'partial', 'weak')
+
+# Below this many words an answer is treated as weak regardless of keywords
+MIN_ANSWER_WORDS = 15
+
+# Share of a variant's expected keywords an answer must mention to count as strong
+STRONG_KEYWORD_RATIO = 0.5
+
+UNCERTAIN_PHRASES = (
+    "i don't know", "i do not know", "not sure", "no idea", "never used",
+    "haven't worked", "have not worked", "not familiar", "can't remember", "don't remember"
+)
+
+SPECULATION_SYSTEM_PROMPT = """You are preparing the interviewer's next turn before the candidate has answered.
+Given the interview so far and the question just asked, write three alternative next turns:
+- "strong": the candidate answers well; go one level deeper on the same topic
+- "partial": the answer is incomplete; probe the missing piece
+- "weak": the candidate struggles; acknowledge kindly and ask a simpler or adjacent question
+Each turn is what the interviewer says next: a one-sentence acknowledgement, then one question.
+For "strong" and "partial", list 3-6 lowercase keywords a good answer to the asked question would mention.
+Return only a JSON array:
+[{"pattern": "strong", "keywords": ["..."], "question": "..."},
+ {"pattern": "partial", "keywords": ["..."], "question": "..."},
+ {"pattern": "weak", "keywords": [], "question": "..."}]"""
+
+
+def speculation_enabled() -> bool:
+    """True if $SPECULATIVE_FOLLOW_UPS turns speculation on"""
+    return env_flag(SPECULATION_ENV)
+
+
+def question_key(question: str) -> str:
+    """Stable key for a question's text"""
+    normalized = ' '.join(question.lower().split())
+    return hashlib.sha256(normalized.encode('utf-8')).hexdigest()[:32]
+
+
+def parse_variants(text: str) -> List[Dict[str, Any]]:
+    """
+    Extract the variant list from a model reply
+
+    Tolerates prose around the JSON array; entries without a known pattern or
+    question are dropped.
+    """
+    start, end = text.find('['), text.rfind(']')
+    if start == -1 or end <= start:
+        return []
+    try:
+        raw = json.loads(text[start:end + 1])
+    except ValueError:
+        return []
+
+    variants = []
+    for entry in raw if isinstance(raw, list) else []:
+        if not isinstance(entry, dict):
+            continue
+        pattern, question = entry.get('pattern'), (entry.get('question') or '').strip()
+        if pattern in ANSWER_PATTERNS and question:
+            keywords = [str(k).lower() for k in entry.get('keywords') or [] if str(k).strip()]
+            variants.append({'pattern': pattern, 'keywords': keywords, 'question': question})
+    return variants
+
+
+def classify_answer(answer: str, keywords: List[str]) -> str:
+    """
+    Cheap answer-quality guess used to pick a variant
+
+    Args:
+        answer: Candidate's answer
+        keywords: Keywords a good answer would mention
+
+    Returns:
+        strong, partial or weak
+    """
+    text = answer.lower()
+    words = re.findall(r"[a-z0-9']+", text)
+    if len(words) < MIN_ANSWER_WORDS or any(phrase in text for phrase in UNCERTAIN_PHRASES):
+        return 'weak'
+    if keywords:
+        hits = sum(1 for keyword in keywords if keyword in text)
+        if hits / len(keywords) >= STRONG_KEYWORD_RATIO:
+            return 'strong'
+    return 'partial'
+
+
+def choose_variant(variants: List[Dict[str, Any]], answer: str) -> Optional[Dict[str, Any]]:
+    """Variant matching the answer, or None if the answer fits none of them"""
+    by_pattern = {v['pattern']: v for v in variants}
+    # Keywords describe the asked question, so any variant's list will do
+    keywords = next((v['keywords'] for v in variants if v['keywords']), [])
+    return by_pattern.get(classify_answer(answer, keywords))
+
+
+class SpeculationStore:
+    """
+    Prepared follow-ups per (interview, question), with a TTL
+
+    A per-container LRU serves warm sessions; the DynamoDB table (TTL on
+    expires_at) lets whichever container receives the answer use variants
+    another container prepared.
+    """
+
+    def __init__(self, table=None, ttl_seconds: Optional[int] = None, max_local: int = 256):
+        """
+        Args:
+            table: interview_question_cache table (None keeps entries local only)
+            ttl_seconds: Lifetime of prepared variants
+                         (defaults to $SPECULATION_TTL_SECONDS, then 900)
+            max_local: Entries kept in the per-container cache
+        """
+        if ttl_seconds is None:
+            ttl_seconds = int(os.environ.get(SPECULATION_TTL_ENV, 900))
+        self.table = table
+        self.ttl_seconds = ttl_seconds
+        self.max_local = max_local
+        self._local: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, interview_id: str, question: str, variants: List[Dict[str, Any]], model_id: str):
+        """Store prepared variants for a question"""
+        entry = {
+            'interview_id': interview_id,
+            'question_key': question_key(question),
+            'variants': variants,
+            'model_id': model_id,
+            'expires_at': int(time.time()) + self.ttl_seconds
+        }
+        with self._lock:
+            self._local[(interview_id, entry['question_key'])] = entry
+            self._local.move_to_end((interview_id, entry['question_key']))
+            while len(self._local) > self.max_local:
+                self._local.popitem(last=False)
+        if self.table is not None:
+            self.table.put_item(Item=entry)
+
+    def get(self, interview_id: str, question: str) -> Optional[Dict[str, Any]]:
+        """Unexpired variants for a question, or None"""
+        key = (interview_id, question_key(question))
+        with self._lock:
+            entry = self._local.get(key)
+        if entry is None and self.table is not None:
+            entry = self.table.get_item(
+                Key={'interview_id': interview_id, 'question_key': key[1]}
+            ).get('Item')
+        # DynamoDB TTL deletion is lazy, so expiry is always checked here
+        if entry is None or int(entry['expires_at']) <= time.time():
+            return None
+        return entry
@@ -0,0 +1,109 @@
+"""
+Incremental Interview Transcript
+Append-only conversation turns with cached rendered text
+Shared by the interviewer, evaluator and coach prompt builders
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def format_turn(turn: Dict[str, Any]) -> str:
+    """Render one turn the way the agent prompts expect it"""
+    return f"{turn['role'].upper()}: {turn['content']}"
+
+
+class Transcript:
+    """
+    Conversation history that renders each turn once
+
+    Every turn is formatted when it is first seen and the joined full text and
+    windowed views are cached until the next append, so building a prompt
+    never re-formats the whole interview. Turns appended directly to the
+    underlying list (e.g. by older callers of conversation_history) are picked
+    up lazily.
+    """
+
+    def __init__(self, turns: Optional[List[Dict[str, Any]]] = None):
+        """
+        Args:
+            turns: Existing turns; the list is shared, not copied
+        """
+        self.turns = turns if turns is not None else []
+        self._lines: List[str] = []
+        self._interviewer_turns = 0
+        self._full: Optional[Tuple[int, str]] = None
+        self._windows: Dict[int, Tuple[int, str]] = {}
+
+    def _sync(self) -> int:
+        """Render any turns not yet seen and return the current turn count"""
+        count = len(self.turns)
+        if len(self._lines) > count:
+            # History was truncated underneath us; start over
+            self._lines = []
+            self._interviewer_turns = 0
+
+        for turn in self.turns[len(self._lines):]:
+            self._lines.append(format_turn(turn))
+            if turn['role'] == 'interviewer':
+                self._interviewer_turns += 1
+
+        return count
+
+    def append(
+        self,
+        role: str,
+        content: str,
+        timestamp: Optional[str] = None,
+        **metadata: Any
+    ) -> Dict[str, Any]:
+        """
+        Append a turn
+
+        Args:
+            role: interviewer or candidate
+            content: Turn text
+            timestamp: ISO timestamp (defaults to now)
+            **metadata: Extra turn attributes (e.g. model_id)
+
+        Returns:
+            The stored turn
+        """
+        turn = {
+            'role': role,
+            'content': content,
+            'timestamp': timestamp or datetime.utcnow().isoformat(),
+            **metadata
+        }
+        self.turns.append(turn)
+        return turn
+
+    def render(self) -> str:
+        """Full transcript text, joined at most once per append"""
+        count = self._sync()
+        if self._full is None or self._full[0] != count:
+            self._full = (count, "\n".join(self._lines))
+        return self._full[1]
+
+    def window(self, size: int) -> str:
+        """Text of the last `size` turns, cached per size until the next append"""
+        count = self._sync()
+        cached = self._windows.get(size)
+        if cached is None or cached[0] != count:
+            cached = (count, "\n".join(self._lines[-size:]))
+            self._windows[size] = cached
+        return cached[1]
+
+    def lines(self) -> List[str]:
+        """Rendered turn lines (one per turn); do not mutate"""
+        self._sync()
+        return self._lines
+
+    @property
+    def questions_asked(self) -> int:
+        """Number of interviewer turns so far"""
+        self._sync()
+        return self._interviewer_turns
+
+    def __len__(self) -> int:
+        return len(self.turns)
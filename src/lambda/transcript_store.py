@@ -0,0 +1,137 @@
+"""
+Turn-per-item Transcript Store
+Stores interview turns under the interview partition keyed by turn sequence
+Supports ranged, paginated reads so consumers only load the turns they need
+"""
+
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+
+
+class TranscriptStore:
+    """
+    Transcript storage laid out as one item per turn
+
+    Item layout:
+    - interview_id (PK): UUID of the interview
+    - turn_seq (SK): 0-based position of the turn in the interview
+    - role: interviewer or candidate
+    - content: Turn text (compressed / offloaded by the codec when large)
+    - timestamp: ISO timestamp of the turn
+    - model_id: Bedrock model that produced the turn (interviewer turns)
+    """
+
+    def __init__(self, table, codec=None):
+        """
+        Args:
+            table: DynamoDB Table resource for interview_transcript_turns
+            codec: Optional StorageCodec applied to turn content
+        """
+        self.table = table
+        self.codec = codec
+
+    def write_turns(self, interview_id: str, turns: List[Dict[str, Any]], start_seq: int = 0) -> int:
+        """
+        Write turns as individual items, batched 25 per request by boto3
+
+        Args:
+            interview_id: Interview ID (partition key)
+            turns: Turns to store, in order
+            start_seq: Sequence number of the first turn
+
+        Returns:
+            Number of turns written
+        """
+        with self.table.batch_writer() as batch:
+            for offset, turn in enumerate(turns):
+                turn_seq = start_seq + offset
+                content = turn['content']
+                if self.codec is not None:
+                    content = self.codec.encode(content, f"{interview_id}/turns/{turn_seq}")
+                item = {
+                    'interview_id': interview_id,
+                    'turn_seq': turn_seq,
+                    'role': turn['role'],
+                    'content': content,
+                    'timestamp': turn.get('timestamp')
+                }
+                if turn.get('model_id'):
+                    item['model_id'] = turn['model_id']
+                batch.put_item(Item=item)
+        return len(turns)
+
+    def get_page(
+        self,
+        interview_id: str,
+        start_seq: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        end_seq: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Read one page of turns starting at a sequence number
+
+        Args:
+            interview_id: Interview ID
+            start_seq: First turn to return
+            page_size: Maximum turns to return
+            end_seq: Last turn to return (inclusive), if bounded
+
+        Returns:
+            Tuple of (turns, next_seq); next_seq is None when no turns remain
+        """
+        # Imported here so loading the module does not pull in boto3
+        from boto3.dynamodb.conditions import Key
+
+        if end_seq is None:
+            condition = Key('interview_id').eq(interview_id) & Key('turn_seq').gte(start_seq)
+        else:
+            condition = Key('interview_id').eq(interview_id) & Key('turn_seq').between(start_seq, end_seq)
+
+        response = self.table.query(
+            KeyConditionExpression=condition,
+            Limit=page_size
+        )
+        turns = [self._to_turn(item) for item in response.get('Items', [])]
+
+        next_seq = None
+        if 'LastEvaluatedKey' in response and turns:
+            next_seq = turns[-1]['turn_seq'] + 1
+        return turns, next_seq
+
+    def iter_turns(
+        self,
+        interview_id: str,
+        start_seq: int = 0,
+        end_seq: Optional[int] = None,
+        page_size: int = DEFAULT_PAGE_SIZE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream turns in order, fetching one page at a time
+
+        Args:
+            interview_id: Interview ID
+            start_seq: First turn to return
+            end_seq: Last turn to return (inclusive), if bounded
+            page_size: Turns fetched per query
+
+        Yields:
+            Turns in sequence order
+        """
+        next_seq = start_seq
+        while next_seq is not None:
+            turns, next_seq = self.get_page(interview_id, next_seq, page_size, end_seq)
+            yield from turns
+
+    def _to_turn(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a stored item back into a conversation turn"""
+        content = item['content']
+        if self.codec is not None:
+            content = self.codec.decode(content)
+        return {
+            'turn_seq': int(item['turn_seq']),
+            'role': item['role'],
+            'content': content,
+            'timestamp': item.get('timestamp'),
+            'model_id': item.get('model_id')
+        }
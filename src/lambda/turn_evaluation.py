@@ -0,0 +1,214 @@
+"""
+Incremental Per-Turn Evaluation
+Each answer is scored in the background as soon as it arrives and stored per
+turn; the end-of-interview evaluation reduces those scores and only asks the
+evaluator for a short synthesis
+"""
+
+from collections import Counter
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional
+
+from feature_flags import env_flag
+from json_extraction import extract_json
+
+INCREMENTAL_EVALUATION_ENV = 'INCREMENTAL_EVALUATION'
+
+DIMENSIONS = ('technical_knowledge', 'communication_clarity', 'confidence_level', 'problem_solving')
+
+# Topics scoring at/above (below) these averages are listed as strong (weak)
+STRONG_TOPIC_SCORE = 7.5
+WEAK_TOPIC_SCORE = 6.0
+
+MAX_LISTED = 4
+
+TURN_SCORING_SYSTEM_PROMPT = """You score one answer from a job interview.
+Score the answer on each dimension from 0 to 10:
+- technical_knowledge: accuracy and depth of the technical content
+- communication_clarity: how clearly and concisely it is explained
+- confidence_level: assurance of delivery, hesitation, hedging
+- problem_solving: structure of the approach, trade-offs, clarifying questions
+Judge only this answer, relative to the candidate's experience level. If a reference answer is given, use it as the bar for technical_knowledge.
+Return only JSON:
+{"topic": "<2-4 word topic>", "scores": {"technical_knowledge": 0, "communication_clarity": 0, "confidence_level": 0, "problem_solving": 0},
+ "strengths": ["<short phrase>"], "weaknesses": ["<short phrase>"]}"""
+
+SYNTHESIS_INSTRUCTIONS = """
+        The answers were already scored one by one. Use the scores below exactly
+        as given for "scores" and "overall_score"; do not re-score.
+        From the per-answer notes, write strengths, weaknesses, improvement_areas,
+        technical_depth, communication_feedback and overall_assessment.
+        Return ONLY JSON evaluation (no additional text).
+        """
+
+
+def incremental_evaluation_enabled() -> bool:
+    """True if $INCREMENTAL_EVALUATION turns per-turn scoring on"""
+    return env_flag(INCREMENTAL_EVALUATION_ENV)
+
+
+def readiness_level(overall_score: float) -> str:
+    """Readiness band for an overall score (evaluator prompt calculation rules)"""
+    if overall_score >= 9.0:
+        return 'Ready'
+    if overall_score >= 7.5:
+        return 'Almost Ready'
+    if overall_score >= 6.0:
+        return 'Needs Improvement'
+    return 'Not Ready Yet'
+
+
+def parse_turn_score(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract a per-turn score from a model reply
+
+    Tolerates prose around the JSON object; scores are clamped to 0-10 and
+    dimensions the model left out are omitted.
+
+    Returns:
+        Dict with topic, scores, strengths, weaknesses, or None if unparseable
+    """
+    raw = extract_json(text, allow_partial=True)
+    if raw is None or not isinstance(raw.get('scores'), dict):
+        return None
+
+    scores = {}
+    for dimension in DIMENSIONS:
+        try:
+            scores[dimension] = min(10.0, max(0.0, float(raw['scores'][dimension])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    if not scores:
+        return None
+    return {
+        'topic': str(raw.get('topic') or '').strip(),
+        'scores': scores,
+        'strengths': [str(s) for s in raw.get('strengths') or []][:MAX_LISTED],
+        'weaknesses': [str(w) for w in raw.get('weaknesses') or []][:MAX_LISTED]
+    }
+
+
+def ranked_notes(notes: Iterable[str]) -> List[str]:
+    """Most frequently noted phrases first (first-seen order breaks ties)"""
+    counts = Counter(note.strip() for note in notes if note and note.strip())
+    return [note for note, _ in counts.most_common(MAX_LISTED)]
+
+
+def reduce_turn_scores(turn_scores: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine per-turn scores into the interview-level evaluation fields
+
+    Args:
+        turn_scores: Per-turn scores (parse_turn_score output plus turn_seq and question)
+
+    Returns:
+        scores, overall_score, readiness_level, strengths, weaknesses,
+        technical_depth and question_scores
+    """
+    scores = {}
+    for dimension in DIMENSIONS:
+        values = [t['scores'][dimension] for t in turn_scores if dimension in t['scores']]
+        if values:
+            scores[dimension] = round(sum(values) / len(values), 2)
+    overall = round(sum(scores.values()) / len(scores), 2) if scores else 0.0
+
+    question_scores = []
+    topics_strong, topics_weak = [], []
+    for turn in sorted(turn_scores, key=lambda t: t['turn_seq']):
+        turn_overall = round(sum(turn['scores'].values()) / len(turn['scores']), 2)
+        question_scores.append({
+            'turn_seq': turn['turn_seq'],
+            'question': turn.get('question', ''),
+            'topic': turn.get('topic', ''),
+            'score': turn_overall
+        })
+        if turn.get('topic'):
+            if turn_overall >= STRONG_TOPIC_SCORE and turn['topic'] not in topics_strong:
+                topics_strong.append(turn['topic'])
+            elif turn_overall < WEAK_TOPIC_SCORE and turn['topic'] not in topics_weak:
+                topics_weak.append(turn['topic'])
+
+    return {
+        'scores': scores,
+        'overall_score': overall,
+        'readiness_level': readiness_level(overall),
+        'strengths': ranked_notes(s for t in turn_scores for s in t.get('strengths', [])),
+        'weaknesses': ranked_notes(w for t in turn_scores for w in t.get('weaknesses', [])),
+        'technical_depth': {'topics_strong': topics_strong, 'topics_weak': topics_weak},
+        'question_scores': question_scores,
+        'answers_scored': len(turn_scores)
+    }
+
+
+def answered_questions(turns: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    (question, answer) pairs of a transcript
+
+    Returns:
+        One dict per candidate turn that follows an interviewer turn, with
+        turn_seq (the candidate turn's index), question, question_id and answer
+    """
+    pairs = []
+    for seq, turn in enumerate(turns):
+        if turn['role'] != 'candidate' or seq == 0 or turns[seq - 1]['role'] != 'interviewer':
+            continue
+        pairs.append({
+            'turn_seq': seq,
+            'question': turns[seq - 1]['content'],
+            'question_id': turns[seq - 1].get('question_id'),
+            'answer': turn['content']
+        })
+    return pairs
+
+
+class TurnScoreStore:
+    """Per-turn scores in interview_turn_scores (interview_id, turn_seq)"""
+
+    def __init__(self, table):
+        """
+        Args:
+            table: DynamoDB Table resource for interview_turn_scores
+        """
+        self.table = table
+
+    def put(self, interview_id: str, turn_score: Dict[str, Any], model_id: str):
+        """Store one turn's score"""
+        self.table.put_item(Item={
+            'interview_id': interview_id,
+            'turn_seq': turn_score['turn_seq'],
+            'question': turn_score.get('question', ''),
+            'topic': turn_score.get('topic', ''),
+            'scores': {k: Decimal(str(v)) for k, v in turn_score['scores'].items()},
+            'strengths': turn_score.get('strengths', []),
+            'weaknesses': turn_score.get('weaknesses', []),
+            'model_id': model_id,
+            'evaluated_at': datetime.utcnow().isoformat()
+        })
+
+    def get_all(self, interview_id: str) -> Dict[int, Dict[str, Any]]:
+        """
+        All stored turn scores of an interview
+
+        Returns:
+            turn_seq -> turn score (numbers as float/int)
+        """
+        from boto3.dynamodb.conditions import Key
+
+        stored = {}
+        kwargs = {'KeyConditionExpression': Key('interview_id').eq(interview_id)}
+        while True:
+            response = self.table.query(**kwargs)
+            for item in response.get('Items', []):
+                seq = int(item['turn_seq'])
+                stored[seq] = {
+                    'turn_seq': seq,
+                    'question': item.get('question', ''),
+                    'topic': item.get('topic', ''),
+                    'scores': {k: float(v) for k, v in item.get('scores', {}).items()},
+                    'strengths': list(item.get('strengths', [])),
+                    'weaknesses': list(item.get('weaknesses', []))
+                }
+            if 'LastEvaluatedKey' not in response:
+                return stored
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
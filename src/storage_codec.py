@@ -0,0 +1,165 @@
+"""
+Storage Codec for Large DynamoDB Attributes
+Compresses large text/JSON payloads into binary attributes
+Offloads payloads above a size threshold to S3 and stores a pointer instead
+"""
+
+import os
+import json
+import zlib
+from decimal import Decimal
+from typing import Any
+
+from aws_clients import AWS_CLIENTS
+
+# Payloads smaller than this are stored as-is (bytes of UTF-8 text / JSON)
+COMPRESS_THRESHOLD = int(os.environ.get('STORAGE_COMPRESS_THRESHOLD', 4 * 1024))
+
+# Compressed payloads larger than this go to S3. DynamoDB items cap at 400KB
+# and an item holds up to three encoded payloads (evaluation_result,
+# coaching_draft, coaching_feedback), so each gets under a third of that
+OFFLOAD_THRESHOLD = int(os.environ.get('STORAGE_OFFLOAD_THRESHOLD', 96 * 1024))
+
+OFFLOAD_BUCKET = os.environ.get('STORAGE_OFFLOAD_BUCKET', 'interview-coach-voice-storage')
+OFFLOAD_PREFIX = 'payloads/'
+
+# Marker attribute identifying encoded payload maps
+CODEC_MARKER = '__codec__'
+
+
+def json_default(value: Any) -> Any:
+    """
+    json.dumps fallback shared by storage and API responses: the Decimal
+    numbers DynamoDB reads return stay numbers, anything else becomes a string
+    """
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    return str(value)
+
+
+class StorageCodec:
+    """
+    Encode/decode large attributes for DynamoDB storage
+
+    Encoded payloads are maps:
+    - {'__codec__': 'zlib', 'kind': 'text'|'json', 'data': <binary>}
+    - {'__codec__': 's3+zlib', 'kind': 'text'|'json', 'bucket': ..., 'key': ..., 'size': ...}
+
+    Values under the compression threshold are stored unchanged, so existing
+    items and small payloads read back exactly as before. Decoding only
+    happens when a reader asks for the attribute, and S3 is only contacted for
+    offloaded payloads that are actually read.
+    """
+
+    def __init__(
+        self,
+        bucket: str = OFFLOAD_BUCKET,
+        compress_threshold: int = COMPRESS_THRESHOLD,
+        offload_threshold: int = OFFLOAD_THRESHOLD,
+        s3_client=None
+    ):
+        self.bucket = bucket
+        self.compress_threshold = compress_threshold
+        self.offload_threshold = offload_threshold
+        self._s3_client = s3_client
+
+    @property
+    def s3_client(self):
+        """S3 client, created on first offload or offloaded read"""
+        if self._s3_client is None:
+            self._s3_client = AWS_CLIENTS.client('s3')
+        return self._s3_client
+
+    def encode(self, value: Any, key_hint: str) -> Any:
+        """
+        Encode a value for storage
+
+        Args:
+            value: Text, or a JSON-serialisable dict/list
+            key_hint: Stable name for the payload, used as the S3 key
+                      (e.g. '<interview_id>/coaching_feedback')
+
+        Returns:
+            The value unchanged if small, otherwise an encoded payload map
+        """
+        if value is None or isinstance(value, (int, float, bool)):
+            return value
+
+        if isinstance(value, str):
+            kind, raw = 'text', value.encode('utf-8')
+        else:
+            kind, raw = 'json', json.dumps(value, default=json_default).encode('utf-8')
+
+        if len(raw) < self.compress_threshold:
+            return value
+
+        compressed = zlib.compress(raw, 6)
+        if len(compressed) <= self.offload_threshold:
+            return {CODEC_MARKER: 'zlib', 'kind': kind, 'data': compressed}
+
+        key = f"{OFFLOAD_PREFIX}{key_hint}.z"
+        self.s3_client.put_object(
+            Bucket=self.bucket,
+            Key=key,
+            Body=compressed,
+            ContentType='application/zlib'
+        )
+        return {
+            CODEC_MARKER: 's3+zlib',
+            'kind': kind,
+            'bucket': self.bucket,
+            'key': key,
+            'size': len(raw)
+        }
+
+    @staticmethod
+    def is_encoded(stored: Any) -> bool:
+        """Check whether a stored attribute is an encoded payload map"""
+        return isinstance(stored, dict) and CODEC_MARKER in stored
+
+    def summary(self, stored: Any) -> Any:
+        """
+        JSON-safe stand-in for an encoded payload in list views (nothing is
+        decompressed or fetched); plain attributes pass through
+        """
+        if not self.is_encoded(stored):
+            return stored
+        summary = {'encoded': stored[CODEC_MARKER], 'kind': stored.get('kind')}
+        if 'size' in stored:
+            summary['size'] = int(stored['size'])
+        return summary
+
+    def delete(self, stored: Any):
+        """Delete the S3 object behind an offloaded payload (no-op for anything else)"""
+        if self.is_encoded(stored) and stored[CODEC_MARKER] == 's3+zlib':
+            self.s3_client.delete_object(Bucket=stored['bucket'], Key=stored['key'])
+
+    def decode(self, stored: Any) -> Any:
+        """
+        Decode a stored attribute back to its original value
+
+        Args:
+            stored: Attribute as read from DynamoDB
+
+        Returns:
+            Original text or JSON value; plain attributes pass through
+        """
+        if not self.is_encoded(stored):
+            return stored
+
+        codec = stored[CODEC_MARKER]
+        if codec == 'zlib':
+            data = stored['data']
+            compressed = getattr(data, 'value', data)  # boto3 returns Binary
+        elif codec == 's3+zlib':
+            obj = self.s3_client.get_object(Bucket=stored['bucket'], Key=stored['key'])
+            compressed = obj['Body'].read()
+        else:
+            raise ValueError(f"Unknown storage codec: {codec}")
+
+        raw = zlib.decompress(compressed).decode('utf-8')
+        return json.loads(raw) if stored.get('kind') == 'json' else raw
+
+
+# Shared per-container codec
+STORAGE_CODEC = StorageCodec()
@@ -4,15 +4,16 @@ Generates training data based on current 2026 interview trends and best practice
 """
 
 import json
-import boto3
 from datetime import datetime
 from typing import List, Dict
 
+from aws_clients import lazy_client
+
 class InterviewTrendsDataGenerator:
     """Generate fine-tuning data based on current interview trends"""
     
     def __init__(self):
-        self.s3_client = boto3.client('s3', region_name='us-east-1')
+        self.s3_client = lazy_client('s3', 'us-east-1')
         self.bucket_name = 'interview-coach-training-data-dev'
         self.trends_2026 = {
             'system_design': True,
@@ -3,13 +3,22 @@ Voice Interview Handler
 AWS Transcribe (STT) + Polly (TTS) integration for voice interviews
 """
 
-import boto3
+import os
+import sys
 import json
 from typing import Dict, Any, Tuple
 
-transcribe_client = boto3.client('transcribe', region_name='us-east-1')
-polly_client = boto3.client('polly', region_name='us-east-1')
-s3_client = boto3.client('s3', region_name='us-east-1')
+# Modules shared with the other Lambda functions live one level up, in src/
+_SRC_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC_DIR not in sys.path:
+    sys.path.append(_SRC_DIR)
+
+from aws_clients import lazy_client
+
+# Built on first use: a synthesize-only request never constructs Transcribe
+transcribe_client = lazy_client('transcribe')
+polly_client = lazy_client('polly')
+s3_client = lazy_client('s3')
 
 VOICE_S3_BUCKET = 'interview-coach-voice-storage'
 
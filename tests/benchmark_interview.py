@@ -0,0 +1,408 @@
+"""
+Interview Load Test / Benchmark
+Drives lambda_handler through full interview lifecycles
+(start -> N responses -> end -> evaluate -> coach -> report) at a configurable
+concurrency against local stand-ins: fake_bedrock.py for Bedrock and moto for
+DynamoDB and S3
+
+Reports throughput, p50/p95/p99 latency per action, bytes written to storage
+and (with --allocations) traced Python allocations.
+
+Usage:
+    pip install moto
+    python tests/benchmark_interview.py --interviews 50 --concurrency 8 --answers 6
+    python tests/benchmark_interview.py --latency-ms 800 --throttle-rate 0.05 --json
+    python tests/benchmark_interview.py --websocket  # send actions over the WebSocket route (streamed replies)
+    python tests/benchmark_interview.py --speculative  # prepare follow-ups while answering (implies --websocket)
+    python tests/benchmark_interview.py --incremental-evaluation  # score each answer as it arrives
+    python tests/benchmark_interview.py --async-pipeline  # evaluate/coach on the job queue, poll get_status
+    python tests/benchmark_interview.py --parallel-coaching  # draft coaching alongside the evaluation
+    python tests/benchmark_interview.py --adaptive-length --answers 12  # close once per-turn scores converge
+    python tests/benchmark_interview.py --retry-rate 0.2  # resend 20% of state-changing calls with the same idempotency key
+"""
+
+import os
+import re
+import sys
+import json
+import uuid
+import random
+import time
+import argparse
+import threading
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+sys.path.insert(0, os.path.join(ROOT, 'src', 'lambda'))
+
+from fake_bedrock import FakeBedrockConfig, start_fake_bedrock
+
+ACTIONS = ['start_interview', 'send_response', 'end_interview', 'evaluate', 'coach', 'get_status', 'get_report']
+
+# Pseudo-action: end_interview returning until get_status reports the queued jobs done
+POST_PROCESSING = 'post_processing'
+
+# Pseudo-action: a client retry of a state-changing call (same idempotency key)
+REPLAY = 'replay'
+
+# Calls that carry an idempotency key
+KEYED_ACTIONS = ('start_interview', 'send_response', 'end_interview', 'evaluate', 'coach')
+
+STATUS_POLL_SECONDS = 0.05
+STATUS_TIMEOUT_SECONDS = 120
+
+# DynamoDB / S3 operations counted as storage writes
+WRITE_OPERATIONS = {'PutItem', 'UpdateItem', 'BatchWriteItem', 'TransactWriteItems', 'PutObject'}
+
+SAMPLE_ANSWER = (
+    "In my last role I owned the ingestion service. We moved from a cron batch job to an "
+    "event-driven pipeline on SQS and Lambda, which cut end-to-end latency from minutes to seconds. "
+    "The main trade-off was ordering: we added idempotency keys and a per-tenant sequence number "
+    "so retries and out-of-order deliveries could not double-apply an update."
+)
+
+
+def percentile(sorted_values: List[float], p: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    """Thread-safe per-action latency, error and allocation samples"""
+
+    def __init__(self, allocations: bool = False):
+        self.allocations = allocations
+        self._lock = threading.Lock()
+        self.latencies: Dict[str, List[float]] = {action: [] for action in ACTIONS + [POST_PROCESSING, REPLAY]}
+        self.errors: Dict[str, int] = {action: 0 for action in ACTIONS + [POST_PROCESSING, REPLAY]}
+        self.allocated: Dict[str, List[int]] = {action: [] for action in ACTIONS + [POST_PROCESSING, REPLAY]}
+        self.storage_bytes = 0
+        self.storage_writes = 0
+
+    def call(self, handler, event: Dict[str, Any], action: str = None) -> Dict[str, Any]:
+        """Invoke the handler once and record the outcome (under action, default the event's)"""
+        action = action or event['action']
+        before = tracemalloc.get_traced_memory()[0] if self.allocations else 0
+        started = time.perf_counter()
+        response = handler(event, None)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        after = tracemalloc.get_traced_memory()[0] if self.allocations else 0
+
+        with self._lock:
+            self.latencies[action].append(elapsed_ms)
+            if response.get('statusCode') != 200:
+                self.errors[action] += 1
+            if self.allocations:
+                self.allocated[action].append(after - before)
+        return json.loads(response['body'])
+
+    def record(self, action: str, elapsed_ms: float, error: bool = False):
+        """Record a sample measured outside call()"""
+        with self._lock:
+            self.latencies[action].append(elapsed_ms)
+            if error:
+                self.errors[action] += 1
+
+    def on_storage_call(self, model, params, **kwargs):
+        """botocore before-call hook counting request bytes of storage writes"""
+        if model.name not in WRITE_OPERATIONS:
+            return
+        body = params.get('body') or b''
+        size = len(body) if isinstance(body, (bytes, bytearray, str)) else 0
+        with self._lock:
+            self.storage_bytes += size
+            self.storage_writes += 1
+
+
+def create_local_storage():
+    """Create the tables and bucket the orchestrator expects (inside mock_aws)"""
+    import boto3
+    from storage_codec import OFFLOAD_BUCKET
+
+    dynamodb = boto3.client('dynamodb', region_name='us-east-1')
+    tables = {
+        'interview_sessions': [('interview_id', 'S', 'HASH')],
+        'evaluation_results': [('interview_id', 'S', 'HASH')],
+        'interview_transcript_turns': [('interview_id', 'S', 'HASH'), ('turn_seq', 'N', 'RANGE')],
+        'candidate_profiles': [('candidate_id', 'S', 'HASH')],
+        'interview_question_cache': [('interview_id', 'S', 'HASH'), ('question_key', 'S', 'RANGE')],
+        'interview_turn_scores': [('interview_id', 'S', 'HASH'), ('turn_seq', 'N', 'RANGE')],
+        'interview_idempotency_keys': [('idempotency_key', 'S', 'HASH')]
+    }
+    for name, keys in tables.items():
+        dynamodb.create_table(
+            TableName=name,
+            BillingMode='PAY_PER_REQUEST',
+            AttributeDefinitions=[{'AttributeName': k, 'AttributeType': t} for k, t, _ in keys],
+            KeySchema=[{'AttributeName': k, 'KeyType': kt} for k, _, kt in keys]
+        )
+    boto3.client('s3', region_name='us-east-1').create_bucket(Bucket=OFFLOAD_BUCKET)
+
+
+@contextmanager
+def local_stack(fake_config: FakeBedrockConfig):
+    """
+    Start the stand-ins and import the orchestrator against them
+
+    Yields:
+        The orchestrator module, wired to fake Bedrock and moto storage
+    """
+    try:
+        from moto import mock_aws
+    except ImportError:
+        raise SystemExit("benchmark_interview.py needs moto for local DynamoDB/S3: pip install moto")
+
+    server, url = start_fake_bedrock(fake_config)
+    os.environ.update({
+        'LOCAL_AWS_ENDPOINT_URL': url,
+        'AWS_ACCESS_KEY_ID': 'local',
+        'AWS_SECRET_ACCESS_KEY': 'local',
+        'AWS_DEFAULT_REGION': 'us-east-1'
+    })
+    mock = mock_aws(config={'core': {'passthrough': {'urls': [re.escape(url) + '.*']}}})
+    mock.start()
+    try:
+        create_local_storage()
+        # Module-level clients pick up the endpoints at import time
+        import orchestrator
+        yield orchestrator
+    finally:
+        mock.stop()
+        server.shutdown()
+
+
+def websocket_event(event: Dict[str, Any], connection_id: str) -> Dict[str, Any]:
+    """Wrap an action as an API Gateway WebSocket message (replies stream to the connection)"""
+    return {
+        'requestContext': {
+            'connectionId': connection_id,
+            'domainName': 'local.execute-api.us-east-1.amazonaws.com',
+            'stage': 'dev'
+        },
+        'body': json.dumps(event)
+    }
+
+
+def run_interview(
+    orchestrator,
+    recorder: Recorder,
+    answers: int,
+    index: int,
+    retry_rate: float = 0.0,
+    websocket: bool = False
+):
+    """One full interview lifecycle through lambda_handler"""
+    handler = orchestrator.lambda_handler
+    retries = random.Random(index)
+    connection_id = f"connection-{index}"
+
+    def call(event: Dict[str, Any]) -> Dict[str, Any]:
+        if event['action'] in KEYED_ACTIONS:
+            event['idempotency_key'] = uuid.uuid4().hex
+        sent = websocket_event(event, connection_id) if websocket else event
+        result = recorder.call(handler, sent, event['action'])
+        if retries.random() < retry_rate and 'idempotency_key' in event:
+            result = recorder.call(handler, sent, REPLAY)
+        return result
+
+    started = call({
+        'action': 'start_interview',
+        'job_role': 'Software Engineer',
+        'experience_level': '3+ years'
+    })
+    interview_id = started.get('interview_id')
+    for turn in range(answers):
+        reply = call({
+            'action': 'send_response',
+            'interview_id': interview_id,
+            'candidate_answer': f"[{index}.{turn}] {SAMPLE_ANSWER}"
+        })
+        if reply.get('interview_complete'):
+            break
+    ended = call({'action': 'end_interview', 'interview_id': interview_id})
+    if 'jobs' in ended:
+        wait_for_post_processing(handler, recorder, interview_id)
+    else:
+        evaluation = call({'action': 'evaluate', 'interview_id': interview_id})
+        call({
+            'action': 'coach',
+            'interview_id': interview_id,
+            'evaluation': evaluation.get('evaluation', evaluation)
+        })
+    recorder.call(handler, {'action': 'get_report', 'interview_id': interview_id})
+
+
+def wait_for_post_processing(handler, recorder: Recorder, interview_id: str):
+    """Poll get_status until the queued evaluation and coaching finish (or fail)"""
+    started = time.perf_counter()
+    status = {}
+    while time.perf_counter() - started < STATUS_TIMEOUT_SECONDS:
+        status = recorder.call(handler, {'action': 'get_status', 'interview_id': interview_id})
+        if status.get('complete') or status.get('failed'):
+            break
+        time.sleep(STATUS_POLL_SECONDS)
+    recorder.record(POST_PROCESSING, (time.perf_counter() - started) * 1000, error=not status.get('complete'))
+
+
+def run_benchmark(
+    interviews: int = 20,
+    concurrency: int = 4,
+    answers: int = 5,
+    fake_config: FakeBedrockConfig = None,
+    allocations: bool = False,
+    retry_rate: float = 0.0,
+    websocket: bool = False
+) -> Dict[str, Any]:
+    """
+    Run the load test
+
+    Args:
+        interviews: Interview lifecycles to run
+        concurrency: Interviews in flight at once
+        answers: Candidate responses per interview
+        fake_config: Stand-in Bedrock behaviour
+        allocations: Trace Python allocations (slows the run; per-action
+                     numbers are only exact at concurrency 1)
+        retry_rate: Share of state-changing calls resent with the same idempotency key
+        websocket: Send interview actions over the WebSocket route, so replies
+                   stream (and follow-ups can be speculated) instead of HTTP
+
+    Returns:
+        Report dict (see format_report)
+    """
+    recorder = Recorder(allocations)
+    with local_stack(fake_config or FakeBedrockConfig()) as orchestrator:
+        from aws_clients import AWS_CLIENTS
+        for client in (AWS_CLIENTS.resource('dynamodb').meta.client, AWS_CLIENTS.client('s3')):
+            client.meta.events.register('before-call', recorder.on_storage_call)
+
+        if allocations:
+            tracemalloc.start()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            list(pool.map(
+                lambda i: run_interview(orchestrator, recorder, answers, i, retry_rate, websocket),
+                range(interviews)
+            ))
+        wall_seconds = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] if allocations else None
+        if allocations:
+            tracemalloc.stop()
+
+    actions = {}
+    for action in ACTIONS + [POST_PROCESSING, REPLAY]:
+        samples = sorted(recorder.latencies[action])
+        if not samples:
+            continue  # e.g. evaluate/coach with --async-pipeline
+        actions[action] = {
+            'count': len(samples),
+            'errors': recorder.errors[action],
+            'p50_ms': round(percentile(samples, 50), 1),
+            'p95_ms': round(percentile(samples, 95), 1),
+            'p99_ms': round(percentile(samples, 99), 1),
+            'max_ms': round(samples[-1], 1) if samples else 0.0
+        }
+        if allocations and recorder.allocated[action]:
+            actions[action]['mean_alloc_bytes'] = int(sum(recorder.allocated[action]) / len(recorder.allocated[action]))
+
+    total_calls = sum(a['count'] for a in actions.values())
+    return {
+        'interviews': interviews,
+        'concurrency': concurrency,
+        'answers_per_interview': answers,
+        'wall_seconds': round(wall_seconds, 3),
+        'interviews_per_second': round(interviews / wall_seconds, 3),
+        'calls_per_second': round(total_calls / wall_seconds, 2),
+        'storage_writes': recorder.storage_writes,
+        'storage_bytes_written': recorder.storage_bytes,
+        'peak_traced_bytes': peak,
+        'actions': actions
+    }
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Human-readable table of a run_benchmark report"""
+    lines = [
+        f"{report['interviews']} interviews x {report['answers_per_interview']} answers "
+        f"@ concurrency {report['concurrency']} in {report['wall_seconds']}s",
+        f"throughput: {report['interviews_per_second']} interviews/s, {report['calls_per_second']} calls/s",
+        f"storage: {report['storage_writes']} writes, {report['storage_bytes_written']} bytes",
+    ]
+    if report['peak_traced_bytes'] is not None:
+        lines.append(f"peak traced memory: {report['peak_traced_bytes']} bytes")
+    lines.append(f"{'action':<16}{'count':>7}{'errors':>8}{'p50':>10}{'p95':>10}{'p99':>10}{'max':>10}")
+    for action, stats in report['actions'].items():
+        lines.append(
+            f"{action:<16}{stats['count']:>7}{stats['errors']:>8}"
+            f"{stats['p50_ms']:>10}{stats['p95_ms']:>10}{stats['p99_ms']:>10}{stats['max_ms']:>10}"
+        )
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='End-to-end interview load test against local stand-ins')
+    parser.add_argument('--interviews', type=int, default=20)
+    parser.add_argument('--concurrency', type=int, default=4)
+    parser.add_argument('--answers', type=int, default=5)
+    parser.add_argument('--latency-ms', type=float, default=300.0, help='Median fake Bedrock latency')
+    parser.add_argument('--latency-sigma', type=float, default=0.5)
+    parser.add_argument('--ttft-ms', type=float, default=120.0)
+    parser.add_argument('--chunk-delay-ms', type=float, default=10.0)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--allocations', action='store_true', help='Trace Python allocations')
+    parser.add_argument('--websocket', action='store_true', help='Send actions over the WebSocket route')
+    parser.add_argument('--speculative', action='store_true',
+                        help='Enable speculative follow-up questions (implies --websocket: only streamed replies speculate)')
+    parser.add_argument('--incremental-evaluation', action='store_true', help='Score each answer as it arrives')
+    parser.add_argument('--async-pipeline', action='store_true', help='Queue evaluation and coaching at end_interview')
+    parser.add_argument('--parallel-coaching', action='store_true', help='Draft coaching alongside the evaluation')
+    parser.add_argument('--adaptive-length', action='store_true',
+                        help='End interviews once per-turn scores converge (--answers is the maximum)')
+    parser.add_argument('--retry-rate', type=float, default=0.0,
+                        help='Share of state-changing calls resent with the same idempotency key')
+    parser.add_argument('--json', action='store_true', help='Print the report as JSON')
+    parser.add_argument('--verbose', action='store_true', help='Keep per-call metric/log lines on stdout')
+    args = parser.parse_args()
+    if args.speculative:
+        os.environ['SPECULATIVE_FOLLOW_UPS'] = 'true'
+        args.websocket = True
+    if args.incremental_evaluation:
+        os.environ['INCREMENTAL_EVALUATION'] = 'true'
+    if args.async_pipeline:
+        os.environ['ASYNC_POST_PROCESSING'] = 'true'
+    if args.parallel_coaching:
+        os.environ['PARALLEL_COACHING'] = 'true'
+    if args.adaptive_length:
+        os.environ['ADAPTIVE_STOPPING'] = 'true'
+        os.environ['INCREMENTAL_EVALUATION'] = 'true'  # the per-turn scores drive it
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(sys.stdout if args.verbose else devnull):
+        report = run_benchmark(
+            interviews=args.interviews,
+            concurrency=args.concurrency,
+            answers=args.answers,
+            fake_config=FakeBedrockConfig(
+                latency_ms=args.latency_ms,
+                latency_sigma=args.latency_sigma,
+                ttft_ms=args.ttft_ms,
+                chunk_delay_ms=args.chunk_delay_ms,
+                throttle_rate=args.throttle_rate,
+                seed=args.seed
+            ),
+            allocations=args.allocations,
+            retry_rate=args.retry_rate,
+            websocket=args.websocket
+        )
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
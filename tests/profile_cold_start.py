@@ -0,0 +1,118 @@
+"""
+Cold-Start Import Profile
+Imports each Lambda entry point in a fresh interpreter (python -X importtime)
+and reports import time, the heaviest top-level imports, whether boto3 was
+loaded, and any AWS clients constructed at import
+
+Usage:
+    python tests/profile_cold_start.py
+    python tests/profile_cold_start.py --top 15 --json
+"""
+
+import os
+import re
+import sys
+import json
+import argparse
+import subprocess
+from typing import Any, Dict, List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (module, directory added to sys.path) per entry point; serverless.yml
+# handlers are loaded like Lambda does, by dotted path from the task root
+ENTRY_POINTS = [
+    ('src.lambda.orchestrator', ''),
+    ('src.auth_handlers', ''),
+    ('src.voice.voice_handler', ''),
+    ('voice.female_agent_realtime', 'src'),
+    ('bedrock_agent_manager', 'src')
+]
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$')
+
+# __import__ because 'lambda' is a keyword (importlib.import_module is not
+# timed by -X importtime); only the entry point's own sys.path setup may make
+# the shared modules in src/ importable
+PROBE = """
+import sys, json
+sys.path.insert(0, {path!r})
+__import__({module!r})
+aws_clients = sys.modules.get('aws_clients')
+clients = aws_clients.AWS_CLIENTS.constructed if aws_clients else []
+print(json.dumps({{'boto3': 'boto3' in sys.modules, 'clients': clients}}))
+"""
+
+
+def profile_entry_point(module: str, path: str, top: int = 10) -> Dict[str, Any]:
+    """
+    Import one entry point in a clean interpreter and summarise the cost
+
+    Returns:
+        Dict with total_ms, boto3_loaded, clients_at_import and the heaviest
+        top-level imports (cumulative ms)
+    """
+    probe = PROBE.format(path=os.path.join(ROOT, path), module=module)
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', probe],
+        capture_output=True, text=True, cwd=ROOT,
+        env=dict(os.environ, AWS_DEFAULT_REGION='us-east-1')
+    )
+    if result.returncode != 0:
+        return {'module': module, 'error': result.stderr.strip().splitlines()[-1]}
+
+    # importtime lists children before their parent, indented two spaces per level
+    children: List[Dict[str, Any]] = []
+    dependencies: List[Dict[str, Any]] = []
+    total_us = 0
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative_us, depth, name = int(match.group(2)), len(match.group(3)) // 2, match.group(4)
+        if depth == 1:
+            children.append({'name': name, 'ms': round(cumulative_us / 1000, 1)})
+        elif depth == 0:
+            if name == module:
+                total_us, dependencies = cumulative_us, children
+            children = []
+
+    probe_output = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        'module': module,
+        'total_ms': round(total_us / 1000, 1),
+        'boto3_loaded': probe_output['boto3'],
+        'clients_at_import': probe_output['clients'],
+        'heaviest_imports': sorted(dependencies, key=lambda i: i['ms'], reverse=True)[:top]
+    }
+
+
+def format_report(profiles: List[Dict[str, Any]]) -> str:
+    """Human-readable report"""
+    lines = []
+    for profile in profiles:
+        if 'error' in profile:
+            lines.append(f"{profile['module']}: FAILED ({profile['error']})")
+            continue
+        clients = ', '.join(c['name'] for c in profile['clients_at_import']) or 'none'
+        lines.append(
+            f"{profile['module']}: {profile['total_ms']} ms, "
+            f"boto3 {'loaded' if profile['boto3_loaded'] else 'not loaded'}, clients at import: {clients}"
+        )
+        for item in profile['heaviest_imports']:
+            lines.append(f"    {item['ms']:>8} ms  {item['name']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Import-time profile of the Lambda entry points')
+    parser.add_argument('--top', type=int, default=10, help='Heaviest imports to list per entry point')
+    parser.add_argument('--json', action='store_true')
+    args = parser.parse_args()
+
+    profiles = [profile_entry_point(module, path, args.top) for module, path in ENTRY_POINTS]
+    print(json.dumps(profiles, indent=2) if args.json else format_report(profiles))
+
+
+if __name__ == "__main__":
+    main()
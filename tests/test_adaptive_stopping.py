@@ -0,0 +1,80 @@
+"""
+Test suite for adaptive interview length
+"""
+
+import pytest
+import os
+import sys
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from adaptive_stopping import (
+    CONTINUE, SHIFT_TOPIC, STOP, estimate, stopping_decision, topic_start, adaptive_stopping_enabled
+)
+
+
+def turn_score(turn_seq, value, spread=0.0):
+    """Per-turn score with every dimension at value (+/- spread)"""
+    return {
+        'turn_seq': turn_seq,
+        'scores': {
+            'technical_knowledge': value + spread,
+            'communication_clarity': value - spread,
+            'confidence_level': value + spread,
+            'problem_solving': value - spread
+        }
+    }
+
+
+class TestAdaptiveStopping:
+    """Test the score estimates and the continue / shift / stop decisions"""
+
+    def test_estimate_has_a_spread_floor(self):
+        """Test identical scores still need several answers before the interval is tight"""
+        assert estimate([7.0])['half_width'] is None
+        assert estimate([7.0, 7.0])['half_width'] == pytest.approx(1.96 * 0.75 / 2 ** 0.5)
+        assert estimate([4.0, 9.0, 5.0, 8.0])['half_width'] > estimate([7.0, 7.0, 7.0, 7.0])['half_width']
+
+    def test_stops_once_converged_after_minimum(self, monkeypatch):
+        """Test consistent scores stop the interview only once the minimum is reached"""
+        monkeypatch.delenv('ADAPTIVE_MIN_QUESTIONS', raising=False)
+        consistent = [turn_score(seq, 7.0) for seq in (2, 4, 6, 8, 10)]
+
+        assert stopping_decision(consistent[:4], answered=4)['action'] != STOP
+        decision = stopping_decision(consistent, answered=6)
+
+        assert decision['action'] == STOP
+        assert decision['reason'] == 'converged'
+        assert decision['estimates']['technical_knowledge'] == {'mean': 7.0, 'half_width': 0.66, 'n': 5}
+
+    def test_inconsistent_scores_continue_until_maximum(self, monkeypatch):
+        """Test scattered scores keep the interview going up to the maximum"""
+        monkeypatch.setenv('ADAPTIVE_MAX_QUESTIONS', '8')
+        scattered = [turn_score(seq, value) for seq, value in zip((2, 4, 6, 8, 10, 12), (3, 9, 4, 8, 2, 9))]
+
+        assert stopping_decision(scattered, answered=7, topic_start=99)['action'] == CONTINUE
+        assert stopping_decision(scattered, answered=8)['reason'] == 'max_questions'
+
+    def test_topic_shift_counts_answers_since_topic_start(self):
+        """Test a topic is left once its last answers agree, counting only answers after it began"""
+        turns = [
+            {'role': 'interviewer', 'content': 'Q1', 'question_id': 'bank-1'},
+            {'role': 'candidate', 'content': 'A1'},
+            {'role': 'interviewer', 'content': 'Q2'},
+            {'role': 'candidate', 'content': 'A2'},
+            {'role': 'interviewer', 'content': 'Q3', 'topic_shift': True},
+            {'role': 'candidate', 'content': 'A3'}
+        ]
+        scores = [turn_score(1, 6.0), turn_score(3, 6.5), turn_score(5, 6.0)]
+
+        assert topic_start(turns) == 4
+        assert stopping_decision(scores, answered=3, topic_start=4)['action'] == CONTINUE
+        assert stopping_decision(scores, answered=3, topic_start=2)['action'] == CONTINUE
+        assert stopping_decision(scores, answered=3)['action'] == SHIFT_TOPIC
+
+    def test_flag_defaults_off(self, monkeypatch):
+        """Test adaptive stopping is opt-in"""
+        monkeypatch.delenv('ADAPTIVE_STOPPING', raising=False)
+        assert not adaptive_stopping_enabled()
@@ -0,0 +1,81 @@
+"""
+Test suite for the lazy AWS client factory
+"""
+
+import os
+import sys
+import subprocess
+from unittest.mock import patch
+
+# Add src and tests to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.dirname(__file__))
+
+from aws_clients import AWSClientFactory, LazyAWS, client_config
+from profile_cold_start import profile_entry_point
+
+
+class TestAWSClientFactory:
+    """Test memoization, lazy proxies and cold-start behaviour"""
+
+    def test_clients_are_memoized(self):
+        """Test each service is built once per region"""
+        factory = AWSClientFactory()
+
+        assert factory.client('s3') is factory.client('s3')
+        assert factory.client('s3', 'eu-west-1') is not factory.client('s3')
+        assert factory.table('t') is factory.table('t')
+        assert [c['name'] for c in factory.constructed] == ['s3', 's3', 'dynamodb', 't']
+
+    def test_lazy_proxy_defers_construction(self):
+        """Test nothing is built until an attribute is used, then only once"""
+        factory = AWSClientFactory()
+        proxy = LazyAWS(lambda: factory.client('polly'), 'client:polly')
+
+        assert factory.constructed == []
+        assert proxy.meta.service_model.service_name == 'polly'
+        proxy.meta
+        assert len(factory.constructed) == 1
+
+    def test_proxy_methods_can_be_patched(self):
+        """Test module-level proxies still support patch('module.client.method')"""
+        factory = AWSClientFactory()
+        proxy = LazyAWS(lambda: factory.client('s3'), 'client:s3')
+
+        with patch.object(proxy, 'get_object', return_value={'Body': b''}) as mock_get:
+            assert proxy.get_object(Bucket='b', Key='k') == {'Body': b''}
+        mock_get.assert_called_once()
+        assert proxy.get_object is not mock_get
+
+    def test_bedrock_runtime_is_not_retried_by_botocore(self):
+        """Test bedrock runtimes leave retries to bedrock_resilience"""
+        assert client_config('bedrock-runtime').retries['max_attempts'] == 1
+        assert client_config('dynamodb').retries['max_attempts'] == 3
+
+    def test_entry_points_build_no_clients_at_import(self):
+        """Test the orchestrator imports as Lambda loads it, building no clients and skipping boto3"""
+        profile = profile_entry_point('src.lambda.orchestrator', '')
+
+        assert 'error' not in profile
+        assert profile['clients_at_import'] == []
+        assert profile['boto3_loaded'] is False
+
+    def test_auth_handler_imports_as_lambda_loads_it(self):
+        """Test the auth handler finds the shared src/ modules from the repo root"""
+        profile = profile_entry_point('src.auth_handlers', '')
+
+        assert 'error' not in profile
+        assert profile['clients_at_import'] == []
+
+    def test_table_names_come_from_the_environment(self):
+        """Test the orchestrator uses the table names serverless.yml sets"""
+        probe = (
+            "import sys; sys.path.insert(0, 'src/lambda'); import orchestrator; "
+            "print(repr(orchestrator.TRANSCRIPTS_TABLE), repr(orchestrator.INTERVIEWS_TABLE))"
+        )
+        root = os.path.join(os.path.dirname(__file__), '..')
+        env = dict(os.environ, TRANSCRIPTS_TABLE='transcripts-test', AWS_DEFAULT_REGION='us-east-1')
+        env.pop('INTERVIEWS_TABLE', None)
+        output = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, cwd=root, env=env).stdout
+
+        assert output.split() == ['<LazyAWS', 'table:transcripts-test>', '<LazyAWS', 'table:interview_sessions>']
@@ -0,0 +1,76 @@
+"""
+Test suite for Bedrock invocation metrics
+"""
+
+import os
+import sys
+import json
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bedrock_metrics import BedrockMetrics, invocation_cost, latency_bucket
+
+HAIKU = 'anthropic.claude-3-haiku-20240307-v1:0'
+
+
+class TestBedrockMetrics:
+    """Test metric records, histograms and batched persistence"""
+
+    def test_record_is_logged_as_json(self, capsys):
+        """Test each invocation prints one structured metric line"""
+        metrics = BedrockMetrics(table_name=None)
+
+        metrics.record(HAIKU, 'interviewer', 850.0, input_tokens=1000, output_tokens=200,
+                       ttft_ms=120.0, interview_id='i-1', phase='in_progress')
+
+        line = json.loads(capsys.readouterr().out.strip())
+        assert line['metric'] == 'bedrock_invocation'
+        assert line['interview_id'] == 'i-1'
+        assert line['ttft_ms'] == 120.0
+        assert line['latency_bucket'] == 'le_1000'
+        assert line['cost_usd'] == invocation_cost(HAIKU, 1000, 200)
+
+    def test_cost_and_buckets(self):
+        """Test pricing math and histogram bucket labels"""
+        assert invocation_cost(HAIKU, 1000, 1000) == 0.0015
+        assert invocation_cost('custom-model', 1000, 1000) is None
+        assert latency_bucket(90) == 'le_100'
+        assert latency_bucket(100) == 'le_100'
+        assert latency_bucket(50_000) == 'gt_32000'
+
+    def test_histogram_per_phase(self):
+        """Test latency histograms are kept per interview phase"""
+        metrics = BedrockMetrics(table_name=None)
+        for latency in (80, 90, 1500):
+            metrics.record(HAIKU, 'interviewer', latency, phase='in_progress')
+        metrics.record(HAIKU, 'evaluator', 9000, phase='completed')
+
+        assert metrics.histogram('in_progress') == {'le_100': 2, 'le_2000': 1}
+        assert metrics.histogram()['le_16000'] == 1
+
+    def test_rows_are_batched_into_metrics_table(self):
+        """Test rows flush in batches shaped for agent_performance_metrics"""
+        table = MagicMock()
+        batch = table.batch_writer.return_value.__enter__.return_value
+        metrics = BedrockMetrics(table_name='agent_performance_metrics', batch_size=2, table=table)
+
+        metrics.record(HAIKU, 'interviewer', 500.5, phase='in_progress')
+        batch.put_item.assert_not_called()
+        metrics.record(HAIKU, 'coach', 700, phase='coached')
+
+        items = [c.kwargs['Item'] for c in batch.put_item.call_args_list]
+        assert len(items) == 2
+        assert items[0]['agent_id'] == 'interviewer'
+        assert items[0]['category'] == 'latency#in_progress'
+        assert 'interview_id' not in items[0]
+        assert metrics.flush() == 0
+
+    def test_flush_errors_are_swallowed(self):
+        """Test a failing metrics write never raises into the caller"""
+        table = MagicMock()
+        table.batch_writer.side_effect = RuntimeError('throttled')
+        metrics = BedrockMetrics(table_name='agent_performance_metrics', batch_size=1, table=table)
+
+        metrics.record(HAIKU, 'interviewer', 100)
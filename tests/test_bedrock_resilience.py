@@ -0,0 +1,179 @@
+"""
+Test suite for resilient Bedrock invocation
+"""
+
+import pytest
+import os
+import sys
+import time
+
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from bedrock_resilience import ResilientInvoker, CircuitOpenError
+
+
+def client_error(code: str) -> ClientError:
+    """Bedrock-style ClientError with the given code"""
+    return ClientError({'Error': {'Code': code, 'Message': code}}, 'InvokeModel')
+
+
+def flaky(failures: int, code: str = 'ThrottlingException', result: str = 'ok'):
+    """Callable that raises `failures` times, then succeeds"""
+    calls = {'count': 0}
+
+    def fn():
+        calls['count'] += 1
+        if calls['count'] <= failures:
+            raise client_error(code)
+        return result
+    fn.calls = calls
+    return fn
+
+
+class TestResilientInvoker:
+    """Test backoff, circuit breaking, fail-over and hedging"""
+
+    @pytest.fixture
+    def sleeps(self):
+        return []
+
+    @pytest.fixture
+    def invoker(self, sleeps):
+        """Invoker that records backoff instead of sleeping"""
+        return ResilientInvoker(max_attempts=4, failure_threshold=3, hedge_percentile=0, sleep=sleeps.append)
+
+    def test_throttling_is_retried_with_backoff(self, invoker, sleeps):
+        """Test throttled calls retry with bounded, jittered delays"""
+        fn = flaky(2)
+
+        assert invoker.call('model-a', fn) == ('ok', 'model-a')
+        assert fn.calls['count'] == 3
+        assert len(sleeps) == 2
+        assert 0 <= sleeps[0] <= 0.2 and 0 <= sleeps[1] <= 0.4
+
+    def test_connection_errors_are_retried(self, invoker, sleeps):
+        """Test endpoint and read-timeout failures are retried like throttling"""
+        errors = [
+            EndpointConnectionError(endpoint_url='https://bedrock'),
+            ReadTimeoutError(endpoint_url='https://bedrock')
+        ]
+
+        def fn():
+            if errors:
+                raise errors.pop(0)
+            return 'ok'
+
+        assert invoker.call('model-a', fn) == ('ok', 'model-a')
+        assert len(sleeps) == 2
+
+    def test_non_retryable_errors_fail_fast(self, invoker, sleeps):
+        """Test validation errors are raised without retry or fail-over"""
+        fn = flaky(1, code='ValidationException')
+        backup = flaky(0, result='backup')
+
+        with pytest.raises(ClientError):
+            invoker.call('model-a', fn, fallbacks=[('model-b', backup)])
+        assert sleeps == []
+        assert backup.calls['count'] == 0
+
+    def test_open_circuit_fails_over(self, invoker):
+        """Test repeated throttling opens the breaker and routes to the fallback"""
+        primary = flaky(100)
+        backup = flaky(0, result='backup')
+
+        assert invoker.call('model-a', primary, fallbacks=[('model-b', backup)]) == ('backup', 'model-b')
+        assert invoker.breaker('model-a').state == 'open'
+
+        primary.calls['count'] = 0
+        invoker.call('model-a', primary, fallbacks=[('model-b', backup)])
+        assert primary.calls['count'] == 0
+
+    def test_all_circuits_open(self, invoker):
+        """Test a clear error when no candidate can be tried"""
+        for key in ('model-a', 'model-b'):
+            for _ in range(3):
+                invoker.breaker(key).record_failure()
+
+        with pytest.raises(CircuitOpenError):
+            invoker.call('model-a', flaky(0), fallbacks=[('model-b', flaky(0))])
+
+    def test_half_open_probe_closes_circuit(self, invoker):
+        """Test a successful probe after the reset timeout closes the circuit"""
+        invoker.reset_timeout = 0
+        breaker = invoker.breaker('model-a')
+        for _ in range(3):
+            breaker.record_failure()
+
+        assert invoker.call('model-a', flaky(0)) == ('ok', 'model-a')
+        assert breaker.state == 'closed'
+
+    def test_aborted_probe_reopens_circuit(self, invoker):
+        """Test a probe ending in a validation error re-opens instead of blocking the model"""
+        invoker.reset_timeout = 0
+        breaker = invoker.breaker('model-a')
+        for _ in range(3):
+            breaker.record_failure()
+
+        with pytest.raises(ClientError):
+            invoker.call('model-a', flaky(1, code='ValidationException'))
+        assert breaker.state == 'open'
+
+        assert invoker.call('model-a', flaky(0)) == ('ok', 'model-a')
+        assert breaker.state == 'closed'
+
+    def test_committed_stream_is_not_retried(self, invoker, sleeps):
+        """Test a stream that already sent deltas fails instead of retrying or failing over"""
+        forwarded = []
+
+        def stream():
+            forwarded.append('Hello')
+            raise client_error('ThrottlingException')
+        backup = flaky(0, result='backup')
+
+        with pytest.raises(ClientError):
+            invoker.call('model-a', stream, fallbacks=[('model-b', backup)], committed=lambda: bool(forwarded))
+        assert forwarded == ['Hello']
+        assert sleeps == []
+        assert backup.calls['count'] == 0
+
+    def test_hedging_is_off_unless_the_call_opts_in(self, sleeps):
+        """Test the default invoker never hedges; a per-call percentile enables it"""
+        invoker = ResilientInvoker(sleep=sleeps.append)
+        for _ in range(30):
+            invoker.record_latency('model-a', 0.01)
+        calls = {'count': 0}
+
+        def fn():
+            calls['count'] += 1
+            time.sleep(0.05)
+            return 'ok'
+
+        invoker.call('model-a', fn, hedge=True)
+        assert calls['count'] == 1
+
+        invoker.call('model-a', fn, hedge=True, hedge_percentile=95)
+        assert calls['count'] == 3
+
+    def test_slow_call_is_hedged(self, sleeps):
+        """Test a call past the latency percentile races a second request"""
+        invoker = ResilientInvoker(hedge_percentile=95, sleep=sleeps.append)
+        for _ in range(30):
+            invoker.record_latency('model-a', 0.01)
+        calls = {'count': 0}
+
+        def fn():
+            calls['count'] += 1
+            if calls['count'] == 1:
+                time.sleep(0.5)
+                return 'slow'
+            return 'fast'
+
+        started = time.monotonic()
+        result, _ = invoker.call('model-a', fn, hedge=True)
+
+        assert result == 'fast'
+        assert time.monotonic() - started < 0.4
+        assert calls['count'] == 2
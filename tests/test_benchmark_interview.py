@@ -0,0 +1,44 @@
+"""
+Smoke test for the end-to-end interview benchmark harness
+"""
+
+import pytest
+import os
+import sys
+import json
+import subprocess
+
+# Add tests to path
+sys.path.insert(0, os.path.dirname(__file__))
+
+from benchmark_interview import percentile
+
+HARNESS = os.path.join(os.path.dirname(__file__), 'benchmark_interview.py')
+
+
+class TestBenchmarkHarness:
+    """Test the harness runs a tiny load end to end"""
+
+    def test_percentile_nearest_rank(self):
+        """Test nearest-rank percentiles on small samples"""
+        samples = [10.0, 20.0, 30.0, 40.0]
+
+        assert percentile(samples, 50) == 20.0
+        assert percentile(samples, 99) == 40.0
+        assert percentile([], 95) == 0.0
+
+    def test_full_lifecycle_report(self):
+        """Test every action completes without errors and storage writes are counted"""
+        pytest.importorskip('moto')
+        # Separate process: the harness must import the orchestrator after the stand-ins start
+        result = subprocess.run(
+            [sys.executable, HARNESS, '--interviews', '2', '--concurrency', '2', '--answers', '2',
+             '--latency-ms', '5', '--ttft-ms', '5', '--chunk-delay-ms', '0', '--json'],
+            capture_output=True, text=True, timeout=300
+        )
+        assert result.returncode == 0, result.stderr
+
+        report = json.loads(result.stdout)
+        assert report['actions']['send_response']['count'] == 4
+        assert all(stats['errors'] == 0 for stats in report['actions'].values())
+        assert report['storage_bytes_written'] > 0
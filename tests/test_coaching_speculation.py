@@ -0,0 +1,64 @@
+"""
+Test suite for speculative parallel coaching
+"""
+
+import os
+import sys
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from coaching_speculation import (
+    AREAS_SECTION, SUMMARY_SECTION, parallel_coaching_enabled, split_sections, section,
+    merge_coaching, evaluation_digest
+)
+
+DRAFT = """Great effort today!
+
+💪 WHAT YOU DID WELL
+- Clear structure
+⚠️ AREAS TO IMPROVE
+- Caching trade-offs
+🎯 YOUR 7-14 DAY PREPARATION PLAN
+Days 1-3: Review caching"""
+
+
+class TestCoachingSpeculation:
+    """Test section splitting and merging the draft with the reconciliation"""
+
+    def test_split_sections(self):
+        """Test headers are recognised with emoji and numbers and body lines are not"""
+        sections = split_sections(DRAFT)
+
+        assert [title for title, _ in sections] == [None, 'WHAT YOU DID WELL', AREAS_SECTION, 'PREPARATION PLAN']
+        assert section(DRAFT, AREAS_SECTION) == '⚠️ AREAS TO IMPROVE\n- Caching trade-offs'
+        assert section(DRAFT, SUMMARY_SECTION) == ''
+
+    def test_merge_places_reconciled_sections(self):
+        """Test the summary leads, the verdict closes and score sections the draft wrote anyway are replaced"""
+        draft = DRAFT + "\n🏆 FINAL READINESS VERDICT\nGuessed verdict"
+        reconciliation = (
+            "🏆 FINAL READINESS VERDICT\nNeeds Practice\n"
+            "📊 PERFORMANCE SUMMARY\n- Good structure\n"
+            "➕ ALSO FOCUS ON\n- Testing"
+        )
+
+        merged = merge_coaching(draft, reconciliation)
+
+        assert merged.startswith('📊 PERFORMANCE SUMMARY\n- Good structure\n\nGreat effort today!')
+        assert merged.endswith('➕ ALSO FOCUS ON\n- Testing\n\n🏆 FINAL READINESS VERDICT\nNeeds Practice')
+        assert 'Guessed verdict' not in merged
+
+    def test_merge_without_headers_uses_summary(self):
+        """Test an unstructured reconciliation still leads the report"""
+        assert merge_coaching(DRAFT, 'You are almost ready.').startswith('You are almost ready.\n\nGreat effort')
+
+    def test_flag_and_digest(self, monkeypatch):
+        """Test the flag is off by default and the digest keeps only score fields"""
+        monkeypatch.delenv('PARALLEL_COACHING', raising=False)
+        assert not parallel_coaching_enabled()
+        monkeypatch.setenv('PARALLEL_COACHING', 'true')
+        assert parallel_coaching_enabled()
+
+        assert evaluation_digest({'overall_score': 7, 'chunks_evaluated': 3}) == {'overall_score': 7}
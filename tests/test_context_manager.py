@@ -0,0 +1,83 @@
+"""
+Test suite for the rolling-summary interviewer context
+"""
+
+import os
+import sys
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from transcript import Transcript
+from context_manager import RollingContext, estimate_tokens, extractive_summary
+
+
+def build_transcript(turn_count: int, words_per_turn: int = 50) -> Transcript:
+    """Transcript of alternating interviewer/candidate turns"""
+    transcript = Transcript()
+    for i in range(turn_count):
+        role = 'interviewer' if i % 2 == 0 else 'candidate'
+        transcript.append(role, f"turn {i} " + 'word ' * words_per_turn)
+    return transcript
+
+
+class TestRollingContext:
+    """Test windowing, folding and budget behaviour"""
+
+    def test_short_interview_is_sent_verbatim(self):
+        """Test nothing is summarised while everything fits"""
+        transcript = build_transcript(4)
+        context = RollingContext(token_budget=10_000)
+
+        assert context.prepare_update(transcript) is None
+        assert context.render(transcript) == transcript.render()
+
+    def test_prompt_size_stays_flat(self):
+        """Test rendered context stays near budget as the interview grows"""
+        context = RollingContext(token_budget=300)
+        summarize = lambda previous, text: 'summary of earlier turns'
+        transcript = Transcript()
+        sizes = []
+
+        for i in range(60):
+            transcript.append('candidate' if i % 2 else 'interviewer', f"turn {i} " + 'word ' * 50)
+            pending = context.prepare_update(transcript)
+            if pending:
+                context.run_update(pending, summarize)
+            sizes.append(estimate_tokens(context.render(transcript)))
+
+        assert max(sizes[20:]) <= 300 + 100
+        assert 'turn 59' in context.render(transcript)
+        assert 'turn 0 ' not in context.render(transcript)
+
+    def test_unfolded_turns_stay_visible(self):
+        """Test turns pending a summary update are still rendered verbatim"""
+        transcript = build_transcript(20)
+        context = RollingContext(token_budget=200)
+
+        assert context.prepare_update(transcript) is not None
+        assert context.render(transcript) == transcript.render()
+
+    def test_fold_passes_previous_summary(self):
+        """Test the summariser receives the previous summary and new turns"""
+        transcript = build_transcript(20)
+        context = RollingContext(token_budget=200, summary='earlier', summarized_turns=2)
+        seen = {}
+
+        def summarize(previous, text):
+            seen['previous'], seen['text'] = previous, text
+            return 'updated'
+
+        context.run_update(context.prepare_update(transcript), summarize)
+
+        assert seen['previous'] == 'earlier'
+        assert seen['text'].startswith('INTERVIEWER: turn 2')
+        assert context.summary == 'updated'
+        assert context.summarized_turns > 2
+
+    def test_extractive_fallback_keeps_questions(self):
+        """Test the model-free fallback keeps only interviewer questions"""
+        text = "INTERVIEWER: What is a mutex?\nCANDIDATE: A lock."
+
+        assert extractive_summary('', text) == '- Asked: What is a mutex?'
@@ -0,0 +1,104 @@
+"""
+Test suite for the local Bedrock stand-in server
+"""
+
+import pytest
+import os
+import sys
+import json
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from fake_bedrock import FakeBedrockConfig, start_fake_bedrock
+from aws_endpoints import endpoint_url
+
+NO_RETRIES = Config(retries={'max_attempts': 1, 'mode': 'standard'})
+
+
+def client(service: str, url: str):
+    """boto3 client pointed at the stand-in with dummy credentials"""
+    return boto3.client(
+        service, region_name='us-east-1', endpoint_url=url, config=NO_RETRIES,
+        aws_access_key_id='local', aws_secret_access_key='local'
+    )
+
+
+def request_body(system: str, user: str) -> str:
+    return json.dumps({
+        'anthropic_version': 'bedrock-2023-06-01',
+        'max_tokens': 100,
+        'system': system,
+        'messages': [{'role': 'user', 'content': user}]
+    })
+
+
+@pytest.fixture
+def fake():
+    """Fast, deterministic stand-in"""
+    config = FakeBedrockConfig(latency_ms=5, latency_sigma=0, ttft_ms=5, chunk_delay_ms=0, seed=1)
+    server, url = start_fake_bedrock(config)
+    yield config, url
+    server.shutdown()
+
+
+class TestFakeBedrock:
+    """Test the stand-in against real boto3 clients"""
+
+    def test_invoke_model_canned_reply(self, fake):
+        """Test blocking calls return an Anthropic messages response with usage"""
+        _, url = fake
+        response = client('bedrock-runtime', url).invoke_model(
+            modelId='anthropic.claude-3-haiku-20240307-v1:0',
+            body=request_body('You are the evaluator agent', 'Evaluate this')
+        )
+
+        body = json.loads(response['body'].read())
+        assert json.loads(body['content'][0]['text'])['overall_score'] == 72
+        assert body['usage']['output_tokens'] > 0
+
+    def test_streaming_echo(self, fake):
+        """Test the response stream decodes to deltas that rebuild the reply"""
+        config, url = fake
+        config.mode = 'echo'
+        response = client('bedrock-runtime', url).invoke_model_with_response_stream(
+            modelId='anthropic.claude-3-haiku-20240307-v1:0',
+            body=request_body('system', 'tell me about your last project please')
+        )
+
+        payloads = [json.loads(e['chunk']['bytes']) for e in response['body']]
+        text = ''.join(p['delta']['text'] for p in payloads if p['type'] == 'content_block_delta')
+        assert text == 'tell me about your last project please'
+        assert payloads[0]['type'] == 'message_start'
+
+    def test_throttling_injection(self, fake):
+        """Test injected throttles surface as ThrottlingException"""
+        config, url = fake
+        config.throttle_rate = 1.0
+
+        with pytest.raises(ClientError) as error:
+            client('bedrock-runtime', url).invoke_model(modelId='m', body=request_body('s', 'u'))
+        assert error.value.response['Error']['Code'] == 'ThrottlingException'
+
+    def test_invoke_agent_stream(self, fake):
+        """Test agent invocations stream completion chunks"""
+        config, url = fake
+        config.mode = 'echo'
+        response = client('bedrock-agent-runtime', url).invoke_agent(
+            agentId='agent', agentAliasId='alias', sessionId='session', inputText='hello there agent'
+        )
+
+        text = ''.join(e['chunk']['bytes'].decode() for e in response['completion'])
+        assert text == 'hello there agent'
+
+    def test_endpoint_configuration(self, monkeypatch):
+        """Test the local endpoint applies only to services the stand-in fakes"""
+        monkeypatch.setenv('LOCAL_AWS_ENDPOINT_URL', 'http://127.0.0.1:4010')
+        monkeypatch.delenv('AWS_ENDPOINT_URL_BEDROCK_RUNTIME', raising=False)
+
+        assert endpoint_url('bedrock-runtime') == 'http://127.0.0.1:4010'
+        assert endpoint_url('dynamodb') is None
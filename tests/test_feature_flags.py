@@ -0,0 +1,35 @@
+"""
+Test suite for environment feature flags
+"""
+
+import os
+import sys
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from feature_flags import env_flag
+
+
+class TestEnvFlag:
+    """Test parsing of boolean switches"""
+
+    def test_recognised_values(self, monkeypatch):
+        """Test true/false spellings override the default either way"""
+        for value in ('1', 'true', 'YES', ' on '):
+            monkeypatch.setenv('SOME_FLAG', value)
+            assert env_flag('SOME_FLAG') is True
+        for value in ('0', 'False', 'no', 'OFF'):
+            monkeypatch.setenv('SOME_FLAG', value)
+            assert env_flag('SOME_FLAG', default=True) is False
+
+    def test_unset_empty_or_unknown_uses_default(self, monkeypatch):
+        """Test anything unrecognised falls back to the default"""
+        monkeypatch.delenv('SOME_FLAG', raising=False)
+        assert env_flag('SOME_FLAG') is False
+        assert env_flag('SOME_FLAG', default=True) is True
+
+        for value in ('', 'maybe'):
+            monkeypatch.setenv('SOME_FLAG', value)
+            assert env_flag('SOME_FLAG') is False
+            assert env_flag('SOME_FLAG', default=True) is True
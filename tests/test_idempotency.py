@@ -0,0 +1,96 @@
+"""
+Test suite for idempotent action execution
+"""
+
+import pytest
+import os
+import sys
+from unittest.mock import MagicMock
+from botocore.exceptions import ClientError
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from idempotency import (
+    IdempotencyStore, IdempotencyError, RequestInProgressError, KeyReuseError,
+    idempotency_key, request_fingerprint, COMPLETED, IN_PROGRESS
+)
+
+
+def condition_failed(item=None):
+    """ConditionalCheckFailedException as DynamoDB raises it (item in low-level format)"""
+    response = {'Error': {'Code': 'ConditionalCheckFailedException', 'Message': 'failed'}}
+    if item is not None:
+        response['Item'] = item
+    return ClientError(response, 'PutItem')
+
+
+class TestIdempotency:
+    """Test keys, fingerprints, claims and replays"""
+
+    def test_idempotency_key_sources(self):
+        """Test the key comes from the payload or the Idempotency-Key header and is validated"""
+        assert idempotency_key({'idempotency_key': 'abc-1'}) == 'abc-1'
+        assert idempotency_key({}, {'Idempotency-Key': 'abc-2'}) == 'abc-2'
+        assert idempotency_key({}, {'content-type': 'application/json'}) is None
+        with pytest.raises(IdempotencyError):
+            idempotency_key({'idempotency_key': 'has spaces'})
+
+    def test_fingerprint_ignores_transport_fields(self):
+        """Test the key and headers do not change the fingerprint but the request does"""
+        event = {'action': 'send_response', 'interview_id': 'i-1', 'candidate_answer': 'A'}
+
+        assert request_fingerprint(event) == request_fingerprint(dict(event, idempotency_key='k', headers={}))
+        assert request_fingerprint(event) != request_fingerprint(dict(event, candidate_answer='B'))
+
+    def test_claim_new_key(self):
+        """Test a new key is claimed with a conditional write and a lease"""
+        table = MagicMock()
+
+        claim = IdempotencyStore(table, lease_seconds=60).claim('k', 'f')
+
+        put = table.put_item.call_args.kwargs
+        assert put['Item']['record_status'] == IN_PROGRESS
+        assert put['Item']['claim_token'] == claim['token']
+        assert 'attribute_not_exists' in put['ConditionExpression']
+
+    def test_claim_replays_completed_response(self):
+        """Test a retry gets the stored response from the failed write, without another read"""
+        table = MagicMock()
+        table.put_item.side_effect = condition_failed({
+            'idempotency_key': {'S': 'k'},
+            'fingerprint': {'S': 'f'},
+            'record_status': {'S': COMPLETED},
+            'status_code': {'N': '200'},
+            'response_body': {'S': '{"status": "ok"}'}
+        })
+
+        claim = IdempotencyStore(table).claim('k', 'f')
+
+        assert claim == {'response': {'statusCode': 200, 'body': '{"status": "ok"}'}}
+        table.get_item.assert_not_called()
+
+    def test_claim_conflicts(self):
+        """Test an unfinished claim and a different request with the same key are rejected"""
+        table = MagicMock()
+        table.put_item.side_effect = condition_failed()
+        store = IdempotencyStore(table)
+
+        table.get_item.return_value = {'Item': {'fingerprint': 'f', 'record_status': IN_PROGRESS}}
+        with pytest.raises(RequestInProgressError):
+            store.claim('k', 'f')
+        with pytest.raises(KeyReuseError):
+            store.claim('k', 'other')
+
+    def test_complete_and_release_require_the_claim(self):
+        """Test completion and release are conditional on the claim token"""
+        table = MagicMock()
+        table.update_item.side_effect = condition_failed()
+        store = IdempotencyStore(table)
+
+        store.complete('k', 't-1', {'statusCode': 200, 'body': '{}'})
+        store.release('k', 't-1')
+
+        assert table.update_item.call_args.kwargs['ExpressionAttributeValues'][':token'] == 't-1'
+        assert table.delete_item.call_args.kwargs['ConditionExpression'] == 'claim_token = :token'
@@ -0,0 +1,93 @@
+"""
+Test suite for the post-interview job queue
+"""
+
+import pytest
+import os
+import sys
+import json
+import threading
+from unittest.mock import MagicMock
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from job_queue import (
+    JobStatusStore, LocalJobQueue, SQSJobQueue, new_job, jobs_from_sqs_event, MAX_ATTEMPTS, DONE, FAILED
+)
+
+
+class TestJobQueue:
+    """Test job messages, status tracking and the local worker pool"""
+
+    def test_new_job_rejects_unknown_kind(self):
+        """Test only evaluate and coach jobs can be built"""
+        job = new_job('evaluate', 'i-1', {'connection_id': 'c'})
+
+        assert job['kind'] == 'evaluate'
+        assert job['notify'] == {'connection_id': 'c'}
+        with pytest.raises(ValueError):
+            new_job('transcribe', 'i-1')
+
+    def test_status_store_mark_and_get(self):
+        """Test statuses are plain session attributes and errors are cleared on success"""
+        table = MagicMock()
+        store = JobStatusStore(table)
+
+        store.mark('i-1', 'coach', FAILED, 'boom')
+        failed = table.update_item.call_args.kwargs
+        store.mark('i-1', 'coach', DONE)
+        done = table.update_item.call_args.kwargs
+
+        assert failed['ExpressionAttributeValues'][':error'] == 'boom'
+        assert 'ConditionExpression' not in failed
+        assert done['UpdateExpression'].endswith('REMOVE coaching_status_error')
+
+        table.get_item.return_value = {'Item': {'evaluation_status': DONE}}
+        statuses = store.get('i-1')
+        assert statuses['evaluate']['status'] == DONE
+        assert statuses['coach']['status'] is None
+
+    def test_sqs_queue_sends_json(self):
+        """Test SQS jobs are JSON message bodies and records parse back"""
+        client = MagicMock()
+        job = new_job('evaluate', 'i-1')
+
+        SQSJobQueue(client, 'https://sqs/queue').enqueue(job)
+        body = client.send_message.call_args.kwargs['MessageBody']
+
+        assert list(jobs_from_sqs_event({'Records': [{'messageId': 'm-1', 'body': body}]})) == [('m-1', job)]
+
+    def test_local_queue_retries_and_chains(self):
+        """Test failed jobs are retried and jobs queued by a job are drained too"""
+        attempts = []
+        lock = threading.Lock()
+        queue = None
+
+        def handler(job):
+            with lock:
+                attempts.append(job['kind'])
+            if job['kind'] == 'evaluate':
+                queue.enqueue(new_job('coach', job['interview_id']))
+            else:
+                raise RuntimeError('coach unavailable')
+
+        queue = LocalJobQueue(handler, max_workers=2)
+        queue.enqueue(new_job('evaluate', 'i-1'))
+        queue.drain(timeout=10)
+
+        assert attempts.count('evaluate') == 1
+        assert attempts.count('coach') == MAX_ATTEMPTS
+
+    def test_local_queue_recovers_persisted_jobs(self, tmp_path):
+        """Test jobs left in the queue directory run on the next start and are removed"""
+        job = new_job('evaluate', 'i-1')
+        (tmp_path / f"{job['job_id']}.json").write_text(json.dumps(job))
+        processed = []
+
+        queue = LocalJobQueue(processed.append, directory=str(tmp_path))
+        queue.drain(timeout=10)
+
+        assert processed == [job]
+        assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,77 @@
+"""
+Test suite for tolerant JSON extraction and schema validation
+"""
+
+import pytest
+import os
+import sys
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from api_handlers import get_response_schemas
+from json_extraction import (
+    JSONObjectExtractor, extract_json, relaxed_loads, schema_errors, malformed_fields, repair_prompt
+)
+
+REPLY = 'Here is the evaluation:\n```json\n{"scores": {"a": 1}, "notes": "use } and { freely", "tags": ["x",],}\n```\nLet me know!'
+
+
+class TestJSONExtraction:
+    """Test extraction from model replies and validation against the response schemas"""
+
+    def test_extracts_first_object_from_prose(self):
+        """Test preambles, code fences, braces in strings and trailing commas are handled"""
+        assert extract_json(REPLY) == {'scores': {'a': 1}, 'notes': 'use } and { freely', 'tags': ['x']}
+        assert extract_json('{not json} then {"ok": true}') == {'ok': True}
+        assert extract_json('no object here') is None
+
+    def test_streamed_deltas(self):
+        """Test the object is returned by the delta that completes it, and not before"""
+        extractor = JSONObjectExtractor()
+        results = [extractor.feed(REPLY[i:i + 7]) for i in range(0, len(REPLY), 7)]
+
+        complete = [r for r in results if r is not None]
+        assert results[0] is None
+        assert complete[0] == extract_json(REPLY)
+
+    def test_truncated_object_is_closed(self):
+        """Test a reply cut off mid-object keeps its complete members"""
+        truncated = '{"scores": {"a": 1, "b": 2}, "strengths": ["Clear", "Conc'
+
+        assert extract_json(truncated) is None
+        assert extract_json(truncated, allow_partial=True) == {'scores': {'a': 1, 'b': 2}, 'strengths': ['Clear']}
+        with pytest.raises(ValueError):
+            relaxed_loads('{"a": }')
+
+    def test_schema_errors_against_evaluation_schema(self):
+        """Test type, range, enum and required violations are reported per field"""
+        schema = get_response_schemas()['Evaluation']
+        evaluation = {
+            'scores': {'technical_knowledge': 75, 'communication_clarity': 8, 'confidence_level': 7},
+            'overall_score': 7.5,
+            'readiness_level': 'Maybe',
+            'strengths': 'Clear',
+            'weaknesses': [],
+            'improvement_areas': [],
+            'overall_assessment': 'Good.'
+        }
+
+        errors = schema_errors(evaluation, schema)
+
+        assert ('scores.problem_solving', 'is missing') in errors
+        assert ('scores.technical_knowledge', 'must be at most 10') in errors
+        assert ('strengths', 'must be of type array') in errors
+        assert malformed_fields(errors) == ['strengths', 'scores', 'readiness_level']
+
+    def test_repair_prompt_lists_only_broken_fields(self):
+        """Test the repair prompt carries the valid fields as context and asks for the rest"""
+        schema = get_response_schemas()['Evaluation']
+        evaluation = {'overall_score': 7.5, 'strengths': 'Clear'}
+
+        prompt = repair_prompt(evaluation, schema, schema_errors(evaluation, schema), 'Q: ... A: ...')
+
+        assert 'Fields to return: scores, readiness_level, weaknesses, improvement_areas, overall_assessment, strengths' in prompt
+        assert '"overall_score": 7.5' in prompt
+        assert '"strengths": "Clear"' not in prompt
@@ -0,0 +1,129 @@
+"""
+Test suite for map-reduce transcript evaluation
+"""
+
+import pytest
+import os
+import sys
+import json
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from evaluation_rubric import EVALUATION_RUBRIC
+from map_reduce_evaluation import (
+    CHUNK_SYSTEM_PROMPT, question_segments, chunk_segments, answer_weight,
+    parse_chunk_evaluation, merge_chunk_evaluations, map_reduce_enabled
+)
+
+
+def chunk_evaluation(breakdown, scores=None, strengths=(), topics_weak=(), assessment=''):
+    """Parsed segment evaluation"""
+    return {
+        'score_breakdown': breakdown,
+        'scores': scores or {},
+        'strengths': list(strengths),
+        'weaknesses': [],
+        'improvement_areas': [],
+        'topics_strong': [],
+        'topics_weak': list(topics_weak),
+        'assessment': assessment
+    }
+
+
+class TestMapReduceEvaluation:
+    """Test segmenting, chunking, parsing and the weighted merge"""
+
+    def test_rubric_weights(self):
+        """Test the rubric sums to 100 points and drives the segment prompt"""
+        assert sum(weight for _, _, _, weight in EVALUATION_RUBRIC) == 100
+        assert '"systemDesign": 0' in CHUNK_SYSTEM_PROMPT
+        assert '(0-40 points)' in CHUNK_SYSTEM_PROMPT
+
+    def test_question_segments(self):
+        """Test segments start at interviewer turns and unanswered ones are dropped"""
+        turns = [
+            {'role': 'interviewer', 'content': 'Q1'},
+            {'role': 'candidate', 'content': 'A1'},
+            {'role': 'candidate', 'content': 'A1 more'},
+            {'role': 'interviewer', 'content': 'Q2'},
+            {'role': 'candidate', 'content': 'A2'},
+            {'role': 'interviewer', 'content': 'Any questions for me?'}
+        ]
+
+        segments = question_segments(turns)
+
+        assert [[t['content'] for t in s] for s in segments] == [['Q1', 'A1', 'A1 more'], ['Q2', 'A2']]
+
+    def test_chunk_segments_never_splits_a_segment(self):
+        """Test segments are packed up to the budget and an oversized one stands alone"""
+        short = [{'role': 'interviewer', 'content': 'Q' * 40}, {'role': 'candidate', 'content': 'A' * 40}]
+        long = [{'role': 'interviewer', 'content': 'Q'}, {'role': 'candidate', 'content': 'A' * 400}]
+
+        chunks = chunk_segments([short, short, long, short], max_tokens=60)
+
+        assert [len(c) for c in chunks] == [4, 2, 2]
+        assert answer_weight(chunks[1]) > answer_weight(chunks[0])
+
+    def test_parse_chunk_evaluation_clamps_to_rubric(self):
+        """Test rubric points are clamped to each criterion's weight"""
+        text = "Here:\n" + json.dumps({
+            'scoreBreakdown': {'technicalKnowledge': 55, 'awareness': -1, 'systemDesign': 'n/a'},
+            'scores': {'technical_knowledge': 8},
+            'strengths': 'not a list'
+        })
+
+        parsed = parse_chunk_evaluation(text)
+
+        assert parsed['score_breakdown'] == {'technicalKnowledge': 40.0, 'awareness': 0.0}
+        assert parsed['scores'] == {'technical_knowledge': 8.0}
+        assert parsed['strengths'] == []
+        assert parse_chunk_evaluation('{"scores": {}}') is None
+        assert parse_chunk_evaluation('no json') is None
+
+    def test_merge_weights_chunks_by_answer_length(self):
+        """Test criterion points are averaged by answer weight and summed to the rubric score"""
+        full = {'technicalKnowledge': 40, 'problemSolving': 25, 'systemDesign': 20, 'communication': 10, 'awareness': 5}
+        half = {key: value / 2 for key, value in full.items()}
+
+        merged = merge_chunk_evaluations([
+            (chunk_evaluation(full, {'technical_knowledge': 10}, ['Clear'], assessment='Strong start.'), 3),
+            (chunk_evaluation(half, {'technical_knowledge': 6}, ['Clear'], ['SQL'], 'Weaker later.'), 1)
+        ])
+
+        assert merged['rubric_score'] == 87.5
+        assert merged['overall_score'] == 8.75
+        assert merged['readiness_level'] == 'Almost Ready'
+        assert merged['scores'] == {'technical_knowledge': 9.0}
+        assert merged['strengths'] == ['Clear']
+        assert merged['technical_depth']['topics_weak'] == ['SQL']
+        assert merged['overall_assessment'] == 'Strong start. Weaker later.'
+        assert merged['chunks_evaluated'] == 2
+
+    def test_merge_rescales_unscored_criteria(self):
+        """Test a criterion no chunk scored does not count as zero"""
+        merged = merge_chunk_evaluations([
+            (chunk_evaluation({'technicalKnowledge': 30, 'problemSolving': 20}), 1)
+        ])
+
+        assert merged['rubric_score'] == pytest.approx(50 * 100 / 65, abs=0.01)
+
+    def test_merge_without_rubric_points_uses_scores(self):
+        """Test chunks that return only dimension scores still get an overall score"""
+        merged = merge_chunk_evaluations([
+            (chunk_evaluation({}, {'technical_knowledge': 8, 'problem_solving': 7}), 1),
+            (chunk_evaluation({}, {'technical_knowledge': 6, 'problem_solving': 5}), 1)
+        ])
+
+        assert merged['score_breakdown'] == {}
+        assert merged['overall_score'] == 6.5
+        assert merged['rubric_score'] == 65.0
+        assert merged['readiness_level'] == 'Needs Improvement'
+
+    def test_flag_defaults_off(self, monkeypatch):
+        """Test chunked evaluation is opt-in, like the other evaluation flags"""
+        monkeypatch.delenv('MAP_REDUCE_EVALUATION', raising=False)
+        assert not map_reduce_enabled()
+        monkeypatch.setenv('MAP_REDUCE_EVALUATION', 'true')
+        assert map_reduce_enabled()
@@ -0,0 +1,95 @@
+"""
+Test suite for the cost/latency-aware Bedrock Model Router
+"""
+
+import pytest
+import os
+import sys
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from model_router import ModelRouter
+
+HAIKU = 'anthropic.claude-3-haiku-20240307-v1:0'
+SONNET = 'anthropic.claude-3-sonnet-20240229-v1:0'
+OPUS = 'anthropic.claude-3-opus-20240229-v1:0'
+
+
+class TestModelRouter:
+    """Test routing from the shipped aws_bedrock_config.json"""
+
+    @pytest.fixture
+    def router(self, monkeypatch):
+        """Router over the real config, without deployment overrides"""
+        for name in ('BEDROCK_INTERVIEWER_MODEL', 'BEDROCK_EVALUATOR_MODEL', 'BEDROCK_COACH_MODEL'):
+            monkeypatch.delenv(name, raising=False)
+        return ModelRouter()
+
+    def test_routes_follow_config(self, router):
+        """Test each call type resolves to the configured model"""
+        assert router.route('greeting').model_id == HAIKU
+        assert router.route('summary').model_id == HAIKU
+        assert router.route('follow_up').model_id == SONNET
+        assert router.route('evaluation').model_id == OPUS
+        assert router.route('coaching').model_id == OPUS
+        assert router.route('follow_up').max_tokens == 1500
+
+    def test_env_override(self, router, monkeypatch):
+        """Test deployment env vars override agent models"""
+        monkeypatch.setenv('BEDROCK_COACH_MODEL', SONNET)
+
+        assert router.route('coaching').model_id == SONNET
+
+    def test_throttled_model_fails_over(self, router):
+        """Test a throttled model routes to its fallback during the cooldown"""
+        router.record(SONNET, 0, throttled=True)
+
+        choice = router.route('follow_up')
+
+        assert choice.model_id == HAIKU
+        assert 'fallback' in choice.reason
+
+    def test_slow_model_fails_over_and_recovers(self, router):
+        """Test sustained high latency degrades a model until it speeds up"""
+        router.record(SONNET, 20_000, call_type='follow_up')
+        assert router.route('follow_up').model_id == HAIKU
+
+        for _ in range(10):
+            router.record(SONNET, 1_000, call_type='follow_up')
+        assert router.route('follow_up').model_id == SONNET
+
+    def test_latency_threshold_is_per_call_type(self, router):
+        """Test a long evaluation neither degrades evaluation nor other call types"""
+        router.record(OPUS, 12_000, call_type='evaluation')
+
+        assert router.route('evaluation').model_id == OPUS
+        assert router.route('coaching').model_id == OPUS
+
+        router.record(OPUS, 90_000, call_type='evaluation')
+        assert router.route('evaluation').model_id == SONNET
+        assert router.route('coaching').model_id == OPUS
+
+    def test_slow_model_is_probed_and_recovers(self, router, monkeypatch):
+        """Test a degraded model gets one probe call per interval and a fast probe clears it"""
+        clock = [1_000.0]
+        monkeypatch.setattr('model_router.time.monotonic', lambda: clock[0])
+        router.record(SONNET, 20_000, call_type='follow_up')
+        assert router.route('follow_up').model_id == HAIKU
+
+        clock[0] += router.latency_probe_interval
+        assert router.route('follow_up').model_id == SONNET  # probe
+        assert router.route('follow_up').model_id == HAIKU
+        router.record(SONNET, 25_000, call_type='follow_up')
+        assert router.route('follow_up').model_id == HAIKU
+
+        clock[0] += router.latency_probe_interval
+        assert router.route('follow_up').model_id == SONNET
+        router.record(SONNET, 900, call_type='follow_up')
+        assert router.route('follow_up').model_id == SONNET
+
+    def test_missing_config_uses_defaults(self, tmp_path):
+        """Test an unreadable config still yields a working router"""
+        router = ModelRouter(config_path=str(tmp_path / 'missing.json'))
+
+        assert router.route('follow_up').model_id == SONNET
@@ -5,6 +5,9 @@ Test suite for Interview Orchestrator
 import pytest
 import json
 import uuid
+import asyncio
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 import sys
@@ -13,7 +16,12 @@ import os
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
 
-from orchestrator import InterviewOrchestrator, lambda_handler, InterviewPhase
+from orchestrator import InterviewOrchestrator, lambda_handler, job_worker_handler, handle_action, InterviewPhase, SESSION_STORE
+from session_store import StaleSessionError
+from job_queue import new_job
+from speculation import SpeculationStore
+from prompt_registry import PROMPT_REGISTRY
+from adaptive_stopping import CLOSING_MESSAGE
 
 
 class TestInterviewOrchestrator:
@@ -86,8 +94,33 @@ class TestInterviewOrchestrator:
         assert 'message' in result
         assert len(orchestrator.conversation_history) == 4  # 2 initial + 2 new
     
+    @patch('orchestrator.bedrock_client.invoke_model')
+    @patch('orchestrator.INTERVIEWS_TABLE.get_item')
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_process_candidate_response_appends_only_new_turns(self, mock_ddb_update, mock_ddb_get,
+                                                               mock_bedrock, orchestrator):
+        """Test each turn is a single list_append write with no read"""
+        
+        orchestrator.job_role = 'Software Engineer'
+        orchestrator.experience_level = '3+ years'
+        orchestrator.conversation_history = [{'role': 'interviewer', 'content': 'Q1'}] * 10
+        mock_bedrock.return_value = {
+            'body': MagicMock(read=lambda: json.dumps({
+                'content': [{'text': 'Q2'}]
+            }).encode())
+        }
+        
+        orchestrator.process_candidate_response('A1')
+        
+        mock_ddb_get.assert_not_called()
+        assert mock_ddb_update.call_count == 1
+        kwargs = mock_ddb_update.call_args.kwargs
+        assert 'list_append' in kwargs['UpdateExpression']
+        assert [t['content'] for t in kwargs['ExpressionAttributeValues'][':turns']] == ['A1', 'Q2']
+    
+    @patch('orchestrator.TRANSCRIPT_STORE.write_turns')
     @patch('orchestrator.INTERVIEWS_TABLE.update_item')
-    def test_end_interview(self, mock_ddb_update, orchestrator):
+    def test_end_interview(self, mock_ddb_update, mock_write_turns, orchestrator):
         """Test ending interview"""
         
         mock_ddb_update.return_value = {}
@@ -100,6 +133,23 @@ class TestInterviewOrchestrator:
         
         assert result['status'] == 'completed'
         assert result['phase'] == InterviewPhase.COMPLETED.value
+        mock_write_turns.assert_called_once_with(orchestrator.interview_id, orchestrator.conversation_history)
+    
+    @patch('orchestrator.TRANSCRIPT_STORE.write_turns')
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_end_interview_queues_evaluation(self, mock_ddb_update, mock_write_turns, orchestrator, monkeypatch):
+        """Test async post-processing queues the evaluation job and returns immediately"""
+        monkeypatch.setenv('ASYNC_POST_PROCESSING', 'true')
+        connection = {'connection_id': 'c-1', 'domain_name': 'ws.example.com', 'stage': 'dev'}
+        
+        with patch('orchestrator.POST_INTERVIEW_QUEUE') as mock_queue, \
+                patch('orchestrator.POST_INTERVIEW_STATUS') as mock_status:
+            result = orchestrator.end_interview(connection)
+        
+        job = mock_queue.enqueue.call_args.args[0]
+        assert (job['kind'], job['interview_id'], job['notify']) == ('evaluate', orchestrator.interview_id, connection)
+        mock_status.mark.assert_called_once_with(orchestrator.interview_id, 'evaluate', 'queued')
+        assert result['jobs'] == {'evaluate': 'queued'}
     
     @patch('orchestrator.bedrock_client.invoke_model')
     @patch('orchestrator.EVALUATIONS_TABLE.put_item')
@@ -141,6 +191,535 @@ class TestInterviewOrchestrator:
         assert 'evaluation' in result
         assert result['evaluation']['overall_score'] == 7.75
 
+    
+    @patch('orchestrator.bedrock_client.invoke_model_with_response_stream')
+    def test_stream_bedrock_yields_deltas(self, mock_stream, orchestrator):
+        """Test streaming call yields only text deltas in order"""
+        
+        events = [
+            {'type': 'message_start', 'message': {}},
+            {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': 'Hello'}},
+            {'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': ' there'}},
+            {'type': 'message_stop'}
+        ]
+        mock_stream.return_value = {
+            'body': [{'chunk': {'bytes': json.dumps(e).encode()}} for e in events]
+        }
+        
+        deltas = list(orchestrator.stream_bedrock('model', 'system', 'user'))
+        
+        assert deltas == ['Hello', ' there']
+    
+    @patch('orchestrator.bedrock_client.invoke_model_with_response_stream')
+    def test_astream_bedrock_yields_deltas(self, mock_stream, orchestrator):
+        """Test async streaming wrapper yields the same deltas"""
+        
+        mock_stream.return_value = {
+            'body': [
+                {'chunk': {'bytes': json.dumps({
+                    'type': 'content_block_delta', 'delta': {'text': text}
+                }).encode()}}
+                for text in ['a', 'b', 'c']
+            ]
+        }
+        
+        async def collect():
+            return [d async for d in orchestrator.astream_bedrock('model', 'system', 'user')]
+        
+        assert asyncio.run(collect()) == ['a', 'b', 'c']
+    
+    @patch('orchestrator.BEDROCK_METRICS.record')
+    @patch('orchestrator.bedrock_client.invoke_model_with_response_stream')
+    def test_astream_bedrock_uses_token_limit_and_records_usage(self, mock_stream, mock_record, orchestrator):
+        """Test async streaming passes the routed token limit and reports usage to the metrics"""
+        events = [
+            {'type': 'message_start', 'message': {'usage': {'input_tokens': 40}}},
+            {'type': 'content_block_delta', 'delta': {'text': 'Hi'}},
+            {'type': 'message_delta', 'usage': {'output_tokens': 3}}
+        ]
+        mock_stream.return_value = {'body': [{'chunk': {'bytes': json.dumps(e).encode()}} for e in events]}
+        usage = {}
+        
+        async def collect():
+            return [d async for d in orchestrator.astream_bedrock('model', 'system', 'user', 300, usage, 'greeting')]
+        
+        assert asyncio.run(collect()) == ['Hi']
+        assert json.loads(mock_stream.call_args.kwargs['body'])['max_tokens'] == 300
+        assert usage == {'input_tokens': 40, 'output_tokens': 3}
+        record = mock_record.call_args
+        assert record.args[0] == 'model'
+        assert record.kwargs['input_tokens'] == 40 and record.kwargs['output_tokens'] == 3
+        assert record.kwargs['ttft_ms'] is not None
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.put_item')
+    def test_start_interview_forwards_deltas(self, mock_ddb_put, orchestrator):
+        """Test start_interview streams greeting deltas to the callback"""
+        
+        received = []
+        with patch.object(orchestrator, 'generate_interviewer_prompt', return_value='prompt'), \
+                patch.object(orchestrator, 'stream_bedrock', return_value=iter(['Hi, ', 'welcome!'])):
+            result = orchestrator.start_interview('Software Engineer', '3+ years', received.append)
+        
+        assert received == ['Hi, ', 'welcome!']
+        assert result['message'] == 'Hi, welcome!'
+    
+    def test_invoke_fails_over_when_throttled(self, orchestrator):
+        """Test a throttled model is retried, then replaced by its fallback"""
+        from botocore.exceptions import ClientError
+        from model_router import ModelRouter
+        from bedrock_resilience import ResilientInvoker
+        
+        router = ModelRouter()
+        primary = router.route('follow_up').model_id
+        backup = router.fallback('follow_up').model_id
+        
+        def call_bedrock(model_id, system, user, max_tokens, usage=None, temperature=None):
+            if model_id == primary:
+                raise ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'slow down'}}, 'InvokeModel')
+            return 'Next question?'
+        
+        with patch('orchestrator.MODEL_ROUTER', router), \
+                patch('orchestrator.BEDROCK_RESILIENCE', ResilientInvoker(max_attempts=2, sleep=lambda s: None)), \
+                patch.object(orchestrator, 'call_bedrock', side_effect=call_bedrock):
+            text, model_id = orchestrator.invoke('follow_up', 'system', 'user')
+        
+        assert text == 'Next question?'
+        assert model_id == backup
+        assert router.route('follow_up').model_id == backup
+    
+    def test_invoke_does_not_fail_over_started_stream(self, orchestrator):
+        """Test a stream throttled after its first delta is not replayed on the fallback"""
+        from botocore.exceptions import ClientError
+        from model_router import ModelRouter
+        from bedrock_resilience import ResilientInvoker
+        
+        router = ModelRouter()
+        primary = router.route('follow_up').model_id
+        
+        def stream_bedrock(model_id, system, user, max_tokens, usage=None, temperature=None):
+            yield 'Next ' if model_id == primary else 'Other question?'
+            if model_id == primary:
+                raise ClientError({'Error': {'Code': 'ThrottlingException', 'Message': 'slow down'}}, 'InvokeModel')
+        deltas = []
+        
+        with patch('orchestrator.MODEL_ROUTER', router), \
+                patch('orchestrator.BEDROCK_RESILIENCE', ResilientInvoker(max_attempts=2, sleep=lambda s: None)), \
+                patch.object(orchestrator, 'stream_bedrock', side_effect=stream_bedrock):
+            with pytest.raises(ClientError):
+                orchestrator.invoke('follow_up', 'system', 'user', deltas.append)
+        
+        assert deltas == ['Next ']
+    
+    @patch('orchestrator.BEDROCK_METRICS.record')
+    @patch('orchestrator.bedrock_client.invoke_model')
+    def test_invoke_records_metrics(self, mock_bedrock, mock_record, orchestrator):
+        """Test each model call reports usage, latency and context to BEDROCK_METRICS"""
+        mock_bedrock.return_value = {
+            'body': MagicMock(read=lambda: json.dumps({
+                'content': [{'text': 'Hello'}],
+                'usage': {'input_tokens': 120, 'output_tokens': 8}
+            }))
+        }
+        
+        text, model_id = orchestrator.invoke('greeting', 'system', 'user')
+        
+        args, kwargs = mock_record.call_args
+        assert args[:2] == (model_id, 'interviewer')
+        assert kwargs['input_tokens'] == 120
+        assert kwargs['output_tokens'] == 8
+        assert kwargs['interview_id'] == orchestrator.interview_id
+        assert kwargs['phase'] == 'init'
+        assert kwargs['estimated_tokens'] is False
+    
+    @patch('orchestrator.bedrock_client.invoke_model')
+    def test_invoke_sends_routed_temperature(self, mock_bedrock, orchestrator):
+        """Test the routed model's temperature and token limit reach the request body"""
+        from model_router import MODEL_ROUTER
+        mock_bedrock.return_value = {
+            'body': MagicMock(read=lambda: json.dumps({'content': [{'text': 'Hello'}]}))
+        }
+        choice = MODEL_ROUTER.route('follow_up')
+        
+        orchestrator.invoke('follow_up', 'system', 'user')
+        
+        body = json.loads(mock_bedrock.call_args.kwargs['body'])
+        assert body['temperature'] == choice.temperature
+        assert body['max_tokens'] == choice.max_tokens
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.put_item')
+    def test_start_interview_serves_bank_warm_up(self, mock_ddb_put, orchestrator):
+        """Test a role in the question bank opens without a model call"""
+        with patch.object(orchestrator, 'invoke') as mock_invoke, \
+                patch.object(orchestrator, 'speculate'):
+            result = orchestrator.start_interview('Python Backend Engineer', 'Fresher')
+        
+        mock_invoke.assert_not_called()
+        turn = orchestrator.conversation_history[0]
+        assert turn['question_id'].startswith('python_backend:')
+        assert result['message'] == turn['content']
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_process_candidate_response_moves_to_bank_question(self, mock_ddb_update, orchestrator):
+        """Test the next bank question is served once a topic had its follow-ups"""
+        orchestrator.job_role = 'Python Backend Engineer'
+        orchestrator.experience_level = 'Fresher'
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'Warm-up', 'question_id': 'python_backend:0'},
+            {'role': 'candidate', 'content': 'Answer'},
+            {'role': 'interviewer', 'content': 'Follow-up 1'},
+            {'role': 'candidate', 'content': 'Answer'},
+            {'role': 'interviewer', 'content': 'Follow-up 2'}
+        ]
+        
+        with patch.object(orchestrator, 'invoke') as mock_invoke, \
+                patch.object(orchestrator, 'speculate'):
+            orchestrator.process_candidate_response('Answer')
+        
+        mock_invoke.assert_not_called()
+        question_id = orchestrator.conversation_history[-1]['question_id']
+        assert question_id.startswith('python_backend:') and question_id != 'python_backend:0'
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_follow_up_grounded_by_retrieval(self, mock_ddb_update, orchestrator):
+        """Test retrieved reference Q&As replace the role document in follow-up calls"""
+        orchestrator.job_role = 'DevOps Engineer'
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'How do you secure a cluster?'}
+        ]
+        
+        with patch.object(orchestrator, 'retrieval_grounding', return_value='1. Q: RBAC?\n   Expected: Yes.'), \
+                patch.object(orchestrator, 'invoke', return_value=('Next?', 'model')) as mock_invoke, \
+                patch.object(orchestrator, 'speculate'):
+            orchestrator.process_candidate_response('Network policies and RBAC')
+        
+        _, system_prompt, user_message, _ = mock_invoke.call_args[0]
+        assert system_prompt == PROMPT_REGISTRY.get_system_prompt('interviewer')
+        assert system_prompt != orchestrator.generate_interviewer_prompt()
+        assert '1. Q: RBAC?' in user_message
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_repeated_question_replaced_from_bank(self, mock_ddb_update, orchestrator):
+        """Test a generated near-repeat is swapped for a bank question without another call"""
+        pytest.importorskip('numpy')
+        orchestrator.job_role = 'DevOps Engineer'
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'How would you design a CI/CD pipeline for microservices?'}
+        ]
+        
+        with patch.object(orchestrator, 'retrieval_grounding', return_value=''), \
+                patch.object(orchestrator, 'invoke', return_value=(
+                    'Thanks. Can you walk me through designing a CI/CD pipeline for microservices?', 'model'
+                )) as mock_invoke, \
+                patch.object(orchestrator, 'speculate'):
+            result = orchestrator.process_candidate_response('I would use GitHub Actions')
+        
+        assert mock_invoke.call_count == 1
+        assert orchestrator.conversation_history[-1]['question_id'].startswith('devops:')
+        assert 'CI/CD pipeline for microservices' not in result['message']
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_process_candidate_response_uses_speculation(self, mock_ddb_update, orchestrator, monkeypatch):
+        """Test a prepared follow-up matching the answer skips the follow_up call"""
+        monkeypatch.setenv('SPECULATIVE_FOLLOW_UPS', 'true')
+        orchestrator.job_role = 'Software Engineer'
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'How would you cache hot reads?'}
+        ]
+        store = SpeculationStore()
+        store.put(orchestrator.interview_id, 'How would you cache hot reads?', [
+            {'pattern': 'weak', 'keywords': [], 'question': 'No problem. What is a cache?'}
+        ], 'haiku')
+        deltas = []
+        
+        with patch('orchestrator.SPECULATION_STORE', store), \
+                patch.object(orchestrator, 'invoke') as mock_invoke, \
+                patch.object(orchestrator, 'speculate'):
+            result = orchestrator.process_candidate_response("I'm not sure", deltas.append)
+        
+        mock_invoke.assert_not_called()
+        assert result['message'] == 'No problem. What is a cache?'
+        assert deltas == ['No problem. What is a cache?']
+        assert orchestrator.conversation_history[-1]['speculative'] is True
+    
+    def test_speculation_only_for_streamed_replies(self, orchestrator, monkeypatch):
+        """Test an HTTP turn starts no speculation that Lambda would freeze after returning"""
+        monkeypatch.setenv('SPECULATIVE_FOLLOW_UPS', 'true')
+        orchestrator.conversation_history = [{'role': 'interviewer', 'content': 'How would you cache hot reads?'}]
+        
+        with patch.object(orchestrator, 'invoke', return_value=('How do you invalidate it?', 'model')), \
+                patch.object(orchestrator, '_update_session'), \
+                patch('orchestrator.BACKGROUND_EXECUTOR') as mock_executor:
+            orchestrator.process_candidate_response('Read-through cache with a TTL.')
+            assert orchestrator.speculation is None
+            
+            orchestrator.process_candidate_response('Delete on write.', lambda delta: None)
+        
+        assert orchestrator.speculation is not None
+        submitted = [c.args[0] for c in mock_executor.submit.call_args_list]
+        assert submitted.count(orchestrator._speculate_follow_ups) == 1
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.EVALUATIONS_TABLE.put_item')
+    def test_evaluate_interview_reduces_turn_scores(self, mock_eval_put, mock_ddb_update, orchestrator, monkeypatch):
+        """Test incremental evaluation scores each answer and keeps the reduced scores"""
+        monkeypatch.setenv('INCREMENTAL_EVALUATION', 'true')
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'How would you cache hot reads?'},
+            {'role': 'candidate', 'content': 'Read-through cache with a TTL.'},
+            {'role': 'interviewer', 'content': 'How do you invalidate it?'},
+            {'role': 'candidate', 'content': 'Not sure.'}
+        ]
+        turn_reply = json.dumps({
+            'topic': 'Caching',
+            'scores': {'technical_knowledge': 8, 'communication_clarity': 6},
+            'strengths': ['Knows TTLs'], 'weaknesses': []
+        })
+        synthesis = json.dumps({'overall_score': 1, 'overall_assessment': 'Promising.'})
+        store = MagicMock()
+        store.get_all.return_value = {}
+        
+        def invoke(call_type, system_prompt, user_message, on_delta=None):
+            return (turn_reply if call_type == 'turn_evaluation' else synthesis), 'model'
+        
+        with patch('orchestrator.TURN_SCORE_STORE', store), \
+                patch.object(orchestrator, 'invoke', side_effect=invoke):
+            result = orchestrator.evaluate_interview()
+        
+        evaluation = result['evaluation']
+        assert store.put.call_count == 2
+        assert evaluation['overall_score'] == 7.0
+        assert evaluation['answers_scored'] == 2
+        assert evaluation['overall_assessment'] == 'Promising.'
+        mock_eval_put.assert_called_once()
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.EVALUATIONS_TABLE.put_item')
+    def test_evaluate_interview_map_reduce(self, mock_eval_put, mock_ddb_update, orchestrator, monkeypatch):
+        """Test a long transcript is evaluated in concurrent chunks merged by rubric weight"""
+        monkeypatch.setenv('MAP_REDUCE_EVALUATION', 'true')
+        monkeypatch.setenv('EVALUATION_CHUNK_TOKENS', '30')
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': f'Question {i}: how would you scale service {i}?'} if i % 2 == 0 else
+            {'role': 'candidate', 'content': f'Answer {i}: shard by tenant and cache hot keys close to readers.'}
+            for i in range(8)
+        ]
+        chunk_reply = json.dumps({
+            'scoreBreakdown': {'technicalKnowledge': 32, 'problemSolving': 20, 'systemDesign': 16, 'communication': 8, 'awareness': 4},
+            'scores': {'technical_knowledge': 8, 'communication_clarity': 8, 'confidence_level': 7, 'problem_solving': 8},
+            'assessment': 'Good.'
+        })
+        
+        with patch.object(orchestrator, 'invoke', return_value=(chunk_reply, 'model')) as mock_invoke:
+            result = orchestrator.evaluate_interview()
+        
+        evaluation = result['evaluation']
+        assert {c.args[0] for c in mock_invoke.call_args_list} == {'evaluation_chunk'}
+        assert mock_invoke.call_count == evaluation['chunks_evaluated'] == 4
+        assert evaluation['rubric_score'] == 80.0
+        assert evaluation['overall_score'] == 8.0
+        assert evaluation['readiness_level'] == 'Almost Ready'
+        assert 'validation_errors' not in evaluation
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.EVALUATIONS_TABLE.put_item')
+    def test_evaluate_interview_map_reduce_repairs_merge(self, mock_eval_put, mock_ddb_update, orchestrator, monkeypatch):
+        """Test a merged evaluation missing a dimension is validated and repaired"""
+        monkeypatch.setenv('MAP_REDUCE_EVALUATION', 'true')
+        monkeypatch.setenv('EVALUATION_CHUNK_TOKENS', '30')
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': f'Question {i}: how would you scale service {i}?'} if i % 2 == 0 else
+            {'role': 'candidate', 'content': f'Answer {i}: shard by tenant and cache hot keys close to readers.'}
+            for i in range(8)
+        ]
+        chunk_reply = json.dumps({'scores': {'technical_knowledge': 8, 'communication_clarity': 7}})
+        repair_reply = json.dumps({
+            'scores': {'technical_knowledge': 8, 'communication_clarity': 7, 'confidence_level': 7, 'problem_solving': 6}
+        })
+        
+        def invoke(call_type, system_prompt, user_message, on_delta=None):
+            return (repair_reply if call_type == 'evaluation_repair' else chunk_reply), 'model'
+        
+        with patch.object(orchestrator, 'invoke', side_effect=invoke) as mock_invoke:
+            result = orchestrator.evaluate_interview()
+        
+        evaluation = result['evaluation']
+        assert [c.args[0] for c in mock_invoke.call_args_list].count('evaluation_repair') == 1
+        assert evaluation['scores']['problem_solving'] == 6
+        assert evaluation['overall_score'] == 7.5
+        assert evaluation['readiness_level'] == 'Almost Ready'
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.EVALUATIONS_TABLE.put_item')
+    def test_evaluate_interview_map_reduce_falls_back(self, mock_eval_put, mock_ddb_update, orchestrator, monkeypatch):
+        """Test the single evaluator call is used when every chunk fails"""
+        monkeypatch.setenv('MAP_REDUCE_EVALUATION', 'true')
+        monkeypatch.setenv('EVALUATION_CHUNK_TOKENS', '10')
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'Question one about caching?'},
+            {'role': 'candidate', 'content': 'Answer one with a read-through cache.'},
+            {'role': 'interviewer', 'content': 'Question two about queues?'},
+            {'role': 'candidate', 'content': 'Answer two with a dead-letter queue.'}
+        ]
+        
+        def invoke(call_type, system_prompt, user_message, on_delta=None):
+            return ('not json' if call_type == 'evaluation_chunk' else '{"overall_score": 6.5}'), 'model'
+        
+        with patch.object(orchestrator, 'invoke', side_effect=invoke) as mock_invoke:
+            result = orchestrator.evaluate_interview()
+        
+        assert [c.args[0] for c in mock_invoke.call_args_list][-2:] == ['evaluation', 'evaluation_repair']
+        assert result['evaluation']['overall_score'] == 6.5
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.EVALUATIONS_TABLE.put_item')
+    def test_evaluate_interview_repairs_only_malformed_fields(self, mock_eval_put, mock_ddb_update, orchestrator, monkeypatch):
+        """Test a prose-wrapped evaluation is extracted and only its broken fields are re-prompted"""
+        monkeypatch.setenv('INCREMENTAL_EVALUATION', 'false')
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'How do you handle retries?'},
+            {'role': 'candidate', 'content': 'Exponential backoff with idempotency keys.'}
+        ]
+        evaluation = {
+            'scores': {'technical_knowledge': 8, 'communication_clarity': 7, 'confidence_level': 7, 'problem_solving': 8},
+            'strengths': ['Retries'], 'weaknesses': 'Testing', 'overall_assessment': 'Solid.'
+        }
+        replies = {
+            'evaluation': f"Here is my evaluation:\n```json\n{json.dumps(evaluation)}\n```",
+            'evaluation_repair': '{"weaknesses": ["Testing"], "improvement_areas": ["Load testing"], "strengths": []}'
+        }
+        
+        with patch.object(orchestrator, 'invoke', side_effect=lambda call_type, *args: (replies[call_type], 'model')) as mock_invoke:
+            result = orchestrator.evaluate_interview()['evaluation']
+        
+        repair_prompt = mock_invoke.call_args.args[2]
+        assert 'Fields to return: improvement_areas, weaknesses' in repair_prompt
+        assert result['overall_score'] == 7.5
+        assert result['readiness_level'] == 'Almost Ready'
+        assert result['weaknesses'] == ['Testing']
+        assert result['improvement_areas'] == ['Load testing']
+        assert result['strengths'] == ['Retries']
+        assert 'validation_errors' not in result
+    
+    @patch('orchestrator.EVALUATIONS_TABLE.update_item')
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.EVALUATIONS_TABLE.put_item')
+    def test_parallel_coaching_reconciles_draft(self, mock_eval_put, mock_ddb_update, mock_eval_update, orchestrator, monkeypatch):
+        """Test coaching is drafted alongside the evaluation and finished by a short reconciliation"""
+        monkeypatch.setenv('PARALLEL_COACHING', 'true')
+        monkeypatch.setenv('INCREMENTAL_EVALUATION', 'false')
+        orchestrator.conversation_history = [
+            {'role': 'interviewer', 'content': 'How do you handle retries?'},
+            {'role': 'candidate', 'content': 'Exponential backoff with idempotency keys.'}
+        ]
+        replies = {
+            'evaluation': json.dumps({
+                'scores': {'technical_knowledge': 8, 'communication_clarity': 7.5, 'confidence_level': 7, 'problem_solving': 7.5},
+                'overall_score': 7.5, 'readiness_level': 'Almost Ready', 'strengths': ['Retries'],
+                'weaknesses': ['Testing'], 'improvement_areas': ['Testing'], 'overall_assessment': 'Solid.'
+            }),
+            'coaching_draft': '💪 WHAT YOU DID WELL\n- Retries\n⚠️ AREAS TO IMPROVE\n- Trade-offs',
+            'coaching_reconcile': '📊 PERFORMANCE SUMMARY\n- Solid\n🏆 FINAL READINESS VERDICT\nAlmost Ready'
+        }
+        deltas = []
+        stored = threading.Event()
+        mock_eval_put.side_effect = lambda **kwargs: stored.set()
+        
+        def invoke(call_type, *args):
+            if call_type == 'coaching_draft':
+                assert stored.wait(2)  # the evaluation is written without waiting for the draft
+            return replies[call_type], 'model'
+        
+        with patch.object(orchestrator, 'invoke', side_effect=invoke) as mock_invoke:
+            evaluation = orchestrator.evaluate_interview()['evaluation']
+            result = orchestrator.generate_coaching_feedback(evaluation, deltas.append)
+        
+        assert sorted(c.args[0] for c in mock_invoke.call_args_list) == ['coaching_draft', 'coaching_reconcile', 'evaluation']
+        assert 'coaching_draft' not in mock_eval_put.call_args.kwargs['Item']
+        draft_writes = [c for c in mock_eval_update.call_args_list if 'coaching_draft' in c.kwargs['UpdateExpression']]
+        assert len(draft_writes) == 1
+        assert '- Trade-offs' in mock_invoke.call_args.args[2]
+        feedback = result['coaching_feedback']
+        assert feedback.startswith('📊 PERFORMANCE SUMMARY')
+        assert feedback.endswith('Almost Ready')
+        assert '- Retries' in feedback
+        assert deltas == [feedback]
+    
+    def test_summary_fold_does_not_block_turn(self, orchestrator):
+        """Test a running summary fold is stored with a later turn instead of awaited"""
+        release = threading.Event()
+        orchestrator.context.token_budget = 60
+        orchestrator.conversation_history = [
+            {'role': 'interviewer' if i % 2 == 0 else 'candidate', 'content': f"turn {i} " + 'word ' * 30}
+            for i in range(6)
+        ]
+        
+        def slow_summary(previous, text):
+            release.wait(5)
+            return 'folded'
+        
+        with patch.object(orchestrator, 'invoke', return_value=('Next question?', 'model')), \
+                patch.object(orchestrator, '_summarize_context', side_effect=slow_summary), \
+                patch.object(orchestrator, '_update_session') as mock_update:
+            orchestrator.process_candidate_response('First answer')
+            assert mock_update.call_args.args[2][':summary'] == ''
+            assert not orchestrator.summary_update.done()
+            
+            release.set()
+            orchestrator.summary_update.result()
+            orchestrator.process_candidate_response('Second answer')
+        
+        values = mock_update.call_args.args[2]
+        assert values[':summary'] == 'folded'
+        assert values[':summarized'] > 0
+    
+    def test_stale_session_write_starts_no_background_work(self, orchestrator, monkeypatch):
+        """Test an answer whose session write lost a race is neither scored nor speculated on"""
+        monkeypatch.setenv('INCREMENTAL_EVALUATION', 'true')
+        orchestrator.conversation_history = [{'role': 'interviewer', 'content': 'How would you cache hot reads?'}]
+        
+        with patch.object(orchestrator, 'invoke', return_value=('How do you invalidate it?', 'model')), \
+                patch.object(orchestrator, '_update_session', side_effect=StaleSessionError(orchestrator.interview_id, 0)), \
+                patch.object(orchestrator, 'speculate') as mock_speculate, \
+                patch('orchestrator.BACKGROUND_EXECUTOR') as mock_executor:
+            with pytest.raises(StaleSessionError):
+                orchestrator.process_candidate_response('Read-through cache with a TTL.')
+        
+        assert orchestrator.turn_evaluations == {}
+        mock_speculate.assert_not_called()
+        assert all(c.args[0] != orchestrator._score_turn for c in mock_executor.submit.call_args_list)
+    
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    def test_adaptive_stopping_closes_converged_interview(self, mock_ddb_update, orchestrator, monkeypatch):
+        """Test consistent per-turn scores close the interview without another model call"""
+        monkeypatch.setenv('ADAPTIVE_STOPPING', 'true')
+        monkeypatch.setenv('ADAPTIVE_MIN_QUESTIONS', '5')
+        orchestrator.conversation_history = []
+        for index in range(5):
+            orchestrator.conversation_history += [
+                {'role': 'interviewer', 'content': f'Question {index}?'},
+                {'role': 'candidate', 'content': f'Answer {index}.'}
+            ]
+        orchestrator.conversation_history.append({'role': 'interviewer', 'content': 'Question 5?'})
+        for seq in (1, 3, 5, 7, 9):
+            future = Future()
+            future.set_result({'turn_seq': seq, 'scores': {
+                'technical_knowledge': 7, 'communication_clarity': 7, 'confidence_level': 7, 'problem_solving': 7
+            }})
+            orchestrator.turn_evaluations[seq] = future
+        deltas = []
+        
+        with patch.object(orchestrator, 'invoke') as mock_invoke, \
+                patch.object(orchestrator, 'speculate') as mock_speculate:
+            result = orchestrator.process_candidate_response('Answer 5.', deltas.append)
+        
+        mock_invoke.assert_not_called()
+        mock_speculate.assert_not_called()
+        assert result['interview_complete'] is True
+        assert result['length_decision']['reason'] == 'converged'
+        assert result['message'] == CLOSING_MESSAGE
+        assert deltas == [CLOSING_MESSAGE]
+        assert orchestrator.conversation_history[-1]['closing'] is True
+
 
 class TestLambdaHandler:
     """Test AWS Lambda handler"""
@@ -168,7 +747,8 @@ class TestLambdaHandler:
         assert body['status'] == 'started'
     
     @patch.object(InterviewOrchestrator, 'end_interview')
-    def test_lambda_end_interview(self, mock_end):
+    @patch('orchestrator.INTERVIEWS_TABLE.get_item', return_value={})
+    def test_lambda_end_interview(self, mock_session_get, mock_end):
         """Test Lambda handler for ending interview"""
         
         mock_end.return_value = {
@@ -185,6 +765,79 @@ class TestLambdaHandler:
         
         assert response['statusCode'] == 200
     
+    @patch('orchestrator.bedrock_client.invoke_model')
+    @patch('orchestrator.INTERVIEWS_TABLE.update_item')
+    @patch('orchestrator.INTERVIEWS_TABLE.get_item')
+    def test_lambda_warm_session_skips_read(self, mock_session_get, mock_session_update, mock_bedrock):
+        """Test send_response rehydrates once, then serves warm turns after a version probe"""
+        
+        session_item = {
+            'interview_id': 'warm-id',
+            'job_role': 'Software Engineer',
+            'experience_level': '3+ years',
+            'phase': 'init',
+            'version': 0,
+            'conversation_history': [{'role': 'interviewer', 'content': 'Hello!'}]
+        }
+        mock_session_get.side_effect = lambda **kwargs: {'Item': session_item}
+        
+        def update_item(**kwargs):
+            session_item['version'] += 1
+        mock_session_update.side_effect = update_item
+        mock_bedrock.side_effect = lambda **kwargs: {
+            'body': MagicMock(read=lambda: json.dumps({
+                'content': [{'text': 'Next question?'}]
+            }).encode())
+        }
+        
+        event = {'action': 'send_response', 'interview_id': 'warm-id', 'candidate_answer': 'Answer'}
+        first = lambda_handler(event, None)
+        second = lambda_handler(event, None)
+        rehydrations = [c for c in mock_session_get.call_args_list if 'ProjectionExpression' not in c.kwargs]
+        
+        assert first['statusCode'] == 200
+        assert second['statusCode'] == 200
+        assert len(rehydrations) == 1
+        assert SESSION_STORE.get('warm-id').version == 2
+        assert len(SESSION_STORE.get('warm-id').conversation_history) == 5
+        SESSION_STORE.evict('warm-id')
+    
+    def test_stale_replay_does_not_stream_again(self):
+        """Test a replay after StaleSessionError does not resend deltas the client already has"""
+        received = []
+        attempts = []
+        
+        def dispatch(orchestrator, action, event, on_delta=None, connection=None):
+            attempts.append(on_delta)
+            if len(attempts) == 1:
+                on_delta('First try')
+                raise StaleSessionError(orchestrator.interview_id, 0)
+            return {'message': 'Replayed question?'}
+        
+        with patch('orchestrator.load_orchestrator', side_effect=lambda i: InterviewOrchestrator()), \
+                patch('orchestrator.dispatch_action', side_effect=dispatch):
+            result = handle_action({'action': 'get_report', 'interview_id': 'stale-id'}, received.append)
+        
+        assert result == {'message': 'Replayed question?'}
+        assert received == ['First try']
+        assert attempts[1] is None
+    
+    def test_http_request_joins_turn_scoring(self):
+        """Test a non-streamed request waits for its background work before returning"""
+        orchestrator = InterviewOrchestrator()
+        scoring = Future()
+        orchestrator.turn_evaluations[1] = scoring
+        
+        def dispatch(orchestrator, action, event, on_delta=None, connection=None):
+            threading.Timer(0.05, scoring.set_result, [{'turn_seq': 1}]).start()
+            return {'message': 'Next question?'}
+        
+        with patch('orchestrator.load_orchestrator', return_value=orchestrator), \
+                patch('orchestrator.dispatch_action', side_effect=dispatch):
+            handle_action({'action': 'send_response', 'interview_id': orchestrator.interview_id})
+        
+        assert scoring.done()
+    
     def test_lambda_unknown_action(self):
         """Test Lambda handler with unknown action"""
         
@@ -197,6 +850,99 @@ class TestLambdaHandler:
         assert response['statusCode'] == 200  # Lambda still returns 200
         body = json.loads(response['body'])
         assert 'error' in body
+    
+    def test_lambda_replays_idempotent_retry(self):
+        """Test a retried action with the same idempotency key replays the stored response"""
+        stored = {}
+        
+        def claim(key, fingerprint):
+            if key in stored:
+                return {'response': stored[key]}
+            return {'token': 't-1'}
+        
+        def complete(key, token, response):
+            stored[key] = response
+        
+        event = {'action': 'send_response', 'interview_id': 'i-1', 'candidate_answer': 'A', 'idempotency_key': 'k-1'}
+        with patch('orchestrator.IDEMPOTENCY_STORE') as mock_store, \
+                patch('orchestrator.handle_action', return_value={'status': 'in_progress'}) as mock_handle:
+            mock_store.claim.side_effect = claim
+            mock_store.complete.side_effect = complete
+            first = lambda_handler(dict(event), None)
+            retry = lambda_handler(dict(event), None)
+        
+        assert retry == first
+        assert mock_handle.call_count == 1
+    
+    def test_lambda_releases_key_on_failure(self):
+        """Test a failed action releases its key so a retry runs it again"""
+        event = {'action': 'evaluate', 'interview_id': 'i-1', 'idempotency_key': 'k-2'}
+        with patch('orchestrator.IDEMPOTENCY_STORE') as mock_store, \
+                patch('orchestrator.handle_action', side_effect=RuntimeError('throttled')):
+            mock_store.claim.return_value = {'token': 't-2'}
+            response = lambda_handler(event, None)
+        
+        assert response['statusCode'] == 500
+        mock_store.release.assert_called_once_with('k-2', 't-2')
+        mock_store.complete.assert_not_called()
+    
+    def test_job_worker_evaluates_then_queues_coaching(self):
+        """Test a finished evaluation job queues coaching, then marks itself done"""
+        orchestrator = InterviewOrchestrator()
+        orchestrator.job_role = 'Software Engineer'
+        SESSION_STORE.put(orchestrator)
+        job = new_job('evaluate', orchestrator.interview_id)
+        
+        with patch('orchestrator.POST_INTERVIEW_QUEUE') as mock_queue, \
+                patch('orchestrator.INTERVIEWS_TABLE.get_item', return_value={'Item': {'version': 0}}), \
+                patch('orchestrator.POST_INTERVIEW_STATUS') as mock_status, \
+                patch.object(InterviewOrchestrator, 'evaluate_interview') as mock_evaluate:
+            mock_status.get.return_value = {'evaluate': {'status': 'queued'}, 'coach': {'status': None}}
+            response = job_worker_handler({'Records': [{'messageId': 'm-1', 'body': json.dumps(job)}]}, None)
+        
+        assert response == {'batchItemFailures': []}
+        mock_evaluate.assert_called_once()
+        assert [c.args[1:3] for c in mock_status.mark.call_args_list] == [
+            ('evaluate', 'running'), ('coach', 'queued'), ('evaluate', 'done')
+        ]
+        assert mock_queue.enqueue.call_args.args[0]['kind'] == 'coach'
+    
+    def test_job_worker_retries_evaluation_when_coaching_not_queued(self):
+        """Test a failed coach enqueue leaves the evaluation job unfinished for redelivery"""
+        orchestrator = InterviewOrchestrator()
+        orchestrator.job_role = 'Software Engineer'
+        SESSION_STORE.put(orchestrator)
+        job = new_job('evaluate', orchestrator.interview_id)
+        
+        with patch('orchestrator.POST_INTERVIEW_QUEUE') as mock_queue, \
+                patch('orchestrator.INTERVIEWS_TABLE.get_item', return_value={'Item': {'version': 0}}), \
+                patch('orchestrator.POST_INTERVIEW_STATUS') as mock_status, \
+                patch.object(InterviewOrchestrator, 'evaluate_interview'):
+            mock_status.get.return_value = {'evaluate': {'status': 'queued'}, 'coach': {'status': None}}
+            mock_queue.enqueue.side_effect = RuntimeError('queue unavailable')
+            response = job_worker_handler({'Records': [{'messageId': 'm-1', 'body': json.dumps(job)}]}, None)
+        
+        assert response == {'batchItemFailures': [{'itemIdentifier': 'm-1'}]}
+        assert ('evaluate', 'done') not in [c.args[1:3] for c in mock_status.mark.call_args_list]
+        assert mock_status.mark.call_args.args[1:3] == ('evaluate', 'failed')
+    
+    def test_job_worker_reports_failed_messages(self):
+        """Test a failing job is marked failed and only its message is returned for redelivery"""
+        orchestrator = InterviewOrchestrator()
+        orchestrator.job_role = 'Software Engineer'
+        SESSION_STORE.put(orchestrator)
+        job = new_job('evaluate', orchestrator.interview_id)
+        
+        with patch('orchestrator.POST_INTERVIEW_QUEUE') as mock_queue, \
+                patch('orchestrator.INTERVIEWS_TABLE.get_item', return_value={'Item': {'version': 0}}), \
+                patch('orchestrator.POST_INTERVIEW_STATUS') as mock_status, \
+                patch.object(InterviewOrchestrator, 'evaluate_interview', side_effect=RuntimeError('throttled')):
+            mock_status.get.return_value = {'evaluate': {'status': 'queued'}, 'coach': {'status': None}}
+            response = job_worker_handler({'Records': [{'messageId': 'm-1', 'body': json.dumps(job)}]}, None)
+        
+        assert response == {'batchItemFailures': [{'itemIdentifier': 'm-1'}]}
+        mock_status.mark.assert_called_with(orchestrator.interview_id, 'evaluate', 'failed', 'throttled')
+        mock_queue.enqueue.assert_not_called()
 
 
 class TestIntegration:
@@ -0,0 +1,81 @@
+"""
+Test suite for the per-container Prompt Registry
+"""
+
+import pytest
+import os
+import sys
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from prompt_registry import PromptRegistry, DEFAULT_PROMPTS_ROOT
+
+
+class TestPromptRegistry:
+    """Test prompt loading, role assembly and invalidation"""
+
+    @pytest.fixture
+    def prompts_root(self, tmp_path):
+        """Create a minimal prompt tree"""
+        (tmp_path / 'sophia_interviewer_prompt.md').write_text('INTERVIEWER')
+        (tmp_path / 'sophia_evaluator_prompt.md').write_text('EVALUATOR')
+        (tmp_path / 'sophia_coach_prompt.md').write_text('COACH')
+        (tmp_path / 'role_python_backend.md').write_text('PYTHON BACKEND')
+        (tmp_path / 'role_devops.md').write_text('DEVOPS')
+        return tmp_path
+
+    def test_shipped_prompts_resolve(self):
+        """Test the default root finds the prompts that ship in src/agents"""
+        registry = PromptRegistry(root=str(DEFAULT_PROMPTS_ROOT), check_interval=0)
+
+        for agent_type in ('interviewer', 'evaluator', 'coach'):
+            assert registry.get_system_prompt(agent_type)
+        assert 'python_backend' in registry.role_keys()
+
+    def test_role_prompt_is_assembled(self, prompts_root):
+        """Test interviewer prompt is specialised by matching role fragment"""
+        registry = PromptRegistry(root=str(prompts_root), check_interval=0)
+
+        prompt = registry.get_system_prompt('interviewer', 'Senior Python Backend Engineer')
+
+        assert prompt == 'INTERVIEWER\n\nPYTHON BACKEND'
+        assert registry.get_system_prompt('interviewer', 'Product Manager') == 'INTERVIEWER'
+        assert registry.get_system_prompt('evaluator', 'DevOps Engineer') == 'EVALUATOR'
+
+    def test_files_read_once_within_interval(self, prompts_root):
+        """Test no file I/O happens on the hot path between checks"""
+        registry = PromptRegistry(root=str(prompts_root), check_interval=3600)
+        registry.get_system_prompt('coach')
+
+        (prompts_root / 'sophia_coach_prompt.md').write_text('NEW COACH')
+
+        assert registry.get_system_prompt('coach') == 'COACH'
+
+    def test_changed_file_invalidates(self, prompts_root):
+        """Test an edited prompt is picked up on the next check"""
+        registry = PromptRegistry(root=str(prompts_root), check_interval=0)
+        registry.get_system_prompt('interviewer', 'DevOps Engineer')
+
+        path = prompts_root / 'role_devops.md'
+        path.write_text('DEVOPS v2')
+        os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 10))
+
+        assert registry.get_system_prompt('interviewer', 'DevOps Engineer') == 'INTERVIEWER\n\nDEVOPS v2'
+
+    def test_unknown_agent_type(self, prompts_root):
+        """Test unknown agent types are rejected"""
+        registry = PromptRegistry(root=str(prompts_root), check_interval=0)
+
+        with pytest.raises(ValueError):
+            registry.get_system_prompt('recruiter')
+
+    def test_concurrent_first_load(self, prompts_root):
+        """Test threads racing the first load all see the assembled prompt"""
+        from concurrent.futures import ThreadPoolExecutor
+        registry = PromptRegistry(root=str(prompts_root), check_interval=3600)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            prompts = list(pool.map(lambda _: registry.get_system_prompt('coach'), range(32)))
+
+        assert prompts == ['COACH'] * 32
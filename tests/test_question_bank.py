@@ -0,0 +1,76 @@
+"""
+Test suite for the local question bank
+"""
+
+import pytest
+import os
+import sys
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from question_bank import QuestionBank, experience_to_level
+
+SOURCE = {
+    'python_backend': [
+        {'role': 'Python Backend Engineer', 'level': 'junior', 'trend': 'FastAPI & Modern Python',
+         'question': 'Sync vs async?', 'expected_answer': 'Async is non-blocking.'},
+        {'role': 'Python Backend Engineer', 'level': 'senior', 'trend': 'System Design & Scalability',
+         'question': 'Design a notification system.', 'expected_answer': 'Queues, retries.'},
+        {'role': 'Python Backend Engineer', 'level': 'senior', 'trend': 'Performance Optimization',
+         'question': 'Your API is slow. What do you do?', 'expected_answer': 'Profile first.'}
+    ],
+    'fullstack': [
+        {'role': 'Full Stack Engineer', 'level': 'mid', 'trend': 'Architecture',
+         'question': 'Scale a MERN app.', 'expected_answer': 'Cache, shard.'}
+    ]
+}
+
+
+class TestQuestionBank:
+    """Test role/level matching and question selection"""
+
+    @pytest.fixture
+    def bank(self):
+        """Bank over a small fixed source"""
+        return QuestionBank(SOURCE)
+
+    def test_experience_to_level(self):
+        """Test free-text experience maps to bank levels"""
+        assert experience_to_level('Fresher') == 'junior'
+        assert experience_to_level('1-3 yrs') == 'mid'
+        assert experience_to_level('3+ years') == 'senior'
+        assert experience_to_level('Senior') == 'senior'
+        assert experience_to_level(None) == 'mid'
+
+    def test_match_category(self, bank):
+        """Test job roles resolve to bank categories"""
+        assert bank.match_category('Senior Python Backend Developer') == 'python_backend'
+        assert bank.match_category('Fullstack Developer') == 'fullstack'
+        assert bank.match_category('Software Engineer') is None
+
+    def test_index_by_level_and_trend(self, bank):
+        """Test lookups by level and by trend"""
+        assert [q.question_id for q in bank.questions('python_backend', 'senior')] == ['python_backend:1', 'python_backend:2']
+        assert bank.questions('python_backend', trend='performance optimization')[0].question_id == 'python_backend:2'
+        assert bank.get('fullstack:0').expected_answer == 'Cache, shard.'
+
+    def test_pick_skips_asked_and_warms_up_easy(self, bank):
+        """Test warm-ups start easiest and asked questions are not repeated"""
+        warm_up = bank.pick('Python Backend Engineer', '3+ years', 'i-1', warm_up=True)
+        assert warm_up.level == 'junior'
+
+        asked = ['python_backend:0']
+        first = bank.pick('Python Backend Engineer', '3+ years', 'i-1', asked)
+        second = bank.pick('Python Backend Engineer', '3+ years', 'i-1', asked + [first.question_id])
+        assert {first.level, second.level} == {'senior'}
+        assert first.question_id != second.question_id
+        assert bank.pick('Python Backend Engineer', '3+ years', 'i-1', [q for q in bank._by_id]) is None
+
+    def test_default_source_is_trends_generator(self):
+        """Test the shipped bank covers every generated category"""
+        bank = QuestionBank()
+
+        assert bank.match_category('Data Scientist') == 'data_scientist'
+        assert bank.questions('devops')
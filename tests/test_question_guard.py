@@ -0,0 +1,65 @@
+"""
+Test suite for the duplicate question guard
+"""
+
+import pytest
+import os
+import sys
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+np = pytest.importorskip('numpy')
+
+from question_guard import DuplicateQuestionGuard, question_text, shingles
+
+ASKED = [
+    'Great answer. How would you design a rate limiter for a public API?',
+    'Tell me about a time you disagreed with a teammate.',
+    'What is the difference between a process and a thread?'
+]
+
+
+class TestDuplicateQuestionGuard:
+    """Test shingling, MinHash similarity and duplicate detection"""
+
+    @pytest.fixture
+    def guard(self):
+        """Guard with the default settings"""
+        return DuplicateQuestionGuard()
+
+    def test_question_text_drops_acknowledgement(self):
+        """Test only the question sentence is compared"""
+        assert question_text('Great, thanks. How do you deploy? Any tools?') == 'How do you deploy? Any tools?'
+        assert question_text('Describe your last project.') == 'Describe your last project.'
+
+    def test_shingles_ignore_phrasing(self):
+        """Test question framing and inflection do not change the shingles"""
+        assert shingles('Explain processes versus threads') == shingles('What is the difference between a process and a thread')
+
+    def test_paraphrase_is_duplicate(self, guard):
+        """Test re-phrased repeats are caught and point at the earlier question"""
+        match = guard.find_duplicate('Thanks! Can you walk me through designing a rate limiter for a public API?', ASKED)
+
+        assert match is not None and match[0] == 0
+        assert guard.find_duplicate('Explain processes versus threads.', ASKED)[0] == 2
+
+    def test_new_question_passes(self, guard):
+        """Test related but different questions are not flagged"""
+        assert guard.find_duplicate('How would you design a URL shortener?', ASKED) is None
+        assert guard.find_duplicate('How would you test a rate limiter?', ASKED) is None
+        assert guard.find_duplicate('Anything?', []) is None
+
+    def test_similarities_are_batched(self, guard):
+        """Test one score per asked question, identical text scoring 1"""
+        scores = guard.similarities(ASKED[1], ASKED)
+
+        assert scores.shape == (3,)
+        assert scores[1] == 1.0
+
+    def test_questions_without_content_words_are_not_compared(self, guard):
+        """Test two questions with no content words are not flagged as the same"""
+        assert guard.signature('Is that so?') is None
+        assert guard.find_duplicate('Is that so?', ['What about it?']) is None
+        assert guard.find_duplicate('How would you shard it?', ['And?', 'How would you shard it?'])[0] == 1
+        assert list(guard.similarities(ASKED[0], ['Could you?', ASKED[0]])) == [0.0, 1.0]
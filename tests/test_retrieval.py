@@ -0,0 +1,74 @@
+"""
+Test suite for question corpus retrieval
+"""
+
+import pytest
+import os
+import sys
+
+# Add src and src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+np = pytest.importorskip('numpy')
+
+from retrieval import HashingEmbedder, VectorIndex, QuestionIndex, corpus_documents
+
+DOCUMENTS = [
+    {'doc_id': 'd0', 'category': 'devops', 'question': 'How do you secure a Kubernetes cluster?',
+     'expected_answer': 'RBAC, network policies, pod security, secrets encryption.'},
+    {'doc_id': 'd1', 'category': 'devops', 'question': 'Design a CI/CD pipeline for microservices.',
+     'expected_answer': 'Build, test, scan, deploy per service with canary releases.'},
+    {'doc_id': 'd2', 'category': 'data_scientist', 'question': 'How do you handle imbalanced datasets?',
+     'expected_answer': 'SMOTE, class weights, precision and recall instead of accuracy.'}
+]
+
+
+class TestRetrieval:
+    """Test embedding, the memory-mapped index and top-k search"""
+
+    def test_embeddings_are_normalised_and_stable(self):
+        """Test rows are unit length float32 and identical across embedder instances"""
+        first = HashingEmbedder(dim=64).embed(['kubernetes cluster security', ''])
+        second = HashingEmbedder(dim=64).embed(['kubernetes cluster security'])
+
+        assert first.dtype == np.float32
+        assert np.isclose(np.linalg.norm(first[0]), 1.0)
+        assert not first[1].any()
+        assert np.array_equal(first[0], second[0])
+
+    def test_build_writes_memory_mapped_index(self, tmp_path):
+        """Test the index is written contiguously and mapped back read-only"""
+        index = VectorIndex.build(DOCUMENTS, HashingEmbedder(dim=64), str(tmp_path))
+
+        assert isinstance(index.vectors, np.memmap)
+        assert index.vectors.shape == (3, 64)
+        assert os.path.getsize(tmp_path / 'vectors.f32') == 3 * 64 * 4
+
+    def test_search_ranks_and_filters(self, tmp_path):
+        """Test top-k cosine ranking and the category filter"""
+        index = VectorIndex.build(DOCUMENTS, HashingEmbedder(), str(tmp_path))
+
+        results = index.search('securing kubernetes with rbac', k=2)
+        assert results[0][1]['doc_id'] == 'd0'
+        assert results[0][0] >= results[1][0]
+        assert [d['doc_id'] for _, d in index.search('kubernetes', k=3, category='data_scientist')] == ['d2']
+
+    def test_index_rebuilds_when_corpus_changes(self, tmp_path):
+        """Test a stale on-disk index is rebuilt and a current one is reused"""
+        QuestionIndex(str(tmp_path), documents=DOCUMENTS[:2]).index
+        reused = QuestionIndex(str(tmp_path), documents=DOCUMENTS[:2]).index
+        rebuilt = QuestionIndex(str(tmp_path), documents=DOCUMENTS).index
+
+        assert len(reused.documents) == 2
+        assert len(rebuilt.documents) == 3
+
+    def test_grounding_block_from_shipped_corpus(self, tmp_path):
+        """Test the trend and fine-tuning corpus grounds a role query"""
+        question_index = QuestionIndex(str(tmp_path))
+
+        block = question_index.grounding('handling imbalanced datasets', 'data_scientist')
+
+        assert len(corpus_documents()) == len(question_index.index.documents)
+        assert block.startswith('1. Q: ')
+        assert 'Expected:' in block
@@ -0,0 +1,93 @@
+"""
+Test suite for the warm interview Session Store
+"""
+
+import pytest
+import os
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from session_store import SessionStore
+
+
+def rehydrate(item):
+    """Minimal session object for store tests"""
+    return SimpleNamespace(interview_id=item['interview_id'], version=int(item.get('version', 0)))
+
+
+def full_reads(table):
+    """get_item calls that read the whole session (not just its version)"""
+    return [c for c in table.get_item.call_args_list if 'ProjectionExpression' not in c.kwargs]
+
+
+class TestSessionStore:
+    """Test LRU caching and rehydration"""
+
+    @pytest.fixture
+    def table(self):
+        """Mock interview_sessions table"""
+        table = MagicMock()
+        table.get_item.side_effect = lambda Key, ConsistentRead, **projection: {
+            'Item': {'interview_id': Key['interview_id'], 'version': 3}
+        }
+        return table
+
+    def test_miss_rehydrates_then_hits(self, table):
+        """Test the first get reads the session and later gets only probe its version"""
+        store = SessionStore(table, rehydrate, max_sessions=4)
+
+        first = store.get('a')
+        second = store.get('a')
+
+        assert first is second
+        assert first.version == 3
+        assert len(full_reads(table)) == 1
+        assert table.get_item.call_args.kwargs['ProjectionExpression'] == '#version'
+        assert (store.hits, store.misses) == (1, 1)
+
+    def test_advanced_session_is_rehydrated_on_read(self, table):
+        """Test a session another container advanced is reloaded before it is used"""
+        store = SessionStore(table, rehydrate)
+        cached = store.get('a')
+        cached.version = 2
+
+        fresh = store.get('a')
+
+        assert fresh is not cached
+        assert fresh.version == 3
+        assert len(full_reads(table)) == 2
+        assert (store.hits, store.misses, store.stale) == (0, 2, 1)
+
+    def test_unknown_session(self, table):
+        """Test missing items return None and are not cached"""
+        table.get_item.side_effect = None
+        table.get_item.return_value = {}
+        store = SessionStore(table, rehydrate)
+
+        assert store.get('missing') is None
+        assert 'missing' not in store
+
+    def test_lru_eviction(self, table):
+        """Test least recently used sessions are dropped first"""
+        store = SessionStore(table, rehydrate, max_sessions=2)
+        store.get('a')
+        store.get('b')
+        store.get('a')
+        store.get('c')
+
+        assert 'a' in store
+        assert 'c' in store
+        assert 'b' not in store
+
+    def test_evict_forces_reload(self, table):
+        """Test evicted sessions are read again"""
+        store = SessionStore(table, rehydrate)
+        store.get('a')
+        store.evict('a')
+        store.get('a')
+
+        assert len(full_reads(table)) == 2
@@ -0,0 +1,74 @@
+"""
+Test suite for speculative follow-up questions
+"""
+
+import os
+import sys
+import json
+from unittest.mock import MagicMock
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from speculation import SpeculationStore, parse_variants, classify_answer, choose_variant, question_key
+
+VARIANTS = [
+    {'pattern': 'strong', 'keywords': ['ttl', 'invalidation', 'eviction'], 'question': 'How do you avoid stampedes?'},
+    {'pattern': 'partial', 'keywords': ['ttl', 'invalidation', 'eviction'], 'question': 'How would you invalidate?'},
+    {'pattern': 'weak', 'keywords': [], 'question': 'No problem. What is a cache?'}
+]
+
+DETAILED = "I would put a read-through cache in front of the table with a short ttl, " \
+           "and publish invalidation events on writes so stale entries are dropped quickly."
+
+
+class TestSpeculation:
+    """Test variant parsing, answer matching and the TTL store"""
+
+    def test_parse_variants_tolerates_prose(self):
+        """Test the JSON array is extracted and malformed entries are dropped"""
+        text = "Here you go:\n" + json.dumps(VARIANTS + [{'pattern': 'great', 'question': 'x'}, 'junk']) + "\nDone."
+
+        variants = parse_variants(text)
+
+        assert [v['pattern'] for v in variants] == ['strong', 'partial', 'weak']
+        assert parse_variants('no json here') == []
+        assert parse_variants('[not json]') == []
+
+    def test_classify_answer(self):
+        """Test short or uncertain answers are weak and keyword coverage is strong"""
+        keywords = ['ttl', 'invalidation', 'eviction']
+
+        assert classify_answer("I'm not sure", keywords) == 'weak'
+        assert classify_answer(DETAILED, keywords) == 'strong'
+        assert classify_answer(DETAILED.replace('ttl', 'expiry').replace('invalidation', 'delete'), keywords) == 'partial'
+
+    def test_choose_variant(self):
+        """Test the variant matching the answer quality is picked"""
+        assert choose_variant(VARIANTS, DETAILED)['question'] == 'How do you avoid stampedes?'
+        assert choose_variant(VARIANTS, "no idea")['question'] == 'No problem. What is a cache?'
+        assert choose_variant(VARIANTS[:1], "no idea") is None
+
+    def test_store_expires_entries(self):
+        """Test entries are served until their TTL passes"""
+        store = SpeculationStore(ttl_seconds=900)
+        store.put('i-1', 'How would you cache hot reads?', VARIANTS, 'haiku')
+
+        assert store.get('i-1', '  how would you cache HOT reads? ')['model_id'] == 'haiku'
+        assert store.get('i-2', 'How would you cache hot reads?') is None
+
+        expired = SpeculationStore(ttl_seconds=-1)
+        expired.put('i-1', 'q', VARIANTS, 'haiku')
+        assert expired.get('i-1', 'q') is None
+
+    def test_store_reads_through_to_table(self):
+        """Test another container's entries are read from DynamoDB"""
+        writer_table = MagicMock()
+        SpeculationStore(table=writer_table).put('i-1', 'q', VARIANTS, 'haiku')
+        item = writer_table.put_item.call_args.kwargs['Item']
+        assert item['question_key'] == question_key('q')
+
+        reader_table = MagicMock()
+        reader_table.get_item.return_value = {'Item': item}
+
+        assert SpeculationStore(table=reader_table).get('i-1', 'q')['variants'] == VARIANTS
@@ -0,0 +1,94 @@
+"""
+Test suite for the compressed / S3-offloaded Storage Codec
+"""
+
+import os
+import sys
+import io
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+# Add src to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from storage_codec import StorageCodec
+
+
+class TestStorageCodec:
+    """Test encode/decode round trips and thresholds"""
+
+    def test_small_values_pass_through(self):
+        """Test values under the threshold are stored unchanged"""
+        codec = StorageCodec(compress_threshold=1024, s3_client=MagicMock())
+
+        assert codec.encode('short feedback', 'i-1/feedback') == 'short feedback'
+        assert codec.encode({'score': 80}, 'i-1/eval') == {'score': 80}
+        assert codec.decode('short feedback') == 'short feedback'
+
+    def test_large_text_is_compressed(self):
+        """Test large text becomes a binary attribute and decodes back"""
+        codec = StorageCodec(compress_threshold=64, offload_threshold=10_000, s3_client=MagicMock())
+        text = 'CANDIDATE: I would shard the table by tenant. ' * 200
+
+        stored = codec.encode(text, 'i-1/transcript')
+
+        assert stored['__codec__'] == 'zlib'
+        assert len(stored['data']) < len(text)
+        assert codec.decode(stored) == text
+
+    def test_large_json_round_trip(self):
+        """Test JSON payloads keep their structure"""
+        codec = StorageCodec(compress_threshold=16, s3_client=MagicMock())
+        evaluation = {'score': 81, 'strengths': ['clear communication'] * 20}
+
+        assert codec.decode(codec.encode(evaluation, 'i-1/eval')) == evaluation
+
+    def test_decimal_numbers_stay_numbers(self):
+        """Test DynamoDB Decimals in a compressed payload read back as numbers, not strings"""
+        codec = StorageCodec(compress_threshold=16, s3_client=MagicMock())
+        evaluation = {'scores': {'a': Decimal('7.5')}, 'overall_score': Decimal('7.25'), 'answers_scored': Decimal('4')}
+
+        assert codec.decode(codec.encode(evaluation, 'i-1/eval')) == {
+            'scores': {'a': 7.5}, 'overall_score': 7.25, 'answers_scored': 4
+        }
+
+    def test_oversized_payload_is_offloaded(self):
+        """Test payloads above the offload threshold go to S3 behind a pointer"""
+        s3 = MagicMock()
+        codec = StorageCodec(bucket='bucket', compress_threshold=16, offload_threshold=8, s3_client=s3)
+        text = 'long coaching plan ' * 100
+
+        stored = codec.encode(text, 'i-1/coaching_feedback')
+
+        assert stored['__codec__'] == 's3+zlib'
+        assert stored['key'] == 'payloads/i-1/coaching_feedback.z'
+        body = s3.put_object.call_args.kwargs['Body']
+        s3.get_object.return_value = {'Body': io.BytesIO(body)}
+        assert codec.decode(stored) == text
+
+    def test_decode_does_not_touch_s3_for_inline_payloads(self):
+        """Test inline payloads decode without any S3 call"""
+        s3 = MagicMock()
+        codec = StorageCodec(compress_threshold=16, s3_client=s3)
+
+        codec.decode(codec.encode('x' * 100, 'i-1/t'))
+
+        s3.get_object.assert_not_called()
+
+    def test_summary_and_delete_leave_payload_unread(self):
+        """Test list-view summaries and deletes never download or decompress a payload"""
+        s3 = MagicMock()
+        codec = StorageCodec(bucket='bucket', compress_threshold=16, offload_threshold=8, s3_client=s3)
+        stored = codec.encode('long transcript ' * 100, 'i-1/history_transcript')
+
+        assert codec.summary(stored) == {'encoded': 's3+zlib', 'kind': 'text', 'size': 1600}
+        assert codec.summary('short') == 'short'
+        codec.delete(stored)
+        codec.delete('short')
+
+        s3.get_object.assert_not_called()
+        s3.delete_object.assert_called_once_with(Bucket='bucket', Key='payloads/i-1/history_transcript.z')
+
+    def test_three_payloads_fit_one_item(self):
+        """Test the default offload threshold keeps three inline payloads under DynamoDB's 400KB item cap"""
+        assert 3 * StorageCodec().offload_threshold < 400 * 1024
@@ -0,0 +1,55 @@
+"""
+Test suite for the incremental interview Transcript
+"""
+
+import os
+import sys
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from transcript import Transcript
+
+
+class TestTranscript:
+    """Test rendering, windows and caching"""
+
+    def test_render_matches_joined_history(self):
+        """Test rendered text matches the original join format"""
+        transcript = Transcript()
+        transcript.append('interviewer', 'Question 1')
+        transcript.append('candidate', 'Answer 1')
+
+        assert transcript.render() == "INTERVIEWER: Question 1\nCANDIDATE: Answer 1"
+        assert transcript.questions_asked == 1
+
+    def test_window_returns_last_turns(self):
+        """Test windowed view only includes the most recent turns"""
+        transcript = Transcript()
+        for i in range(5):
+            transcript.append('candidate', f'Answer {i}')
+
+        assert transcript.window(2) == "CANDIDATE: Answer 3\nCANDIDATE: Answer 4"
+
+    def test_render_is_cached_until_append(self):
+        """Test repeated renders return the same cached string"""
+        transcript = Transcript()
+        transcript.append('interviewer', 'Q')
+
+        first = transcript.render()
+        assert transcript.render() is first
+
+        transcript.append('candidate', 'A')
+        assert transcript.render() is not first
+        assert transcript.render().endswith('CANDIDATE: A')
+
+    def test_direct_list_appends_are_picked_up(self):
+        """Test turns appended to the shared list are rendered lazily"""
+        turns = [{'role': 'interviewer', 'content': 'Q'}]
+        transcript = Transcript(turns)
+        transcript.render()
+
+        turns.append({'role': 'interviewer', 'content': 'Q2'})
+
+        assert transcript.render() == "INTERVIEWER: Q\nINTERVIEWER: Q2"
+        assert transcript.questions_asked == 2
@@ -0,0 +1,70 @@
+"""
+Test suite for the turn-per-item Transcript Store
+"""
+
+import pytest
+import os
+import sys
+from unittest.mock import MagicMock
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from transcript_store import TranscriptStore
+
+
+class TestTranscriptStore:
+    """Test turn writes and paginated reads"""
+
+    @pytest.fixture
+    def table(self):
+        """Mock interview_transcript_turns table holding five turns"""
+        table = MagicMock()
+        items = [
+            {'interview_id': 'i-1', 'turn_seq': seq, 'role': 'candidate', 'content': f'turn {seq}'}
+            for seq in range(5)
+        ]
+
+        def query(KeyConditionExpression, Limit):
+            start = KeyConditionExpression.get_expression()['values'][1].get_expression()['values'][1]
+            page = [item for item in items if item['turn_seq'] >= start][:Limit]
+            response = {'Items': page}
+            if page and page[-1]['turn_seq'] < items[-1]['turn_seq']:
+                response['LastEvaluatedKey'] = {'interview_id': 'i-1', 'turn_seq': page[-1]['turn_seq']}
+            return response
+
+        table.query.side_effect = query
+        return table
+
+    def test_write_turns_assigns_sequence(self, table):
+        """Test each turn becomes its own item with an increasing turn_seq"""
+        store = TranscriptStore(table)
+        batch = table.batch_writer.return_value.__enter__.return_value
+
+        written = store.write_turns('i-1', [
+            {'role': 'interviewer', 'content': 'Q'},
+            {'role': 'candidate', 'content': 'A'}
+        ], start_seq=4)
+
+        assert written == 2
+        items = [c.kwargs['Item'] for c in batch.put_item.call_args_list]
+        assert [item['turn_seq'] for item in items] == [4, 5]
+        assert items[1]['content'] == 'A'
+
+    def test_get_page_returns_continuation(self, table):
+        """Test a page reports where the next page starts"""
+        store = TranscriptStore(table)
+
+        turns, next_seq = store.get_page('i-1', start_seq=0, page_size=2)
+
+        assert [t['turn_seq'] for t in turns] == [0, 1]
+        assert next_seq == 2
+
+    def test_iter_turns_pages_through_everything(self, table):
+        """Test streaming reads walk all pages in order"""
+        store = TranscriptStore(table)
+
+        turns = list(store.iter_turns('i-1', start_seq=1, page_size=2))
+
+        assert [t['content'] for t in turns] == ['turn 1', 'turn 2', 'turn 3', 'turn 4']
+        assert table.query.call_count == 2
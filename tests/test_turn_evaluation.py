@@ -0,0 +1,117 @@
+"""
+Test suite for incremental per-turn evaluation
+"""
+
+import pytest
+import os
+import sys
+import json
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+# Add src/lambda to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src', 'lambda'))
+
+from turn_evaluation import (
+    TurnScoreStore, parse_turn_score, reduce_turn_scores, answered_questions, readiness_level
+)
+
+
+def turn(seq, topic, scores, strengths=(), weaknesses=()):
+    """Per-turn score as stored by the orchestrator"""
+    return {
+        'turn_seq': seq,
+        'question': f"Question {seq}?",
+        'topic': topic,
+        'scores': scores,
+        'strengths': list(strengths),
+        'weaknesses': list(weaknesses)
+    }
+
+
+class TestTurnEvaluation:
+    """Test per-turn score parsing, reduction and storage"""
+
+    def test_parse_turn_score_tolerates_prose(self):
+        """Test the JSON object is extracted and scores are clamped to 0-10"""
+        text = "Score:\n" + json.dumps({
+            'topic': ' Caching ',
+            'scores': {'technical_knowledge': 12, 'communication_clarity': '7', 'confidence_level': None},
+            'strengths': ['Knows TTLs'],
+            'weaknesses': []
+        }) + "\nThanks."
+
+        parsed = parse_turn_score(text)
+
+        assert parsed['topic'] == 'Caching'
+        assert parsed['scores'] == {'technical_knowledge': 10.0, 'communication_clarity': 7.0}
+        assert parsed['strengths'] == ['Knows TTLs']
+        assert parse_turn_score('no json') is None
+        assert parse_turn_score('{"scores": {}}') is None
+
+    def test_readiness_level(self):
+        """Test readiness bands follow the evaluator calculation rules"""
+        assert readiness_level(9.2) == 'Ready'
+        assert readiness_level(7.5) == 'Almost Ready'
+        assert readiness_level(6.4) == 'Needs Improvement'
+        assert readiness_level(3.0) == 'Not Ready Yet'
+
+    def test_reduce_turn_scores(self):
+        """Test dimension averages, overall score, topics and ranked notes"""
+        reduced = reduce_turn_scores([
+            turn(3, 'SQL', {'technical_knowledge': 4, 'problem_solving': 5}, weaknesses=['Vague']),
+            turn(1, 'Caching', {'technical_knowledge': 8, 'problem_solving': 9}, ['Clear'], ['Vague'])
+        ])
+
+        assert reduced['scores'] == {'technical_knowledge': 6.0, 'problem_solving': 7.0}
+        assert reduced['overall_score'] == 6.5
+        assert reduced['readiness_level'] == 'Needs Improvement'
+        assert reduced['technical_depth'] == {'topics_strong': ['Caching'], 'topics_weak': ['SQL']}
+        assert [q['turn_seq'] for q in reduced['question_scores']] == [1, 3]
+        assert reduced['weaknesses'] == ['Vague']
+        assert reduced['answers_scored'] == 2
+
+    def test_reduce_no_scores(self):
+        """Test an interview with no scored answers reduces to zero"""
+        reduced = reduce_turn_scores([])
+
+        assert reduced['overall_score'] == 0.0
+        assert reduced['readiness_level'] == 'Not Ready Yet'
+
+    def test_answered_questions(self):
+        """Test only candidate turns that answer an interviewer turn are paired"""
+        turns = [
+            {'role': 'interviewer', 'content': 'Hi, tell me about caching?', 'question_id': 'backend:0'},
+            {'role': 'candidate', 'content': 'Read-through with TTL.'},
+            {'role': 'candidate', 'content': 'Also write-behind.'},
+            {'role': 'interviewer', 'content': 'Why?'},
+            {'role': 'candidate', 'content': 'Latency.'}
+        ]
+
+        pairs = answered_questions(turns)
+
+        assert [p['turn_seq'] for p in pairs] == [1, 4]
+        assert pairs[0]['question_id'] == 'backend:0'
+        assert pairs[1]['question'] == 'Why?'
+
+    def test_store_round_trip(self):
+        """Test scores are written as Decimal and read back as float across pages"""
+        table = MagicMock()
+        store = TurnScoreStore(table)
+        store.put('i-1', turn(1, 'Caching', {'technical_knowledge': 7.5}), 'sonnet')
+
+        item = table.put_item.call_args.kwargs['Item']
+        assert item['scores'] == {'technical_knowledge': Decimal('7.5')}
+        assert item['model_id'] == 'sonnet'
+
+        pytest.importorskip('boto3')
+        table.query.side_effect = [
+            {'Items': [dict(item, turn_seq=Decimal(1))], 'LastEvaluatedKey': {'turn_seq': 1}},
+            {'Items': [dict(item, turn_seq=Decimal(3))]}
+        ]
+
+        stored = store.get_all('i-1')
+
+        assert sorted(stored) == [1, 3]
+        assert stored[3]['scores'] == {'technical_knowledge': 7.5}
+        assert table.query.call_args.kwargs['ExclusiveStartKey'] == {'turn_seq': 1}